@@ -14,6 +14,8 @@ class Config:
     # URLs
     BASE_URL = os.getenv('BASE_URL', 'http://localhost:5173')
     API_URL = os.getenv('API_URL', 'http://localhost:3000')
+    API_TIMEOUT = int(os.getenv('API_TIMEOUT', '10'))
+    SEED_WORKERS = int(os.getenv('SEED_WORKERS', '16'))
 
     # Credenciales de prueba
     TEST_USER_EMAIL = os.getenv('TEST_USER_EMAIL', 'test@example.com')
@@ -22,22 +24,125 @@ class Config:
     TEST_USER_CURRENCY = os.getenv('TEST_USER_CURRENCY', 'USD')
     TEST_USER_SALARY = float(os.getenv('TEST_USER_SALARY', '3000'))
 
+    # Semilla para datos de prueba reproducibles (vacío = aleatorio)
+    DATA_SEED = os.getenv('DATA_SEED') or None
+
+    # Un usuario por worker de xdist: 'auto' (solo con -n), 'true' o 'false'
+    PER_WORKER_USERS = os.getenv('PER_WORKER_USERS', 'auto').lower()
+
     # Selenium
     HEADLESS = os.getenv('HEADLESS', 'false').lower() == 'true'
     BROWSER = os.getenv('BROWSER', 'chrome')
     IMPLICIT_WAIT = int(os.getenv('IMPLICIT_WAIT', '10'))
+    EXPLICIT_WAITS_ONLY = os.getenv('EXPLICIT_WAITS_ONLY', 'true').lower() == 'true'
     PAGE_LOAD_TIMEOUT = int(os.getenv('PAGE_LOAD_TIMEOUT', '30'))
+    WAIT_TIMEOUT = int(os.getenv('WAIT_TIMEOUT', '10'))
+    NETWORK_IDLE_MS = int(os.getenv('NETWORK_IDLE_MS', '300'))
+    DOM_QUIET_MS = int(os.getenv('DOM_QUIET_MS', '200'))
+    ASSERT_ABSENT_MS = int(os.getenv('ASSERT_ABSENT_MS', '300'))
+    ASSERT_PRESENT_MS = int(os.getenv('ASSERT_PRESENT_MS', '5000'))
     SCREENSHOT_ON_FAILURE = os.getenv('SCREENSHOT_ON_FAILURE', 'true').lower() == 'true'
+    # Métricas de rendimiento del navegador por visita (utils/browser_metrics.py)
+    BROWSER_METRICS = os.getenv('BROWSER_METRICS', 'true').lower() == 'true'
+    # Perfil de red/CPU de Chrome (utils/device_profiles.py): '', 'fiber-desktop', '4g-mobile'...
+    BROWSER_PROFILE = os.getenv('BROWSER_PROFILE', '')
+
+    # Binarios de driver (vacío = resolver automáticamente y cachear)
+    CHROMEDRIVER_PATH = os.getenv('CHROMEDRIVER_PATH', '')
+    GECKODRIVER_PATH = os.getenv('GECKODRIVER_PATH', '')
+    DRIVER_OFFLINE = os.getenv('DRIVER_OFFLINE', 'false').lower() == 'true'
+
+    # Pool de drivers (reutilizar navegadores entre tests, por worker de xdist)
+    DRIVER_POOL = os.getenv('DRIVER_POOL', 'false').lower() == 'true'
+    DRIVER_POOL_SIZE = int(os.getenv('DRIVER_POOL_SIZE', '1'))
+    DRIVER_POOL_MAX_FAILURES = int(os.getenv('DRIVER_POOL_MAX_FAILURES', '3'))
 
     # Locust
     LOCUST_USERS = int(os.getenv('LOCUST_USERS', '50'))
     LOCUST_SPAWN_RATE = int(os.getenv('LOCUST_SPAWN_RATE', '5'))
     LOCUST_RUN_TIME = os.getenv('LOCUST_RUN_TIME', '2m')
+    # Modo distribuido: workers (0 = uno por núcleo) y puerto del master
+    LOCUST_WORKERS = int(os.getenv('LOCUST_WORKERS', '0'))
+    LOCUST_MASTER_PORT = int(os.getenv('LOCUST_MASTER_PORT', '5557'))
+    # Cliente HTTP de los usuarios: 'requests' (HttpUser) o 'fast' (FastHttpUser)
+    LOCUST_HTTP_CLIENT = os.getenv('LOCUST_HTTP_CLIENT', 'requests').lower()
+
+    # Pool de usuarios pre-registrados (evita register+login en cada on_start)
+    LOCUST_USER_POOL = os.getenv('LOCUST_USER_POOL', 'true').lower() == 'true'
+    LOCUST_USER_POOL_SIZE = int(os.getenv('LOCUST_USER_POOL_SIZE', str(LOCUST_USERS)))
+    # Peso de LifecycleUser (0 = desactivado) y máximo de gastos/metas vivos por usuario
+    # simulado (también de ids creados que recuerda el replay por cuenta y colección)
+    LOCUST_LIFECYCLE_WEIGHT = int(os.getenv('LOCUST_LIFECYCLE_WEIGHT', '1'))
+    LOCUST_LIFECYCLE_MAX_ITEMS = int(os.getenv('LOCUST_LIFECYCLE_MAX_ITEMS', '20'))
+    # Verificación de SLA al terminar la prueba (código de salida 1 si se incumple)
+    LOCUST_SLA = os.getenv('LOCUST_SLA', 'true').lower() == 'true'
+    LOCUST_SLA_FILE = os.getenv('LOCUST_SLA_FILE', '')
+    # Incluir usuarios que solo miden el coste de register + login
+    LOCUST_MEASURE_AUTH = os.getenv('LOCUST_MEASURE_AUTH', 'false').lower() == 'true'
+    # Historial de rendimiento: JSON de estadísticas (con histogramas) a escribir al terminar,
+    # aumento mínimo de p50/p95 para marcar regresión y nivel de significancia
+    LOCUST_STATS_JSON = os.getenv('LOCUST_STATS_JSON', '')
+    LOCUST_REGRESSION_THRESHOLD = float(os.getenv('LOCUST_REGRESSION_THRESHOLD', '0.10'))
+    LOCUST_SIGNIFICANCE = float(os.getenv('LOCUST_SIGNIFICANCE', '0.01'))
+    # Histogramas de latencia por endpoint (latency_histograms.py) y segundos entre volcados
+    LOCUST_HDR = os.getenv('LOCUST_HDR', 'true').lower() == 'true'
+    LOCUST_HDR_INTERVAL = int(os.getenv('LOCUST_HDR_INTERVAL', '10'))
+    # Escenario de volumen de datos (data_volume.py): gastos por cuenta y meses en que se reparten
+    LOCUST_DATA_VOLUMES = os.getenv('LOCUST_DATA_VOLUMES', '100,10000,100000')
+    LOCUST_DATA_MONTHS = int(os.getenv('LOCUST_DATA_MONTHS', '24'))
+    # Modo de carga: 'closed' (wait_time entre tareas) u 'open' (tasa de llegada constante)
+    LOCUST_LOAD_MODE = os.getenv('LOCUST_LOAD_MODE', 'closed').lower()
+    # RPS objetivo total del modo 'open', repartido según los pesos de las tareas
+    LOCUST_TARGET_RPS = float(os.getenv('LOCUST_TARGET_RPS', '50'))
+    # RPS por tarea, p. ej. 'get_expenses=200,create_expense=20' (reemplaza a LOCUST_TARGET_RPS)
+    LOCUST_TASK_RPS = os.getenv('LOCUST_TASK_RPS', '')
+    # Rampa hasta el RPS objetivo (segundos) y número de escalones (0 = lineal)
+    LOCUST_RPS_RAMP_TIME = float(os.getenv('LOCUST_RPS_RAMP_TIME', '60'))
+    LOCUST_RPS_STEPS = int(os.getenv('LOCUST_RPS_STEPS', '0'))
+    # Llegadas 'constant' (intervalo fijo) o 'poisson' (intervalos exponenciales)
+    LOCUST_ARRIVALS = os.getenv('LOCUST_ARRIVALS', 'constant').lower()
+    # Peticiones simultáneas máximas por usuario simulado en modo 'open'
+    LOCUST_MAX_IN_FLIGHT = int(os.getenv('LOCUST_MAX_IN_FLIGHT', '50'))
+    # Replay de un log de accesos (replay.py) y compresión del tiempo (10 = 10x; 0 = sin esperas)
+    LOCUST_REPLAY_FILE = os.getenv('LOCUST_REPLAY_FILE', '')
+    LOCUST_REPLAY_SPEED = float(os.getenv('LOCUST_REPLAY_SPEED', '1'))
+    # Navegadores headless simultáneos en browser_load.py (flujos de UI bajo carga)
+    LOCUST_BROWSER_USERS = int(os.getenv('LOCUST_BROWSER_USERS', '2'))
+    # p95 máximo (ms) de cada flujo de UI en browser_load.py (0 = sin límite)
+    LOCUST_UI_FLOW_P95_MS = float(os.getenv('LOCUST_UI_FLOW_P95_MS', '0'))
+    # Recursos estáticos (static_assets.py): páginas, conexiones en paralelo y
+    # presupuesto de KB transferidos en la primera visita (0 = sin límite)
+    LOCUST_STATIC_PAGES = os.getenv('LOCUST_STATIC_PAGES', '/,/login,/dashboard')
+    LOCUST_STATIC_CONNECTIONS = int(os.getenv('LOCUST_STATIC_CONNECTIONS', '6'))
+    LOCUST_BUNDLE_BUDGET_KB = float(os.getenv('LOCUST_BUNDLE_BUDGET_KB', '0'))
+    # Forma de carga: '' (la de la línea de comandos), 'step', 'spike', 'soak' o 'diurnal'
+    LOCUST_SHAPE = os.getenv('LOCUST_SHAPE', '').lower()
+    # step: LOCUST_USERS repartidos en N escalones de X segundos
+    LOCUST_STEP_COUNT = int(os.getenv('LOCUST_STEP_COUNT', '5'))
+    LOCUST_STEP_TIME = int(os.getenv('LOCUST_STEP_TIME', '60'))
+    # spike: multiplicar LOCUST_USERS por el factor a los X segundos durante Y segundos
+    LOCUST_SPIKE_FACTOR = int(os.getenv('LOCUST_SPIKE_FACTOR', '10'))
+    LOCUST_SPIKE_AT = int(os.getenv('LOCUST_SPIKE_AT', '60'))
+    LOCUST_SPIKE_DURATION = int(os.getenv('LOCUST_SPIKE_DURATION', '30'))
+    # soak: intervalo entre snapshots de estadísticas y PID del backend para medir su memoria
+    LOCUST_SNAPSHOT_INTERVAL = int(os.getenv('LOCUST_SNAPSHOT_INTERVAL', '300'))
+    LOCUST_BACKEND_PID = os.getenv('LOCUST_BACKEND_PID', '')
+    # diurnal: periodo de la curva (default: LOCUST_RUN_TIME) y usuarios en el valle
+    LOCUST_DIURNAL_PERIOD = os.getenv('LOCUST_DIURNAL_PERIOD', '')
+    LOCUST_DIURNAL_MIN_USERS = int(os.getenv('LOCUST_DIURNAL_MIN_USERS', str(max(LOCUST_USERS // 10, 1))))
 
     # Directorios
     BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
     REPORTS_DIR = os.path.join(BASE_DIR, 'reports')
     SCREENSHOTS_DIR = os.path.join(REPORTS_DIR, 'screenshots')
+    LOCUST_USER_POOL_FILE = os.getenv('LOCUST_USER_POOL_FILE') or os.path.join(REPORTS_DIR, 'user_pool.json')
+    LOCUST_BASELINE_DB = os.getenv('LOCUST_BASELINE_DB') or os.path.join(REPORTS_DIR, 'baseline.sqlite3')
+    LOCUST_HDR_FILE = os.getenv('LOCUST_HDR_FILE') or os.path.join(REPORTS_DIR, 'latency_hdr.jsonl')
+    LOCUST_DATA_VOLUME_FILE = os.getenv('LOCUST_DATA_VOLUME_FILE') or os.path.join(REPORTS_DIR, 'data_volume_accounts.json')
+    LOCUST_SNAPSHOT_FILE = os.getenv('LOCUST_SNAPSHOT_FILE') or os.path.join(REPORTS_DIR, 'soak_snapshots.jsonl')
+    LOCUST_STATIC_ASSETS_FILE = os.getenv('LOCUST_STATIC_ASSETS_FILE') or os.path.join(REPORTS_DIR, 'static_assets.json')
+    BROWSER_METRICS_FILE = os.getenv('BROWSER_METRICS_FILE') or os.path.join(REPORTS_DIR, 'browser_metrics.jsonl')
+    DRIVER_CACHE_FILE = os.getenv('DRIVER_CACHE_FILE', os.path.join(BASE_DIR, '.driver_cache.json'))
 
     @classmethod
     def ensure_directories(cls):
@@ -42,21 +42,30 @@ fi
 
 # 2. Pruebas de rendimiento
 echo -e "${BLUE}⚡ 2/2 Ejecutando pruebas de rendimiento con Locust...${NC}"
-locust -f tests/performance/locustfile.py \
+# Master + un worker por núcleo (LOCUST_WORKERS para fijar otro número)
+# LOCUST_STATS_JSON: estadísticas con histogramas para el historial de rendimiento
+LOCUST_STATS_JSON=reports/stats_${TIMESTAMP}.json python -m tests.performance.distributed \
   --host=http://localhost:3000 \
   --users 50 \
   --spawn-rate 5 \
   --run-time 1m \
-  --headless \
   --html reports/reporte_rendimiento_${TIMESTAMP}.html \
   --csv reports/stats_${TIMESTAMP} 2>&1 | grep -v "urllib3"
 
-PERFORMANCE_EXIT=$?
+# Código de salida del master (no de grep): 1 si se incumple algún SLA
+PERFORMANCE_EXIT=${PIPESTATUS[0]}
 
 if [ $PERFORMANCE_EXIT -eq 0 ]; then
-    echo -e "${GREEN}✓ Pruebas de rendimiento completadas exitosamente${NC}\n"
+    echo -e "${GREEN}✓ Pruebas de rendimiento completadas exitosamente (SLA cumplidos)${NC}\n"
 else
-    echo -e "${YELLOW}⚠ Error en pruebas de rendimiento${NC}\n"
+    echo -e "${YELLOW}⚠ Pruebas de rendimiento con SLA incumplidos o errores (revisa la salida)${NC}\n"
+fi
+
+# 3. Historial de rendimiento: guardar el run y compararlo con el commit anterior
+if [ -f "reports/stats_${TIMESTAMP}.json" ]; then
+    python -m tests.performance.baseline ingest reports/stats_${TIMESTAMP}.json --scenario locustfile
+    python -m tests.performance.baseline compare --scenario locustfile \
+        || echo -e "${YELLOW}⚠ Regresiones respecto a la línea base o sin línea base todavía${NC}\n"
 fi
 
 # Resumen
@@ -70,6 +79,7 @@ echo -e "   reports/reporte_funcional_${TIMESTAMP}.html"
 echo -e "\n⚡ ${GREEN}Pruebas de Rendimiento:${NC}"
 echo -e "   reports/reporte_rendimiento_${TIMESTAMP}.html"
 echo -e "   reports/stats_${TIMESTAMP}_stats.csv"
+echo -e "   reports/baseline.sqlite3 (historial por commit)"
 
 echo -e "\n${BLUE}Para abrir los reportes:${NC}"
 echo -e "   open reports/reporte_funcional_${TIMESTAMP}.html"
@@ -79,3 +89,6 @@ echo -e "\n${BLUE}Archivos disponibles en reports/:${NC}"
 ls -lh reports/*.html | tail -5
 
 echo -e "\n${GREEN}✅ Generación de reportes completada${NC}"
+
+# Propagar el resultado del SLA para que el pipeline pueda cortar
+exit $PERFORMANCE_EXIT
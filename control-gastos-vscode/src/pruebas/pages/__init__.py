@@ -0,0 +1,18 @@
+"""
+Page objects de la aplicación: locators y flujos de cada página
+
+Los usan las pruebas funcionales y el modo de carga con navegador
+(tests/performance/browser_load.py).
+"""
+from pages.base_page import BasePage, AppPage
+from pages.dashboard_page import DashboardPage
+from pages.auth_pages import LoginPage, RegisterPage
+from pages.expenses_page import ExpensesPage
+from pages.savings_page import SavingsPage
+from pages.settings_page import SettingsPage
+
+__all__ = [
+    'BasePage', 'AppPage',
+    'LoginPage', 'RegisterPage',
+    'DashboardPage', 'ExpensesPage', 'SavingsPage', 'SettingsPage',
+]
@@ -0,0 +1,93 @@
+"""
+Páginas públicas: login (/login) y registro (/register)
+"""
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from config.config import config
+from pages.base_page import BasePage
+from pages.dashboard_page import DashboardPage
+
+
+class LoginPage(BasePage):
+    """Formulario de inicio de sesión"""
+
+    path = '/login'
+
+    EMAIL_INPUT = (By.ID, 'email')
+    PASSWORD_INPUT = (By.ID, 'password')
+    SUBMIT_BUTTON = (By.CSS_SELECTOR, "form button[type='submit']")
+    # Mensaje de error (div con fondo rojo)
+    ERROR_MESSAGE = (By.CSS_SELECTOR, '.bg-red-50')
+    REGISTER_LINK = (By.CSS_SELECTOR, "a[href='/register']")
+    READY = EMAIL_INPUT
+
+    def login(self, email, password):
+        """Enviar el formulario (sin esperar el resultado)"""
+        self.fill([(self.EMAIL_INPUT, email), (self.PASSWORD_INPUT, password)])
+        self.click(self.SUBMIT_BUTTON)
+        return self
+
+    def login_as(self, email=None, password=None):
+        """
+        Iniciar sesión y esperar al dashboard
+
+        Args:
+            email: Email (default: config.TEST_USER_EMAIL)
+            password: Contraseña (default: config.TEST_USER_PASSWORD)
+
+        Returns:
+            DashboardPage
+        """
+        self.login(email or config.TEST_USER_EMAIL, password or config.TEST_USER_PASSWORD)
+        return DashboardPage(self.driver, self.base_url).wait_until_loaded()
+
+    def error_message(self):
+        """Esperar al mensaje de error y devolverlo"""
+        return self.element(self.ERROR_MESSAGE)
+
+    def go_to_register(self):
+        """Seguir el enlace 'Crear cuenta gratis'"""
+        self.click(self.REGISTER_LINK)
+        self.invalidate()
+        return RegisterPage(self.driver, self.base_url).wait_until_loaded()
+
+
+class RegisterPage(BasePage):
+    """Formulario de registro"""
+
+    path = '/register'
+
+    NAME_INPUT = (By.ID, 'name')
+    EMAIL_INPUT = (By.ID, 'email')
+    PASSWORD_INPUT = (By.ID, 'password')
+    CURRENCY_SELECT = (By.ID, 'currency')
+    SUBMIT_BUTTON = (By.CSS_SELECTOR, "form button[type='submit']")
+    ERROR_MESSAGE = (By.CSS_SELECTOR, '.bg-red-50')
+    READY = NAME_INPUT
+
+    def wait_until_loaded(self):
+        """Esperar al formulario tras llegar desde otra página"""
+        WebDriverWait(self.driver, config.WAIT_TIMEOUT).until(EC.url_contains(self.path))
+        self.element(self.READY)
+        return self
+
+    def register(self, name, email, password, currency=None):
+        """
+        Registrar un usuario y esperar al dashboard
+
+        Args:
+            name: Nombre
+            email: Email
+            password: Contraseña
+            currency: Moneda (default: la que preselecciona el formulario)
+
+        Returns:
+            DashboardPage
+        """
+        fields = [(self.NAME_INPUT, name), (self.EMAIL_INPUT, email), (self.PASSWORD_INPUT, password)]
+        if currency:
+            fields.append((self.CURRENCY_SELECT, currency))
+        self.fill(fields)
+        self.click(self.SUBMIT_BUTTON)
+        return DashboardPage(self.driver, self.base_url).wait_until_loaded()
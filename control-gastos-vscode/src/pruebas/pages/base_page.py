@@ -0,0 +1,219 @@
+"""
+Base de los page objects
+
+Cada page object declara sus locators como tuplas (By, selector),
+preferiblemente por ID o CSS: son las estrategias más rápidas y no
+dependen de los textos de la interfaz. Los elementos ya resueltos se
+guardan en una caché por estado de página, que se vacía al navegar
+(open, refresh o cualquier flujo que cambie de ruta o rehaga el DOM).
+"""
+from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from config.config import config
+from utils.waits import wait_for_page_ready
+
+# Rellena varios campos en una sola llamada al navegador. Usa el setter
+# nativo de 'value' y dispara input/change para que React actualice su
+# estado; entre campos cede el turno (setTimeout 0) para que React
+# procese cada cambio antes del siguiente, porque los formularios de la
+# app copian el estado anterior en cada onChange.
+FILL_JS = """
+var fields = arguments[0];
+var done = arguments[arguments.length - 1];
+var missing = [];
+
+function setValue(el, value) {
+    var proto = el instanceof HTMLSelectElement ? HTMLSelectElement.prototype
+        : el instanceof HTMLTextAreaElement ? HTMLTextAreaElement.prototype
+        : HTMLInputElement.prototype;
+    Object.getOwnPropertyDescriptor(proto, 'value').set.call(el, value);
+    el.dispatchEvent(new Event('input', {bubbles: true}));
+    el.dispatchEvent(new Event('change', {bubbles: true}));
+}
+
+function next(i) {
+    if (i >= fields.length) { done(missing); return; }
+    var el = document.querySelector(fields[i][0]);
+    if (el) { setValue(el, fields[i][1]); } else { missing.push(fields[i][0]); }
+    setTimeout(function () { next(i + 1); }, 0);
+}
+next(0);
+"""
+
+
+def css_selector(locator):
+    """
+    Selector CSS equivalente a un locator por ID o CSS
+
+    Args:
+        locator: Tupla (By.ID o By.CSS_SELECTOR, selector)
+
+    Returns:
+        String con el selector CSS
+    """
+    by, value = locator
+    if by == By.ID:
+        return f'[id="{value}"]'
+    if by == By.CSS_SELECTOR:
+        return value
+    raise ValueError(f"fill() solo acepta locators por ID o CSS: {locator}")
+
+
+class BasePage:
+    """Driver, ruta de la página, caché de elementos y relleno de formularios"""
+
+    # Ruta relativa a config.BASE_URL
+    path = '/'
+    # Elemento que indica que la página está lista (opcional)
+    READY = None
+
+    def __init__(self, driver, base_url=None):
+        """
+        Args:
+            driver: WebDriver instance
+            base_url: URL del frontend (default: config.BASE_URL)
+        """
+        self.driver = driver
+        self.base_url = (base_url or config.BASE_URL).rstrip('/')
+        self._elements = {}
+
+    @property
+    def url(self):
+        """URL completa de la página"""
+        return f"{self.base_url}{self.path}"
+
+    def invalidate(self):
+        """Olvidar los elementos resueltos (la página cambió de estado)"""
+        self._elements.clear()
+
+    def open(self):
+        """Navegar a la página y esperar a que esté lista"""
+        self.invalidate()
+        self.driver.get(self.url)
+        wait_for_page_ready(self.driver)
+        if self.READY:
+            self.element(self.READY)
+        return self
+
+    def refresh(self):
+        """Recargar la página y esperar a que esté lista"""
+        self.invalidate()
+        self.driver.refresh()
+        wait_for_page_ready(self.driver)
+        return self
+
+    def element(self, locator, timeout=None):
+        """
+        Elemento de la página, resuelto una vez por estado de página
+
+        Args:
+            locator: Tupla (By, selector)
+            timeout: Segundos de espera la primera vez (default: config.WAIT_TIMEOUT)
+
+        Returns:
+            WebElement
+        """
+        if locator not in self._elements:
+            self._elements[locator] = WebDriverWait(self.driver, timeout or config.WAIT_TIMEOUT).until(
+                EC.presence_of_element_located(locator)
+            )
+        return self._elements[locator]
+
+    def elements(self, locator):
+        """Todos los elementos que coinciden ahora mismo (sin caché ni espera)"""
+        return self.driver.find_elements(*locator)
+
+    def click(self, locator, timeout=None):
+        """
+        Pulsar un elemento cuando se pueda pulsar
+
+        Si React rehízo el nodo desde que se guardó, se vuelve a resolver.
+        """
+        try:
+            element = self._elements.get(locator)
+            if element is None or not element.is_enabled():
+                element = WebDriverWait(self.driver, timeout or config.WAIT_TIMEOUT).until(
+                    EC.element_to_be_clickable(locator)
+                )
+                self._elements[locator] = element
+            element.click()
+        except StaleElementReferenceException:
+            self._elements.pop(locator, None)
+            self.click(locator, timeout)
+
+    def fill(self, fields):
+        """
+        Rellenar varios campos (inputs y selects) en una sola ejecución de script
+
+        Args:
+            fields: Lista de tuplas (locator por ID/CSS, valor); el orden se respeta
+        """
+        fields = [(css_selector(locator), '' if value is None else str(value))
+                  for locator, value in fields]
+        missing = self.driver.execute_async_script(FILL_JS, fields)
+        if missing:
+            raise NoSuchElementException(f"Campos no encontrados: {', '.join(missing)}")
+        return self
+
+    def text_of(self, locator):
+        """Texto visible de un elemento"""
+        return self.element(locator).text
+
+
+class AppPage(BasePage):
+    """Páginas con sesión iniciada: barra lateral con navegación y cierre de sesión"""
+
+    LOGOUT_BUTTON = (By.CSS_SELECTOR, "div.border-t.border-gray-700 > button:last-child")
+    NAV = (By.CSS_SELECTOR, "nav")
+    # Solo visible por debajo del breakpoint lg (perfiles móviles de device_profiles.py)
+    MENU_BUTTON = (By.CSS_SELECTOR, "button[aria-label='Abrir menú']")
+
+    def nav_link(self, path):
+        """Locator del enlace de la barra lateral a una ruta ('/expenses'...)"""
+        return (By.CSS_SELECTOR, f"nav a[href='{path}']")
+
+    def open_sidebar(self):
+        """
+        Desplegar la barra lateral si está fuera de la pantalla
+
+        Por debajo de lg la barra está desplazada a la izquierda
+        (-translate-x-full) y se abre con el botón de menú; se espera a que
+        termine la animación para que los clics caigan en su sitio.
+        """
+        buttons = self.elements(self.MENU_BUTTON)
+        if not buttons or not buttons[0].is_displayed():
+            return
+        buttons[0].click()
+        nav = self.driver.find_element(*self.NAV)
+        WebDriverWait(self.driver, config.WAIT_TIMEOUT).until(
+            lambda d: d.execute_script(
+                "return arguments[0].parentElement.getBoundingClientRect().left", nav) >= 0
+        )
+
+    def go_to(self, page_class):
+        """
+        Navegar con la barra lateral (sin recargar la app)
+
+        Args:
+            page_class: Clase del page object destino
+
+        Returns:
+            Instancia del page object destino, ya lista
+        """
+        self.open_sidebar()
+        self.click(self.nav_link(page_class.path))
+        self.invalidate()
+        page = page_class(self.driver, self.base_url)
+        WebDriverWait(self.driver, config.WAIT_TIMEOUT).until(EC.url_contains(page_class.path))
+        wait_for_page_ready(self.driver)
+        return page
+
+    def logout(self):
+        """Cerrar sesión y esperar a volver al login"""
+        self.open_sidebar()
+        self.click(self.LOGOUT_BUTTON)
+        self.invalidate()
+        WebDriverWait(self.driver, config.WAIT_TIMEOUT).until(EC.url_contains('/login'))
+        return self
@@ -0,0 +1,29 @@
+"""
+Dashboard (/dashboard)
+"""
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from config.config import config
+from pages.base_page import AppPage
+
+
+class DashboardPage(AppPage):
+    """Resumen del mes: saludo, tarjetas de totales y gastos recientes"""
+
+    path = '/dashboard'
+
+    # "Bienvenido, <nombre>! 👋"
+    HEADING = (By.CSS_SELECTOR, 'main h1')
+    READY = HEADING
+
+    def wait_until_loaded(self):
+        """Esperar a llegar al dashboard (tras login, registro o redirección)"""
+        WebDriverWait(self.driver, config.WAIT_TIMEOUT).until(EC.url_contains(self.path))
+        self.invalidate()
+        self.element(self.READY)
+        return self
+
+    def heading(self):
+        """Texto del saludo"""
+        return self.text_of(self.HEADING)
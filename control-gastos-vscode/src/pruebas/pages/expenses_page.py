@@ -0,0 +1,133 @@
+"""
+Página de gastos (/expenses)
+"""
+from datetime import date
+from selenium.webdriver.common.by import By
+from pages.base_page import AppPage
+from utils.waits import (
+    wait_for_page_text,
+    wait_for_dom_settled,
+    wait_for_network_idle,
+    wait_for_alert,
+)
+
+
+class ExpensesPage(AppPage):
+    """Formulario de nuevo gasto, buscador, filtro por mes y lista"""
+
+    path = '/expenses'
+
+    # Botón de la cabecera ("Nuevo Gasto" / "Cancelar")
+    NEW_EXPENSE_BUTTON = (By.CSS_SELECTOR, "div.min-h-full > div:first-child > button")
+    TITLE_INPUT = (By.ID, 'title')
+    AMOUNT_INPUT = (By.ID, 'amount')
+    CATEGORY_SELECT = (By.ID, 'category')
+    DATE_INPUT = (By.ID, 'date')
+    NOTE_INPUT = (By.ID, 'note')
+    SAVE_BUTTON = (By.CSS_SELECTOR, "form button[type='submit']")
+    # CardTitle es un div; text() evita recorrer todo el texto descendiente
+    LIST_TITLE = (By.XPATH, "//div[text()='Lista de gastos']")
+    SEARCH_INPUT = (By.CSS_SELECTOR, "input[placeholder='Buscar gastos...']")
+    # Selects de mes y año junto al buscador
+    MONTH_SELECT = (By.CSS_SELECTOR, "div.flex.gap-2 > select:nth-of-type(1)")
+    YEAR_SELECT = (By.CSS_SELECTOR, "div.flex.gap-2 > select:nth-of-type(2)")
+    # Cada gasto de la lista (p-3 en móvil, sm:p-4 en escritorio)
+    EXPENSE_ROWS = (By.CSS_SELECTOR, "div.rounded-lg.border.bg-white.p-3")
+    DELETE_BUTTONS = (By.CSS_SELECTOR, "button.text-red-600")
+    READY = SEARCH_INPUT
+
+    def open_form(self):
+        """Abrir el formulario de nuevo gasto"""
+        self.click(self.NEW_EXPENSE_BUTTON)
+        self.element(self.TITLE_INPUT)
+        return self
+
+    def fill_form(self, title, amount, category='food', expense_date=None, note=''):
+        """
+        Rellenar el formulario abierto en una sola llamada al navegador
+
+        Args:
+            title: Título del gasto
+            amount: Monto
+            category: Valor de categoría ('food', 'transport'...)
+            expense_date: date o string YYYY-MM-DD (default: hoy)
+            note: Nota opcional
+        """
+        self.fill([
+            (self.TITLE_INPUT, title),
+            (self.AMOUNT_INPUT, amount),
+            (self.CATEGORY_SELECT, category),
+            (self.DATE_INPUT, expense_date or date.today()),
+            (self.NOTE_INPUT, note),
+        ])
+        return self
+
+    def submit_form(self):
+        """Pulsar 'Guardar gasto' (sin esperar el resultado)"""
+        self.click(self.SAVE_BUTTON)
+        return self
+
+    def create_expense(self, title, amount, category='food', expense_date=None, note=''):
+        """
+        Crear un gasto desde el formulario y esperar a que aparezca en la lista
+
+        Args: los de fill_form()
+        """
+        self.open_form()
+        self.fill_form(title, amount, category, expense_date, note)
+        self.submit_form()
+
+        # El formulario se cierra y la lista se recarga tras el POST
+        wait_for_page_text(self.driver, title)
+        self.invalidate()
+        return self
+
+    def list_title(self):
+        """Título de la lista de gastos (espera a que esté presente)"""
+        return self.element(self.LIST_TITLE)
+
+    def expense_rows(self):
+        """Filas de la lista de gastos visibles ahora"""
+        return self.elements(self.EXPENSE_ROWS)
+
+    def search(self, text):
+        """Escribir en el buscador; el filtrado es local"""
+        self.element(self.SEARCH_INPUT).send_keys(text)
+        wait_for_dom_settled(self.driver)
+        return self
+
+    def filter_by_month(self, month, year=None):
+        """
+        Cambiar el mes de la lista (recarga los gastos desde la API)
+
+        Args:
+            month: Mes con dos dígitos ('01'...'12')
+            year: Año (default: el que esté seleccionado)
+        """
+        fields = [(self.YEAR_SELECT, year)] if year else []
+        self.fill(fields + [(self.MONTH_SELECT, month)])
+        wait_for_network_idle(self.driver)
+        wait_for_dom_settled(self.driver)
+        return self
+
+    def delete_first_expense(self):
+        """
+        Eliminar el primer gasto de la lista y confirmar el diálogo
+
+        Returns:
+            False si no había gastos
+        """
+        buttons = self.elements(self.DELETE_BUTTONS)
+        if not buttons:
+            return False
+        buttons[0].click()
+
+        alert = wait_for_alert(self.driver)
+        if alert:
+            alert.accept()
+
+        # Esperar al DELETE y a la recarga de la lista
+        wait_for_network_idle(self.driver)
+        wait_for_dom_settled(self.driver)
+        self.invalidate()
+        return True
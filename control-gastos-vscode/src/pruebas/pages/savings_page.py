@@ -0,0 +1,60 @@
+"""
+Metas de ahorro (/savings)
+"""
+from selenium.webdriver.common.by import By
+from pages.base_page import AppPage
+from utils.waits import wait_for_page_text, wait_for_network_idle, wait_for_dom_settled
+
+
+class SavingsPage(AppPage):
+    """Formulario de metas y tarjetas con el progreso de cada una"""
+
+    path = '/savings'
+
+    # Botón de la cabecera ("Nueva Meta" / "Cancelar")
+    NEW_GOAL_BUTTON = (By.CSS_SELECTOR, "div.min-h-full > div:first-child > button")
+    NAME_INPUT = (By.ID, 'name')
+    TARGET_INPUT = (By.ID, 'target')
+    CURRENT_INPUT = (By.ID, 'current')
+    DEADLINE_INPUT = (By.ID, 'deadline')
+    SUBMIT_BUTTON = (By.CSS_SELECTOR, "form button[type='submit']")
+    # Tarjeta de cada meta (la barra de color superior es su primer hijo)
+    GOAL_CARDS = (By.CSS_SELECTOR, "div.grid > div.overflow-hidden")
+    READY = NEW_GOAL_BUTTON
+
+    def open_form(self):
+        """Abrir el formulario de nueva meta"""
+        self.click(self.NEW_GOAL_BUTTON)
+        self.element(self.NAME_INPUT)
+        return self
+
+    def create_goal(self, name, target_amount, current_amount=0, deadline=None):
+        """
+        Crear una meta y esperar a que aparezca su tarjeta
+
+        Args:
+            name: Nombre de la meta
+            target_amount: Monto objetivo
+            current_amount: Monto ahorrado
+            deadline: date o string YYYY-MM-DD (opcional)
+        """
+        self.open_form()
+        fields = [
+            (self.NAME_INPUT, name),
+            (self.TARGET_INPUT, target_amount),
+            (self.CURRENT_INPUT, current_amount),
+        ]
+        if deadline:
+            fields.append((self.DEADLINE_INPUT, deadline))
+        self.fill(fields)
+        self.click(self.SUBMIT_BUTTON)
+
+        wait_for_network_idle(self.driver)
+        wait_for_page_text(self.driver, name)
+        wait_for_dom_settled(self.driver)
+        self.invalidate()
+        return self
+
+    def goal_cards(self):
+        """Tarjetas de metas visibles ahora"""
+        return self.elements(self.GOAL_CARDS)
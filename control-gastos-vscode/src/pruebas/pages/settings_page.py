@@ -0,0 +1,58 @@
+"""
+Configuración (/settings)
+"""
+from selenium.webdriver.common.by import By
+from pages.base_page import AppPage
+from utils.waits import wait_for_network_idle
+
+
+class SettingsPage(AppPage):
+    """Sueldo mensual y cambio de contraseña"""
+
+    path = '/settings'
+
+    SALARY_INPUT = (By.ID, 'salary')
+    CURRENT_PASSWORD_INPUT = (By.ID, 'currentPassword')
+    NEW_PASSWORD_INPUT = (By.ID, 'newPassword')
+    CONFIRM_PASSWORD_INPUT = (By.ID, 'confirmPassword')
+    SUCCESS_MESSAGE = (By.CSS_SELECTOR, '.bg-green-50')
+    ERROR_MESSAGE = (By.CSS_SELECTOR, '.bg-red-50')
+    READY = SALARY_INPUT
+
+    def _submit_form_of(self, locator):
+        """Pulsar el botón de envío del formulario que contiene el campo"""
+        field = self.element(locator)
+        field.find_element(By.XPATH, "./ancestor::form//button[@type='submit']").click()
+        wait_for_network_idle(self.driver)
+        self.invalidate()
+
+    def update_salary(self, amount):
+        """Guardar el sueldo mensual"""
+        self.fill([(self.SALARY_INPUT, amount)])
+        self._submit_form_of(self.SALARY_INPUT)
+        return self
+
+    def change_password(self, current_password, new_password, confirm_password=None):
+        """
+        Enviar el formulario de cambio de contraseña
+
+        Args:
+            current_password: Contraseña actual
+            new_password: Contraseña nueva
+            confirm_password: Confirmación (default: la nueva)
+        """
+        self.fill([
+            (self.CURRENT_PASSWORD_INPUT, current_password),
+            (self.NEW_PASSWORD_INPUT, new_password),
+            (self.CONFIRM_PASSWORD_INPUT, confirm_password or new_password),
+        ])
+        self._submit_form_of(self.CURRENT_PASSWORD_INPUT)
+        return self
+
+    def success_message(self):
+        """Esperar al mensaje de éxito y devolverlo"""
+        return self.element(self.SUCCESS_MESSAGE)
+
+    def error_message(self):
+        """Esperar al mensaje de error y devolverlo"""
+        return self.element(self.ERROR_MESSAGE)
@@ -31,6 +31,7 @@ show_menu() {
     echo "4) Todas las pruebas funcionales con reporte"
     echo "5) Verificar instalación de dependencias"
     echo "6) Salir"
+    echo "7) Pruebas funcionales por perfil de dispositivo (red/CPU)"
     echo ""
 }
 
@@ -67,22 +68,20 @@ run_locust_web() {
     echo "- Tasa de generación: 5"
     echo ""
 
-    cd tests/performance
-    locust -f locustfile.py
+    locust -f tests/performance/locustfile.py
 }
 
 # Función para pruebas de rendimiento sin interfaz
 run_locust_headless() {
-    echo -e "${BLUE}Ejecutando pruebas de rendimiento (headless)...${NC}\n"
+    echo -e "${BLUE}Ejecutando pruebas de rendimiento (headless, master + un worker por núcleo)...${NC}\n"
 
-    cd tests/performance
-    locust -f locustfile.py \
-        --headless \
+    # LOCUST_WORKERS fija el número de workers (0 = uno por núcleo)
+    python -m tests.performance.distributed \
         --users 50 \
         --spawn-rate 5 \
         --host http://localhost:3000 \
         --run-time 2m \
-        --html ../../reports/performance_report.html
+        --html reports/performance_report.html
 
     echo -e "\n${GREEN}✓ Pruebas de rendimiento completadas${NC}"
     echo -e "${BLUE}Reporte generado en: reports/performance_report.html${NC}\n"
@@ -93,12 +92,32 @@ run_all_tests() {
     echo -e "${BLUE}Ejecutando TODAS las pruebas...${NC}\n"
 
     # Funcionales
-    pytest tests/functional/ -v -n 4 --html=reports/full_report.html --self-contained-html
+    pytest tests/functional/ -v -n auto --html=reports/full_report.html --self-contained-html
 
     echo -e "\n${GREEN}✓ Todas las pruebas completadas${NC}"
     echo -e "${BLUE}Reporte generado en: reports/full_report.html${NC}\n"
 }
 
+# Función para comparar perfiles de dispositivo (solo Chrome)
+run_device_profiles() {
+    # BROWSER_PROFILES cambia la lista (ver utils/device_profiles.py)
+    local profiles="${BROWSER_PROFILES:-fiber-desktop 4g-mobile 3g-mobile}"
+    # Archivo propio de esta comparación: BROWSER_METRICS_FILE solo crece
+    local metrics="reports/browser_metrics_$(date +%Y%m%d_%H%M%S).jsonl"
+    echo -e "${BLUE}Ejecutando pruebas funcionales con los perfiles: ${profiles}${NC}\n"
+
+    for profile in $profiles; do
+        echo -e "${YELLOW}Perfil: ${profile}${NC}"
+        BROWSER_PROFILE="$profile" BROWSER_METRICS_FILE="$metrics" pytest tests/functional/ -q \
+            --html="reports/functional_report_${profile}.html" --self-contained-html || true
+    done
+
+    python -m utils.browser_metrics "$metrics"
+
+    echo -e "${GREEN}✓ Pruebas por perfil completadas${NC}"
+    echo -e "${BLUE}Reportes generados en: reports/functional_report_<perfil>.html y ${metrics}${NC}\n"
+}
+
 # Bucle principal del menú
 while true; do
     show_menu
@@ -124,6 +143,9 @@ while true; do
             echo -e "${GREEN}¡Hasta luego!${NC}"
             exit 0
             ;;
+        7)
+            run_device_profiles
+            ;;
         *)
             echo -e "${RED}Opción inválida${NC}\n"
             ;;
@@ -4,31 +4,103 @@ Configuración de fixtures para pytest
 import pytest
 from datetime import datetime
 from utils.driver_factory import DriverFactory
-from utils.helpers import take_screenshot
+from utils.driver_pool import DriverPool
+from utils.helpers import take_screenshot, inject_auth_session
+from utils.api_client import get_auth_session
+from utils.data_seeding import DataSeeder
+from utils.test_users import use_worker_users, provision_worker_user, cleanup_user_data
+from utils.browser_metrics import collect_visits, write_visits, summarize_visit, html_cell
 from config.config import config
 
+# pytest_configure recibe su propio 'config'
+app_config = config
 
-@pytest.fixture(scope='function')
-def driver():
+# Fixtures que entregan un navegador, en orden de preferencia
+BROWSER_FIXTURES = ('authenticated_driver', 'driver_with_screenshot', 'driver')
+
+
+@pytest.fixture(scope='session')
+def test_user(worker_id):
     """
-    Fixture para crear y destruir driver de Selenium
-    Se ejecuta para cada test
+    Usuario de prueba de la sesión
+
+    Con pytest-xdist cada worker registra su propio usuario y lo publica en
+    config.TEST_USER_EMAIL; al final de la sesión se borran sus datos.
+    """
+    if not use_worker_users(worker_id):
+        yield {
+            'email': config.TEST_USER_EMAIL,
+            'password': config.TEST_USER_PASSWORD,
+            'name': config.TEST_USER_NAME,
+        }
+        return
+
+    user = provision_worker_user(worker_id)
+    original = (config.TEST_USER_EMAIL, config.TEST_USER_PASSWORD, config.TEST_USER_NAME)
+    config.TEST_USER_EMAIL = user['email']
+    config.TEST_USER_PASSWORD = user['password']
+    config.TEST_USER_NAME = user['name']
+
+    yield user
+
+    cleanup_user_data(user['email'], user['password'])
+    config.TEST_USER_EMAIL, config.TEST_USER_PASSWORD, config.TEST_USER_NAME = original
+
+
+@pytest.fixture(scope='session')
+def driver_pool():
+    """
+    Pool de navegadores compartido por todos los tests del worker
+    Solo se usa si DRIVER_POOL=true
     """
+    if not config.DRIVER_POOL:
+        yield None
+        return
+
+    pool = DriverPool()
+
+    yield pool
+
+    pool.close_all()
+
+
+def _acquire_driver(pool):
+    """Obtener driver del pool o crear uno nuevo"""
+    if pool is not None:
+        return pool.acquire()
+
     driver = DriverFactory.create_driver()
     driver.get(config.BASE_URL)
+    return driver
+
+
+def _release_driver(pool, driver):
+    """Devolver driver al pool o cerrarlo"""
+    if pool is not None:
+        pool.release(driver)
+    else:
+        driver.quit()
+
+
+@pytest.fixture(scope='function')
+def driver(driver_pool, test_user):
+    """
+    Fixture para crear y destruir driver de Selenium
+    Se ejecuta para cada test (reutiliza navegadores si DRIVER_POOL=true)
+    """
+    driver = _acquire_driver(driver_pool)
 
     yield driver
 
-    driver.quit()
+    _release_driver(driver_pool, driver)
 
 
 @pytest.fixture(scope='function')
-def driver_with_screenshot(request):
+def driver_with_screenshot(request, driver_pool, test_user):
     """
     Fixture que toma screenshot en caso de fallo
     """
-    driver = DriverFactory.create_driver()
-    driver.get(config.BASE_URL)
+    driver = _acquire_driver(driver_pool)
 
     yield driver
 
@@ -36,7 +108,36 @@ def driver_with_screenshot(request):
     if request.node.rep_call.failed:
         take_screenshot(driver, request.node.name)
 
-    driver.quit()
+    _release_driver(driver_pool, driver)
+
+
+@pytest.fixture(scope='session')
+def auth_session(test_user):
+    """
+    Token y usuario de prueba obtenidos vía API una sola vez por sesión
+    """
+    return get_auth_session(test_user['email'], test_user['password'])
+
+
+@pytest.fixture(scope='function')
+def authenticated_driver(driver_with_screenshot, auth_session):
+    """
+    Driver con la sesión ya iniciada (sin pasar por el formulario de login)
+    """
+    inject_auth_session(driver_with_screenshot, auth_session['token'], auth_session['user'])
+    return driver_with_screenshot
+
+
+@pytest.fixture(scope='function')
+def seeder(auth_session):
+    """
+    Crear datos de prueba vía API; se eliminan al terminar el test
+    """
+    seeder = DataSeeder(auth_session['token'])
+
+    yield seeder
+
+    seeder.cleanup()
 
 
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
@@ -48,6 +149,14 @@ def pytest_runtest_makereport(item, call):
     rep = outcome.get_result()
     setattr(item, f"rep_{rep.when}", rep)
 
+    # Métricas del navegador de la prueba (antes del teardown, que libera el driver)
+    if rep.when == 'call' and config.BROWSER_METRICS:
+        driver = next((item.funcargs[name] for name in BROWSER_FIXTURES if name in item.funcargs), None)
+        if driver is not None:
+            visits = collect_visits(driver)
+            write_visits(item.nodeid, visits)
+            rep.browser_metrics = [summarize_visit(visit) for visit in visits]
+
 
 @pytest.fixture(scope='session')
 def base_url():
@@ -78,15 +187,18 @@ def pytest_configure(config):
     config._metadata['Fecha de Ejecución'] = datetime.now().strftime('%d/%m/%Y %H:%M:%S')
     config._metadata['Backend'] = 'http://localhost:3000'
     config._metadata['Frontend'] = 'http://localhost:5174'
+    config._metadata['Perfil de dispositivo'] = app_config.BROWSER_PROFILE or 'Sin limitar'
 
 
 def pytest_html_results_table_header(cells):
     """Personalizar encabezados de la tabla en español"""
     cells.insert(2, '<th>Descripción</th>')
     cells.insert(1, '<th class="sortable time" data-column-type="time">Duración</th>')
+    cells.append('<th>Rendimiento</th>')
 
 
 def pytest_html_results_table_row(report, cells):
     """Personalizar filas de la tabla"""
     cells.insert(2, f'<td>{report.nodeid}</td>')
     cells.insert(1, f'<td class="col-time">{getattr(report, "duration", 0):.2f}s</td>')
+    cells.append(html_cell(getattr(report, 'browser_metrics', [])))
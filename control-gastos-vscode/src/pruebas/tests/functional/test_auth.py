@@ -3,12 +3,10 @@ Pruebas funcionales de autenticación
 Basadas en los ejemplos del PDF de Selenium + Python
 """
 import pytest
-import time
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from config.config import config
+from pages import LoginPage
 from utils.helpers import take_screenshot, generate_unique_email
+from utils.waits import assert_absent
 
 
 class TestAuthentication:
@@ -22,45 +20,14 @@ class TestAuthentication:
         driver = driver_with_screenshot
 
         try:
-            # Navegar a la página de login primero
-            driver.get(f"{config.BASE_URL}/login")
-            time.sleep(2)
-
-            # Hacer clic en el link "Crear cuenta gratis" para ir a registro
-            register_link = WebDriverWait(driver, 10).until(
-                EC.element_to_be_clickable((By.LINK_TEXT, "Crear cuenta gratis"))
-            )
-            register_link.click()
-
-            time.sleep(2)
+            # Ir del login al registro con el link "Crear cuenta gratis"
+            register_page = LoginPage(driver).open().go_to_register()
 
             # Generar datos únicos para la prueba
             unique_email = generate_unique_email()
 
-            # Llenar formulario de registro usando IDs exactos del HTML
-            name_input = WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.ID, "name"))
-            )
-            name_input.send_keys(config.TEST_USER_NAME)
-
-            email_input = driver.find_element(By.ID, "email")
-            email_input.send_keys(unique_email)
-
-            password_input = driver.find_element(By.ID, "password")
-            password_input.send_keys(config.TEST_USER_PASSWORD)
-
-            # Seleccionar moneda (opcional, ya tiene valor por defecto)
-            # currency_select = driver.find_element(By.ID, "currency")
-            # currency_select.send_keys(config.TEST_USER_CURRENCY)
-
-            # Enviar formulario
-            submit_button = driver.find_element(By.CSS_SELECTOR, "button[type='submit']")
-            submit_button.click()
-
-            # Esperar redirección al dashboard
-            WebDriverWait(driver, 10).until(
-                EC.url_contains("/dashboard")
-            )
+            # Registrar (la moneda ya tiene valor por defecto) y esperar el dashboard
+            register_page.register(config.TEST_USER_NAME, unique_email, config.TEST_USER_PASSWORD)
 
             # Verificar que se registró correctamente
             assert "/dashboard" in driver.current_url, \
@@ -87,35 +54,17 @@ class TestAuthentication:
         driver = driver_with_screenshot
 
         try:
-            # Navegar a la página de login usando IDs exactos del HTML
-            driver.get(f"{config.BASE_URL}/login")
-            time.sleep(2)
-
-            # Llenar formulario de login usando IDs exactos del HTML
-            email_input = WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.ID, "email"))
-            )
-            email_input.clear()
-            email_input.send_keys(config.TEST_USER_EMAIL)
-
-            password_input = driver.find_element(By.ID, "password")
-            password_input.clear()
-            password_input.send_keys(config.TEST_USER_PASSWORD)
-
-            # Hacer clic en el botón de login
-            login_button = driver.find_element(By.CSS_SELECTOR, "button[type='submit']")
-            login_button.click()
-
-            # Esperar redirección al dashboard
-            WebDriverWait(driver, 10).until(
-                EC.url_contains("/dashboard")
-            )
+            # Llenar el formulario de login y esperar la redirección al dashboard
+            LoginPage(driver).open().login_as(config.TEST_USER_EMAIL, config.TEST_USER_PASSWORD)
 
             # Verificar que iniciamos sesión correctamente
             # El texto "Bienvenido" aparece en la página de login, no en el dashboard
             assert "/dashboard" in driver.current_url, \
                 f"No se redirigió al dashboard. URL actual: {driver.current_url}"
 
+            # No debe quedar ningún mensaje de error visible
+            assert_absent(driver, LoginPage.ERROR_MESSAGE)
+
             print("✓ Login exitoso con credenciales válidas")
 
         except Exception as e:
@@ -130,30 +79,11 @@ class TestAuthentication:
         driver = driver_with_screenshot
 
         try:
-            # Navegar a la página de login
-            driver.get(f"{config.BASE_URL}/login")
-            time.sleep(2)
-
-            # Llenar formulario con credenciales incorrectas usando IDs exactos
-            email_input = WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.ID, "email"))
-            )
-            email_input.clear()
-            email_input.send_keys("usuario_invalido@test.com")
-
-            password_input = driver.find_element(By.ID, "password")
-            password_input.clear()
-            password_input.send_keys("password_incorrecto")
-
-            # Hacer clic en el botón de login
-            login_button = driver.find_element(By.CSS_SELECTOR, "button[type='submit']")
-            login_button.click()
-
-            # Esperar a que aparezca el mensaje de error
-            # El error aparece en un div con clase "bg-red-50"
-            error_message = WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, ".bg-red-50"))
-            )
+            # Enviar credenciales incorrectas
+            login_page = LoginPage(driver).open().login("usuario_invalido@test.com", "password_incorrecto")
+
+            # Esperar a que aparezca el mensaje de error (div con clase "bg-red-50")
+            error_message = login_page.error_message()
 
             # Verificar que el mensaje de error es visible
             assert error_message.is_displayed(), \
@@ -173,37 +103,11 @@ class TestAuthentication:
         driver = driver_with_screenshot
 
         try:
-            # Primero hacer login usando IDs exactos
-            driver.get(f"{config.BASE_URL}/login")
-            time.sleep(2)
-
-            email_input = WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.ID, "email"))
-            )
-            email_input.send_keys(config.TEST_USER_EMAIL)
-
-            password_input = driver.find_element(By.ID, "password")
-            password_input.send_keys(config.TEST_USER_PASSWORD)
-
-            login_button = driver.find_element(By.CSS_SELECTOR, "button[type='submit']")
-            login_button.click()
-
-            # Esperar a llegar al dashboard
-            WebDriverWait(driver, 10).until(
-                EC.url_contains("/dashboard")
-            )
-
-            # Buscar y hacer clic en botón de logout
-            # El botón tiene el texto "Cerrar sesión" dentro del sidebar
-            logout_button = WebDriverWait(driver, 10).until(
-                EC.element_to_be_clickable((By.XPATH, "//button[contains(., 'Cerrar sesión')]"))
-            )
-            logout_button.click()
-
-            # Esperar redirección al login
-            WebDriverWait(driver, 10).until(
-                EC.url_contains("/login")
-            )
+            # Primero hacer login
+            dashboard = LoginPage(driver).open().login_as(config.TEST_USER_EMAIL, config.TEST_USER_PASSWORD)
+
+            # "Cerrar sesión" de la barra lateral; espera la redirección al login
+            dashboard.logout()
 
             # Verificar que volvimos al login
             assert "/login" in driver.current_url, \
@@ -223,32 +127,14 @@ class TestAuthentication:
         driver = driver_with_screenshot
 
         try:
-            # Hacer login usando IDs exactos
-            driver.get(f"{config.BASE_URL}/login")
-            time.sleep(2)
-
-            email_input = WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.ID, "email"))
-            )
-            email_input.send_keys(config.TEST_USER_EMAIL)
-
-            password_input = driver.find_element(By.ID, "password")
-            password_input.send_keys(config.TEST_USER_PASSWORD)
-
-            login_button = driver.find_element(By.CSS_SELECTOR, "button[type='submit']")
-            login_button.click()
-
-            # Esperar a llegar al dashboard
-            WebDriverWait(driver, 10).until(
-                EC.url_contains("/dashboard")
-            )
+            # Hacer login y esperar a llegar al dashboard
+            dashboard = LoginPage(driver).open().login_as(config.TEST_USER_EMAIL, config.TEST_USER_PASSWORD)
 
             # Guardar URL del dashboard
             dashboard_url = driver.current_url
 
             # Refrescar la página
-            driver.refresh()
-            time.sleep(2)
+            dashboard.refresh()
 
             # Verificar que sigue en el dashboard (no redirigió a login)
             assert driver.current_url == dashboard_url, \
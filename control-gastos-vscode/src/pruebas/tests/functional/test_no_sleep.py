@@ -0,0 +1,71 @@
+"""
+Verificación estática: las pruebas funcionales no usan esperas fijas
+
+Las esperas deben hacerse con utils.waits o WebDriverWait; un time.sleep
+alarga toda la suite y sigue siendo inestable en máquinas lentas.
+"""
+import ast
+import os
+import pytest
+
+FUNCTIONAL_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def _python_files():
+    """Archivos .py del directorio de pruebas funcionales"""
+    for root, _, files in os.walk(FUNCTIONAL_DIR):
+        for name in sorted(files):
+            if name.endswith('.py'):
+                yield os.path.join(root, name)
+
+
+def _sleep_calls(path):
+    """
+    Encontrar llamadas a time.sleep en un archivo
+
+    Detecta time.sleep(...), alias de 'import time as t' y
+    'from time import sleep [as x]'.
+
+    Returns:
+        Lista de números de línea con llamadas a sleep
+    """
+    with open(path, encoding='utf-8') as f:
+        tree = ast.parse(f.read(), filename=path)
+
+    time_modules = set()
+    sleep_names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                if alias.name == 'time':
+                    time_modules.add(alias.asname or 'time')
+        elif isinstance(node, ast.ImportFrom) and node.module == 'time':
+            for alias in node.names:
+                if alias.name == 'sleep':
+                    sleep_names.add(alias.asname or 'sleep')
+
+    lines = []
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Call):
+            continue
+        func = node.func
+        if (isinstance(func, ast.Attribute) and func.attr == 'sleep'
+                and isinstance(func.value, ast.Name) and func.value.id in time_modules):
+            lines.append(node.lineno)
+        elif isinstance(func, ast.Name) and func.id in sleep_names:
+            lines.append(node.lineno)
+    return lines
+
+
+@pytest.mark.smoke
+def test_no_time_sleep_in_functional_tests():
+    """
+    Prueba: Ninguna prueba funcional usa time.sleep
+    """
+    offenders = []
+    for path in _python_files():
+        for line in _sleep_calls(path):
+            offenders.append(f"{os.path.relpath(path, FUNCTIONAL_DIR)}:{line}")
+
+    assert not offenders, \
+        f"Usar utils.waits en lugar de time.sleep: {', '.join(offenders)}"
@@ -1,12 +1,26 @@
 """
 Prueba de carga específica para endpoints de API
+
+Con LOCUST_HTTP_CLIENT=fast se ejecuta FastAPILoadTest (FastHttpUser)
+con las mismas tareas y validaciones.
 """
-from locust import HttpUser, task, between, events
+from locust import User, HttpUser, FastHttpUser, task, between, events
 import random
-import time
+from config.config import config
+from utils.data_generators import unique_email, unique_title
+from tests.performance.user_pool import pool
+from tests.performance import sla  # noqa: F401 (registra la verificación de SLA)
+from tests.performance import baseline  # noqa: F401 (escribe LOCUST_STATS_JSON)
+from tests.performance import latency_histograms  # noqa: F401 (histogramas por endpoint)
+from tests.performance.arrival_rate import open_loop, ArrivalRateShape  # noqa: F401
+from tests.performance.load_shapes import (  # noqa: F401 (LOCUST_SHAPE elige una)
+    StepLoadShape, SpikeLoadShape, SoakLoadShape, DiurnalLoadShape)
+
+
+FAST_HTTP = config.LOCUST_HTTP_CLIENT == 'fast'
 
 
-class APILoadTest(HttpUser):
+class APILoadTestTasks(User):
     """
     Prueba de carga enfocada en la API
     Objetivo: Verificar que el tiempo de respuesta sea < 2 segundos con 100 usuarios
@@ -14,14 +28,25 @@ class APILoadTest(HttpUser):
     Basado en el objetivo del PDF:
     - 100 usuarios acceden a la vez al sistema
     - Verificar que el tiempo de respuesta sea < 2 segundos
+
+    Las tareas solo validan el código HTTP; los tiempos de respuesta los
+    mide Locust y se comparan con los umbrales de sla.py al terminar.
     """
 
+    abstract = True
     wait_time = between(1, 2)
     token = None
+    credentials = None
 
     def on_start(self):
-        """Autenticar usuario"""
-        email = f"loadtest_{random.randint(1000, 9999)}@example.com"
+        """Autenticar usuario (con una cuenta del pool si está disponible)"""
+        account = pool.acquire()
+        if account:
+            self.token = account["token"]
+            self.credentials = {"email": account["email"], "password": account["password"]}
+            return
+
+        email = unique_email("loadtest")
 
         # Registrar
         self.client.post("/api/auth/register", json={
@@ -38,43 +63,34 @@ class APILoadTest(HttpUser):
 
         if response.status_code == 200:
             self.token = response.json().get("token")
+            self.credentials = {"email": email, "password": "LoadTest123"}
 
     @task(5)
     def test_get_expenses_performance(self):
         """
-        Prueba: Obtener gastos debe responder en < 2 segundos
+        Prueba: Obtener gastos (SLA en sla.py: GET /api/expenses)
         """
         if not self.token:
             return
 
-        start_time = time.time()
-
         with self.client.get("/api/expenses",
                             headers={"Authorization": f"Bearer {self.token}"},
                             catch_response=True) as response:
-
-            response_time = time.time() - start_time
-
             if response.status_code == 200:
-                if response_time < 2.0:
-                    response.success()
-                else:
-                    response.failure(f"Tiempo de respuesta muy alto: {response_time:.2f}s")
+                response.success()
             else:
                 response.failure(f"Error HTTP: {response.status_code}")
 
     @task(3)
     def test_create_expense_performance(self):
         """
-        Prueba: Crear gasto debe responder en < 2 segundos
+        Prueba: Crear gasto (SLA en sla.py: POST /api/expenses)
         """
         if not self.token:
             return
 
-        start_time = time.time()
-
         expense_data = {
-            "title": f"Load Test {random.randint(1, 10000)}",
+            "title": unique_title("Load Test"),
             "amount": random.uniform(10, 100),
             "category": "Otros",
             "date": "2025-12-07"
@@ -84,37 +100,42 @@ class APILoadTest(HttpUser):
                              json=expense_data,
                              headers={"Authorization": f"Bearer {self.token}"},
                              catch_response=True) as response:
-
-            response_time = time.time() - start_time
-
             if response.status_code in [200, 201]:
-                if response_time < 2.0:
-                    response.success()
-                else:
-                    response.failure(f"Tiempo de respuesta muy alto: {response_time:.2f}s")
+                response.success()
             else:
                 response.failure(f"Error HTTP: {response.status_code}")
 
     @task(2)
     def test_login_performance(self):
         """
-        Prueba: Login debe responder en < 2 segundos
+        Prueba: Login (SLA en sla.py: POST /api/auth/login)
         """
-        start_time = time.time()
+        credentials = self.credentials or {
+            "email": config.TEST_USER_EMAIL,
+            "password": config.TEST_USER_PASSWORD
+        }
 
         with self.client.post("/api/auth/login",
-                             json={
-                                 "email": "test@example.com",
-                                 "password": "Test123456"
-                             },
+                             json=credentials,
                              catch_response=True) as response:
-
-            response_time = time.time() - start_time
-
-            if response_time < 2.0:
+            if response.status_code == 200:
                 response.success()
             else:
-                response.failure(f"Login muy lento: {response_time:.2f}s")
+                response.failure(f"Login falló: {response.status_code}")
+
+
+class APILoadTest(APILoadTestTasks, HttpUser):
+    """Prueba de carga de la API sobre python-requests"""
+    abstract = FAST_HTTP
+
+
+class FastAPILoadTest(APILoadTestTasks, FastHttpUser):
+    """Prueba de carga de la API sobre FastHttpUser (LOCUST_HTTP_CLIENT=fast)"""
+    abstract = not FAST_HTTP
+
+
+# Variante de tasa de llegada constante (solo se lanza con LOCUST_LOAD_MODE=open)
+OpenLoopAPILoadTest = open_loop(FastAPILoadTest if FAST_HTTP else APILoadTest)
 
 
 @events.test_start.add_listener
@@ -122,7 +143,7 @@ def on_test_start(environment, **kwargs):
     """Evento al iniciar las pruebas"""
     print("\n" + "="*60)
     print("INICIANDO PRUEBAS DE RENDIMIENTO")
-    print("Objetivo: Tiempo de respuesta < 2 segundos")
+    print("Objetivo: Tiempo de respuesta < 2 segundos (ver sla.py)")
     print("="*60 + "\n")
 
 
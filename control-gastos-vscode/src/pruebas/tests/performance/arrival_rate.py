@@ -0,0 +1,264 @@
+"""
+Modo de carga abierto (tasa de llegada constante) para Locust
+
+Con wait_time = between(...) cada usuario espera la respuesta antes de
+lanzar la siguiente petición: si el backend se vuelve lento, la carga
+ofrecida baja sola y nunca se llega a ver la saturación real. En modo
+'open' las peticiones se lanzan según un calendario de llegadas (RPS
+objetivo), sin esperar a que terminen las anteriores.
+
+Uso (LOCUST_LOAD_MODE=open, desde el directorio 'pruebas'):
+    LOCUST_LOAD_MODE=open LOCUST_TASK_RPS=get_expenses=200 LOCUST_RPS_STEPS=10 \\
+        locust -f tests/performance/locustfile.py --headless --host http://localhost:3000
+
+- El RPS objetivo (LOCUST_TARGET_RPS) se reparte entre las tareas según sus
+  pesos @task; LOCUST_TASK_RPS fija el RPS de tareas concretas.
+- El RPS sube desde 0 durante LOCUST_RPS_RAMP_TIME segundos, de forma
+  lineal o en LOCUST_RPS_STEPS escalones (para encontrar el techo).
+- ArrivalRateShape mantiene LOCUST_USERS usuarios y termina la prueba tras
+  LOCUST_RUN_TIME. Cada usuario genera 1/LOCUST_USERS de las llegadas.
+- Si un usuario ya tiene LOCUST_MAX_IN_FLIGHT peticiones en curso, la
+  llegada se descarta y aparece en la tabla de errores como "[arrival dropped]".
+"""
+from locust import FastHttpUser, LoadTestShape, constant, events
+from locust.exception import StopUser
+from locust.util.timespan import parse_timespan
+import heapq
+import logging
+import random
+import time
+import traceback
+import gevent
+from gevent.pool import Pool
+from urllib3 import PoolManager
+from config.config import config
+
+logger = logging.getLogger(__name__)
+
+# Tiempo de re-consulta cuando la tasa actual de una tarea es 0
+IDLE_POLL = 0.1
+
+# Clases creadas con open_loop() (las que lanza ArrivalRateShape)
+OPEN_LOOP_CLASSES = []
+
+# Momento de inicio de la prueba en este proceso (lo fija test_start)
+_started_at = None
+
+
+def is_open_mode():
+    """True si LOCUST_LOAD_MODE=open"""
+    return config.LOCUST_LOAD_MODE == 'open'
+
+
+def parse_task_rps(spec):
+    """
+    Interpretar LOCUST_TASK_RPS
+
+    Args:
+        spec: Texto 'tarea=rps,tarea=rps' (p. ej. 'get_expenses=200,create_expense=20')
+
+    Returns:
+        Dict {nombre de tarea: rps}
+    """
+    rates = {}
+    for item in filter(None, (part.strip() for part in spec.split(','))):
+        name, _, value = item.partition('=')
+        if not value:
+            raise ValueError(f"LOCUST_TASK_RPS inválido: '{item}' (formato tarea=rps)")
+        rates[name.strip()] = float(value)
+    return rates
+
+
+def task_rates(tasks, target_rps=None, task_rps=None):
+    """
+    RPS objetivo de cada tarea
+
+    Args:
+        tasks: Lista de tareas de la clase (User.tasks, con repeticiones según el peso)
+        target_rps: RPS total repartido según los pesos (default: config.LOCUST_TARGET_RPS)
+        task_rps: Dict {tarea: rps}; si no está vacío reemplaza al reparto por pesos
+                  (default: config.LOCUST_TASK_RPS)
+
+    Returns:
+        Dict {función de la tarea: rps}
+    """
+    weights = {}
+    for task in tasks:
+        weights[task] = weights.get(task, 0) + 1
+
+    task_rps = parse_task_rps(config.LOCUST_TASK_RPS) if task_rps is None else task_rps
+    if task_rps:
+        by_name = {task.__name__: task for task in weights}
+        unknown = set(task_rps) - set(by_name)
+        if unknown:
+            raise ValueError(f"Tareas desconocidas en LOCUST_TASK_RPS: {', '.join(sorted(unknown))} "
+                             f"(disponibles: {', '.join(sorted(by_name))})")
+        return {by_name[name]: rps for name, rps in task_rps.items()}
+
+    target_rps = config.LOCUST_TARGET_RPS if target_rps is None else target_rps
+    total_weight = sum(weights.values())
+    return {task: target_rps * weight / total_weight for task, weight in weights.items()}
+
+
+def ramp_fraction(elapsed, ramp_time=None, steps=None):
+    """
+    Fracción del RPS objetivo que corresponde a un instante de la prueba
+
+    Args:
+        elapsed: Segundos desde el inicio de la prueba
+        ramp_time: Duración de la rampa (default: config.LOCUST_RPS_RAMP_TIME)
+        steps: Número de escalones, 0 = rampa lineal (default: config.LOCUST_RPS_STEPS)
+
+    Returns:
+        Valor entre 0 y 1
+    """
+    ramp_time = config.LOCUST_RPS_RAMP_TIME if ramp_time is None else ramp_time
+    steps = config.LOCUST_RPS_STEPS if steps is None else steps
+
+    if ramp_time <= 0 or elapsed >= ramp_time:
+        return 1.0
+    if steps > 0:
+        # El primer escalón empieza en 1/steps: no hay tramo a 0 RPS
+        return (int(elapsed / ramp_time * steps) + 1) / steps
+    return elapsed / ramp_time
+
+
+def elapsed_time():
+    """Segundos desde el inicio de la prueba en este proceso"""
+    global _started_at
+    if _started_at is None:
+        _started_at = time.monotonic()
+    return time.monotonic() - _started_at
+
+
+def next_interval(rate):
+    """Tiempo hasta la siguiente llegada para una tasa (peticiones/segundo)"""
+    if config.LOCUST_ARRIVALS == 'poisson':
+        return random.expovariate(rate)
+    return 1.0 / rate
+
+
+def _run_task(user, task):
+    """Ejecutar una tarea en su propio greenlet, registrando sus errores como lo hace TaskSet"""
+    try:
+        task(user)
+    except (StopUser, gevent.GreenletExit):
+        pass
+    except Exception as e:
+        user.environment.events.user_error.fire(user_instance=user, exception=e, tb=e.__traceback__)
+        logger.error("%s\n%s", e, traceback.format_exc())
+
+
+def _record_dropped(user, task):
+    """
+    Registrar una llegada que no se pudo lanzar por límite de peticiones en curso
+
+    Va a la tabla de errores de Locust y no a las estadísticas de peticiones,
+    para no meter tiempos de 0 ms en los percentiles agregados.
+    """
+    user.environment.stats.log_error(
+        'OPEN', f"[arrival dropped] {task.__name__}",
+        f"{config.LOCUST_MAX_IN_FLIGHT} peticiones en curso")
+
+
+def arrival_loop(user):
+    """
+    Tarea única de los usuarios en modo abierto
+
+    Mantiene un calendario (heap) con la próxima llegada de cada tarea y
+    lanza cada una en un greenlet sin esperar a que termine. Las llegadas
+    que se retrasan no se pierden: el calendario se recupera lanzando las
+    pendientes seguidas.
+    """
+    in_flight = Pool(config.LOCUST_MAX_IN_FLIGHT)
+    share = 1.0 / max(config.LOCUST_USERS, 1)
+    rates = {task: rps * share for task, rps in user.arrival_rates.items()}
+
+    # Fase aleatoria para que los usuarios no disparen todos a la vez
+    now = time.monotonic()
+    schedule = [(now + random.uniform(0, next_interval(rate) if rate > 0 else IDLE_POLL), i)
+                for i, rate in enumerate(rates.values())]
+    heapq.heapify(schedule)
+    tasks = list(rates)
+
+    try:
+        while True:
+            due, i = heapq.heappop(schedule)
+            gevent.sleep(max(0.0, due - time.monotonic()))
+
+            task = tasks[i]
+            rate = rates[task] * ramp_fraction(elapsed_time())
+            if rate <= 0:
+                heapq.heappush(schedule, (time.monotonic() + IDLE_POLL, i))
+                continue
+
+            if in_flight.full():
+                _record_dropped(user, task)
+            else:
+                in_flight.spawn(_run_task, user, task)
+            heapq.heappush(schedule, (due + next_interval(rate), i))
+    finally:
+        in_flight.kill(block=False)
+
+
+def open_loop(user_class):
+    """
+    Crear la variante de tasa de llegada constante de una clase de usuario
+
+    Conserva on_start, headers y tareas de 'user_class'; solo cambia cómo
+    se programan las tareas. La clase es abstracta salvo con LOCUST_LOAD_MODE=open.
+
+    Args:
+        user_class: Clase HttpUser o FastHttpUser con tareas @task
+
+    Returns:
+        Subclase 'OpenLoop<Nombre>' registrada en OPEN_LOOP_CLASSES
+    """
+    open_mode = is_open_mode()
+    attrs = {
+        '__doc__': f"{user_class.__name__} con llegadas a tasa constante (LOCUST_LOAD_MODE=open)",
+        '__module__': user_class.__module__,
+        'abstract': not open_mode,
+        'wait_time': constant(0),
+        'arrival_rates': task_rates(user_class.tasks) if open_mode else {},
+    }
+    # Conexiones suficientes para las peticiones simultáneas de cada usuario
+    if issubclass(user_class, FastHttpUser):
+        attrs['concurrency'] = config.LOCUST_MAX_IN_FLIGHT
+    else:
+        def __init__(self, *args, **kwargs):
+            # Un PoolManager por usuario: como atributo de clase lo compartirían
+            # todos. HttpUser.__init__ lo pasa a la sesión, así que va antes.
+            self.pool_manager = PoolManager(maxsize=config.LOCUST_MAX_IN_FLIGHT)
+            user_class.__init__(self, *args, **kwargs)
+        attrs['__init__'] = __init__
+
+    cls = type(f"OpenLoop{user_class.__name__}", (user_class,), attrs)
+    # Asignado tras crear la clase: UserMeta acumularía las tareas heredadas
+    cls.tasks = [arrival_loop]
+
+    OPEN_LOOP_CLASSES.append(cls)
+    return cls
+
+
+class ArrivalRateShape(LoadTestShape):
+    """
+    Mantiene LOCUST_USERS usuarios en modo abierto durante LOCUST_RUN_TIME
+
+    El número de usuarios solo reparte las llegadas; el RPS lo fija la
+    rampa de ramp_fraction(). Solo lanza las clases creadas con open_loop().
+    Con LOCUST_SHAPE se usa la forma elegida en su lugar (load_shapes.py).
+    """
+    abstract = not is_open_mode() or bool(config.LOCUST_SHAPE)
+
+    def tick(self):
+        if self.get_run_time() > parse_timespan(config.LOCUST_RUN_TIME):
+            return None
+        return config.LOCUST_USERS, config.LOCUST_SPAWN_RATE, OPEN_LOOP_CLASSES
+
+
+@events.test_start.add_listener
+def on_test_start(environment, **kwargs):
+    """Reiniciar el reloj de la rampa al empezar cada prueba"""
+    global _started_at
+    _started_at = time.monotonic()
@@ -0,0 +1,475 @@
+"""
+Historial de rendimiento (SQLite) y comparación contra una línea base
+
+Cada ejecución de Locust se guarda como una fila en 'runs' (commit de git
++ escenario) con sus estadísticas por endpoint. 'compare' muestra los
+deltas de p50/p95/p99 y RPS del último run contra la línea base elegida y
+marca las regresiones estadísticamente significativas.
+
+Uso (desde el directorio 'pruebas'):
+    python -m tests.performance.baseline ingest reports/stats_X.json --scenario locustfile
+    python -m tests.performance.baseline compare --scenario locustfile --baseline a1b2c3d
+    python -m tests.performance.baseline list
+
+Se pueden ingerir dos formatos:
+- JSON de estadísticas (LOCUST_STATS_JSON, escrito en events.test_stop, o
+  en events.quitting en el master para incluir los últimos reportes):
+  incluye el histograma de tiempos de respuesta, que permite aplicar la
+  prueba U de Mann-Whitney a cada endpoint.
+- CSV de Locust (--csv, archivo *_stats.csv): solo percentiles. La
+  significancia se estima con la variación entre varios runs de la línea
+  base (z-score del p95); con un único run solo se aplica el umbral.
+
+Una regresión es un aumento de p50 o p95 mayor que
+LOCUST_REGRESSION_THRESHOLD que además es significativo (p < LOCUST_SIGNIFICANCE).
+"""
+from locust import events
+from locust.runners import MasterRunner, WorkerRunner
+from locust.stats import calculate_response_time_percentile
+import argparse
+import csv
+import json
+import math
+import os
+import sqlite3
+import statistics
+import subprocess
+import sys
+from datetime import datetime
+from config.config import config
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    commit_sha TEXT NOT NULL,
+    scenario TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    source TEXT
+);
+CREATE TABLE IF NOT EXISTS endpoint_stats (
+    run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+    method TEXT NOT NULL,
+    name TEXT NOT NULL,
+    requests INTEGER NOT NULL,
+    failures INTEGER NOT NULL,
+    rps REAL NOT NULL,
+    p50 REAL,
+    p95 REAL,
+    p99 REAL,
+    avg_ms REAL,
+    histogram TEXT,
+    PRIMARY KEY (run_id, method, name)
+);
+CREATE INDEX IF NOT EXISTS idx_runs_scenario ON runs (scenario, commit_sha);
+"""
+
+# Métricas de latencia comparadas (las de RPS se muestran pero no marcan regresión)
+LATENCY_METRICS = ('p50', 'p95', 'p99')
+
+
+def current_commit():
+    """Commit corto de HEAD ('unknown' fuera de un repositorio git)"""
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=config.BASE_DIR,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+def entry_from_histogram(method, name, histogram, failures, rps):
+    """
+    Estadísticas de un endpoint a partir de su histograma {ms: peticiones}
+
+    Returns:
+        Dict con las columnas de endpoint_stats
+    """
+    histogram = {int(float(ms)): count for ms, count in histogram.items()}
+    requests = sum(histogram.values())
+    total_ms = sum(ms * count for ms, count in histogram.items())
+    return {
+        'method': method,
+        'name': name,
+        'requests': requests,
+        'failures': failures,
+        'rps': rps,
+        'p50': calculate_response_time_percentile(histogram, requests, 0.50) if requests else None,
+        'p95': calculate_response_time_percentile(histogram, requests, 0.95) if requests else None,
+        'p99': calculate_response_time_percentile(histogram, requests, 0.99) if requests else None,
+        'avg_ms': total_ms / requests if requests else None,
+        'histogram': histogram,
+    }
+
+
+def read_stats_json(path):
+    """Leer el JSON de estadísticas (lista de StatsEntry serializados)"""
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+
+    # Duración de toda la prueba: un endpoint con pocas peticiones daría un RPS absurdo
+    started = min((item['start_time'] for item in data if item['start_time']), default=0)
+    finished = max((item['last_request_timestamp'] or 0 for item in data), default=0)
+    duration = finished - started
+
+    entries = []
+    for item in data:
+        rps = item['num_requests'] / duration if duration > 0 else 0.0
+        entries.append(entry_from_histogram(item['method'], item['name'], item['response_times'],
+                                            item['num_failures'], rps))
+    return entries
+
+
+def read_stats_csv(path):
+    """Leer el *_stats.csv de Locust (sin la fila Aggregated)"""
+    entries = []
+    with open(path, encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            if row['Name'] == 'Aggregated':
+                continue
+            entries.append({
+                'method': row['Type'],
+                'name': row['Name'],
+                'requests': int(row['Request Count']),
+                'failures': int(row['Failure Count']),
+                'rps': float(row['Requests/s']),
+                'p50': _csv_number(row['50%']),
+                'p95': _csv_number(row['95%']),
+                'p99': _csv_number(row['99%']),
+                'avg_ms': _csv_number(row['Average Response Time']),
+                'histogram': None,
+            })
+    return entries
+
+
+def _csv_number(value):
+    """Número del CSV de Locust ('N/A' cuando no hay peticiones)"""
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+class BaselineStore:
+    """Almacén SQLite de ejecuciones de Locust"""
+
+    def __init__(self, path=None):
+        """
+        Args:
+            path: Archivo SQLite (default: config.LOCUST_BASELINE_DB)
+        """
+        self.path = path or config.LOCUST_BASELINE_DB
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self.conn = sqlite3.connect(self.path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute('PRAGMA foreign_keys = ON')
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def ingest(self, path, scenario, commit=None):
+        """
+        Guardar un archivo de estadísticas como un nuevo run
+
+        Args:
+            path: JSON de estadísticas o *_stats.csv de Locust
+            scenario: Nombre del escenario (p. ej. 'locustfile', 'api_load_test')
+            commit: Commit de git (default: HEAD)
+
+        Returns:
+            Id del run creado
+        """
+        entries = read_stats_json(path) if path.endswith('.json') else read_stats_csv(path)
+        with self.conn:
+            cursor = self.conn.execute(
+                'INSERT INTO runs (commit_sha, scenario, created_at, source) VALUES (?, ?, ?, ?)',
+                (commit or current_commit(), scenario, datetime.now().isoformat(timespec='seconds'),
+                 os.path.basename(path)))
+            run_id = cursor.lastrowid
+            self.conn.executemany(
+                'INSERT INTO endpoint_stats VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                [(run_id, e['method'], e['name'], e['requests'], e['failures'], e['rps'],
+                  e['p50'], e['p95'], e['p99'], e['avg_ms'],
+                  json.dumps(e['histogram']) if e['histogram'] is not None else None)
+                 for e in entries])
+        return run_id
+
+    def runs(self, scenario=None):
+        """Runs guardados, del más reciente al más antiguo"""
+        query = 'SELECT * FROM runs'
+        params = ()
+        if scenario:
+            query += ' WHERE scenario = ?'
+            params = (scenario,)
+        return self.conn.execute(query + ' ORDER BY id DESC', params).fetchall()
+
+    def run_ids(self, scenario, commit=None, exclude_commit=None):
+        """
+        Runs de un commit (o del commit más reciente que no sea 'exclude_commit')
+
+        Returns:
+            Tupla (commit, [ids de run])
+        """
+        rows = self.runs(scenario)
+        if commit is None:
+            commit = next((r['commit_sha'] for r in rows if r['commit_sha'] != exclude_commit), None)
+        # Permite abreviar el commit con un prefijo
+        ids = [r['id'] for r in rows if commit and r['commit_sha'].startswith(commit)]
+        return commit, ids
+
+    def endpoint_stats(self, run_ids):
+        """
+        Estadísticas por endpoint de uno o varios runs
+
+        Returns:
+            Dict {(método, nombre): [filas, una por run]}
+        """
+        placeholders = ','.join('?' * len(run_ids))
+        rows = self.conn.execute(
+            f'SELECT * FROM endpoint_stats WHERE run_id IN ({placeholders})', run_ids).fetchall()
+        result = {}
+        for row in rows:
+            result.setdefault((row['method'], row['name']), []).append(row)
+        return result
+
+
+def _merge_histograms(rows):
+    """Sumar los histogramas de varios runs (None si alguno no lo tiene)"""
+    merged = {}
+    for row in rows:
+        if row['histogram'] is None:
+            return None
+        for ms, count in json.loads(row['histogram']).items():
+            merged[int(ms)] = merged.get(int(ms), 0) + count
+    return merged
+
+
+def mann_whitney(baseline, candidate):
+    """
+    Prueba U de Mann-Whitney sobre dos histogramas {ms: peticiones}
+
+    Usa la aproximación normal con corrección por empates (los histogramas
+    de Locust agrupan los tiempos, así que hay muchos empates).
+
+    Returns:
+        Tupla (z, p-valor bilateral); z > 0 si el candidato es más lento
+    """
+    n1, n2 = sum(baseline.values()), sum(candidate.values())
+    n = n1 + n2
+    if n1 == 0 or n2 == 0:
+        return 0.0, 1.0
+
+    rank = 0
+    rank_sum_candidate = 0.0
+    ties = 0.0
+    for ms in sorted(set(baseline) | set(candidate)):
+        count = baseline.get(ms, 0) + candidate.get(ms, 0)
+        midrank = rank + (count + 1) / 2
+        rank_sum_candidate += midrank * candidate.get(ms, 0)
+        ties += count ** 3 - count
+        rank += count
+
+    u = rank_sum_candidate - n2 * (n2 + 1) / 2
+    mean = n1 * n2 / 2
+    variance = n1 * n2 / 12 * ((n + 1) - ties / (n * (n - 1)))
+    if variance <= 0:
+        return 0.0, 1.0
+    z = (u - mean) / math.sqrt(variance)
+    return z, math.erfc(abs(z) / math.sqrt(2))
+
+
+def _run_level_test(baseline_rows, candidate_value, metric='p95'):
+    """
+    z-score del candidato respecto a la variación entre runs de la línea base
+
+    Returns:
+        Tupla (z, p-valor) o None si hay menos de 3 runs de línea base
+    """
+    values = [row[metric] for row in baseline_rows if row[metric] is not None]
+    if len(values) < 3 or candidate_value is None:
+        return None
+    stdev = statistics.stdev(values)
+    if stdev == 0:
+        return None
+    z = (candidate_value - statistics.mean(values)) / stdev
+    return z, math.erfc(abs(z) / math.sqrt(2))
+
+
+def _mean(rows, metric):
+    values = [row[metric] for row in rows if row[metric] is not None]
+    return statistics.mean(values) if values else None
+
+
+def _delta(before, after):
+    """Cambio relativo (0.10 = +10%)"""
+    if before is None or after is None or before == 0:
+        return None
+    return (after - before) / before
+
+
+def compare(store, scenario, baseline_commit=None, candidate_commit=None,
+            threshold=None, alpha=None):
+    """
+    Comparar el run candidato con la línea base
+
+    Args:
+        store: BaselineStore
+        scenario: Escenario a comparar
+        baseline_commit: Commit de referencia (default: el último distinto del candidato)
+        candidate_commit: Commit a evaluar (default: el del run más reciente)
+        threshold: Aumento relativo mínimo para marcar regresión (default: config)
+        alpha: Nivel de significancia (default: config)
+
+    Returns:
+        Dict con baseline, candidate y results (uno por endpoint)
+    """
+    threshold = config.LOCUST_REGRESSION_THRESHOLD if threshold is None else threshold
+    alpha = config.LOCUST_SIGNIFICANCE if alpha is None else alpha
+
+    candidate_commit, candidate_ids = store.run_ids(scenario, candidate_commit)
+    if not candidate_ids:
+        raise ValueError(f"No hay runs del escenario '{scenario}'")
+    # El candidato es solo su run más reciente; la línea base usa todos sus runs
+    candidate_ids = candidate_ids[:1]
+    baseline_commit, baseline_ids = store.run_ids(scenario, baseline_commit, exclude_commit=candidate_commit)
+    if not baseline_ids:
+        raise ValueError(f"No hay línea base para '{scenario}' (commit candidato {candidate_commit})")
+
+    baseline = store.endpoint_stats(baseline_ids)
+    candidate = store.endpoint_stats(candidate_ids)
+    results = []
+
+    for key in sorted(set(baseline) & set(candidate)):
+        before_rows, after_row = baseline[key], candidate[key][0]
+        result = {'endpoint': f"{key[0]} {key[1]}", 'regression': False, 'test': None, 'p_value': None}
+
+        for metric in (*LATENCY_METRICS, 'rps'):
+            before = _mean(before_rows, metric)
+            result[metric] = (before, after_row[metric], _delta(before, after_row[metric]))
+
+        before_histogram = _merge_histograms(before_rows)
+        after_histogram = _merge_histograms([after_row])
+        if before_histogram and after_histogram:
+            z, p_value = mann_whitney(before_histogram, after_histogram)
+            result['test'] = 'mann-whitney'
+        else:
+            test = _run_level_test(before_rows, after_row['p95'])
+            z, p_value = test if test else (None, None)
+            result['test'] = 'z-runs' if test else 'umbral'
+        result['p_value'] = p_value
+
+        slower = any((result[m][2] or 0) > threshold for m in ('p50', 'p95'))
+        significant = p_value is None or (p_value < alpha and z > 0)
+        result['regression'] = slower and significant
+        results.append(result)
+
+    return {
+        'scenario': scenario,
+        'baseline': baseline_commit,
+        'baseline_runs': len(baseline_ids),
+        'candidate': candidate_commit,
+        'results': results,
+    }
+
+
+def print_comparison(comparison):
+    """Imprimir la tabla de comparación"""
+    def fmt(before, after, delta):
+        if before is None or after is None:
+            return f"{'-':>22}"
+        change = f"{delta:+.0%}" if delta is not None else ''
+        return f"{before:>7.0f} -> {after:>6.0f} {change:>5}"
+
+    print("\n" + "=" * 60)
+    print(f"COMPARACIÓN '{comparison['scenario']}': {comparison['baseline']} "
+          f"({comparison['baseline_runs']} runs) -> {comparison['candidate']}")
+    print("=" * 60)
+    for r in comparison['results']:
+        mark = "✗" if r['regression'] else "✓"
+        p_value = f"p={r['p_value']:.3g}" if r['p_value'] is not None else 'sin prueba'
+        print(f"{mark} {r['endpoint']}  [{r['test']}, {p_value}]")
+        for metric in (*LATENCY_METRICS, 'rps'):
+            before, after, delta = r[metric]
+            unit = 'req/s' if metric == 'rps' else 'ms'
+            print(f"    {metric:<4} {fmt(before, after, delta)} {unit}")
+
+    regressions = [r for r in comparison['results'] if r['regression']]
+    if regressions:
+        print(f"\n✗ {len(regressions)} endpoint(s) con regresión significativa")
+    else:
+        print("\n✓ Sin regresiones significativas")
+    print("=" * 60 + "\n")
+
+
+def write_stats_json(environment):
+    """Guardar las estadísticas con histogramas en LOCUST_STATS_JSON (si se configuró)"""
+    if not config.LOCUST_STATS_JSON:
+        return
+    # serialize() y no serialize_stats(): este último vacía las estadísticas
+    data = [entry.serialize() for entry in environment.stats.entries.values() if entry.num_requests]
+    os.makedirs(os.path.dirname(os.path.abspath(config.LOCUST_STATS_JSON)), exist_ok=True)
+    with open(config.LOCUST_STATS_JSON, 'w', encoding='utf-8') as f:
+        json.dump(data, f)
+
+
+@events.test_stop.add_listener
+def on_test_stop(environment, **kwargs):
+    """JSON del proceso local (el master espera a los últimos reportes)"""
+    if not isinstance(environment.runner, (MasterRunner, WorkerRunner)):
+        write_stats_json(environment)
+
+
+@events.quitting.add_listener
+def on_quitting(environment, **kwargs):
+    """En el master los últimos reportes de los workers llegan después de test_stop"""
+    if isinstance(environment.runner, MasterRunner):
+        write_stats_json(environment)
+
+
+def main():
+    """CLI: ingest, compare y list"""
+    parser = argparse.ArgumentParser(description='Historial de rendimiento de Locust')
+    parser.add_argument('--db', default=config.LOCUST_BASELINE_DB, help='Archivo SQLite')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    ingest = commands.add_parser('ingest', help='Guardar un JSON o *_stats.csv de Locust')
+    ingest.add_argument('path', help='Archivo de estadísticas')
+    ingest.add_argument('--scenario', default='locustfile', help='Nombre del escenario')
+    ingest.add_argument('--commit', help='Commit de git (default: HEAD)')
+
+    comparison = commands.add_parser('compare', help='Comparar el último run con la línea base')
+    comparison.add_argument('--scenario', default='locustfile', help='Nombre del escenario')
+    comparison.add_argument('--baseline', help='Commit de la línea base (default: el anterior)')
+    comparison.add_argument('--candidate', help='Commit a evaluar (default: el último run)')
+    comparison.add_argument('--threshold', type=float, default=config.LOCUST_REGRESSION_THRESHOLD,
+                            help='Aumento relativo mínimo de p50/p95 (0.10 = 10%%)')
+    comparison.add_argument('--alpha', type=float, default=config.LOCUST_SIGNIFICANCE,
+                            help='Nivel de significancia (p < alpha, p. ej. 0.01)')
+
+    listing = commands.add_parser('list', help='Listar los runs guardados')
+    listing.add_argument('--scenario', help='Filtrar por escenario')
+
+    args = parser.parse_args()
+    store = BaselineStore(args.db)
+    try:
+        if args.command == 'ingest':
+            run_id = store.ingest(args.path, args.scenario, args.commit)
+            print(f"✓ Run {run_id} guardado ({args.scenario}) en {args.db}")
+        elif args.command == 'list':
+            for run in store.runs(args.scenario):
+                print(f"{run['id']:>5}  {run['commit_sha']:<10} {run['scenario']:<20} "
+                      f"{run['created_at']}  {run['source']}")
+        else:
+            try:
+                result = compare(store, args.scenario, args.baseline, args.candidate,
+                                 args.threshold, args.alpha)
+            except ValueError as e:
+                print(f"✗ {e}")
+                sys.exit(2)
+            print_comparison(result)
+            sys.exit(1 if any(r['regression'] for r in result['results']) else 0)
+    finally:
+        store.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,282 @@
+"""
+Carga con navegador real: flujos de la interfaz bajo carga de la API
+
+Locust genera la carga de fondo contra la API con los usuarios de
+locustfile.py y, a la vez, LOCUST_BROWSER_USERS navegadores Chrome/Firefox
+headless repiten los flujos de test_expenses.py (crear, listar, buscar y
+filtrar gastos) con los mismos page objects (pages/). El tiempo de
+principio a fin de cada flujo va a su propio histograma (FlowRecorder), no
+a las estadísticas de peticiones: un flujo de varios segundos distorsionaría
+el total, las RPS, los SLA, la línea base y los histogramas HDR de la API.
+Al terminar se imprime por flujo p50/p95/máx y los fallos, y se guarda en
+reports/ui_flows.json, así que se ve cuánto empeora la experiencia del
+usuario cuando el backend está cargado. Un flujo fallido, o con p95 por
+encima de LOCUST_UI_FLOW_P95_MS (> 0), termina la prueba con código 1.
+
+La concurrencia de navegadores es fija (fixed_count de Locust, también en
+modo distribuido) para que la prueba quepa en una sola máquina: cada
+navegador headless consume del orden de 300 MB y un núcleo.
+
+Ejecución (desde el directorio 'pruebas', con backend y frontend levantados):
+    LOCUST_BROWSER_USERS=3 locust -f tests/performance/browser_load.py \\
+        --headless -u 50 -r 5 -t 5m --host http://localhost:3000
+
+Los navegadores abren config.BASE_URL e inician sesión con una cuenta del
+pool (o con el usuario de prueba si no hay pool); los gastos que crean se
+borran al detenerse. Con BROWSER_METRICS=true las métricas de cada visita
+(FCP, LCP...) se añaden a BROWSER_METRICS_FILE con el nombre del flujo.
+"""
+from locust import User, task, between, events
+from locust.exception import StopUser
+from locust.runners import MasterRunner, WorkerRunner
+from datetime import date, timedelta
+import json
+import os
+import time
+from config.config import config
+from pages import ExpensesPage
+from utils.api_client import ApiClient, get_auth_session
+from utils.browser_metrics import collect_visits, write_visits
+from utils.data_generators import unique_title
+from utils.driver_factory import DriverFactory
+from utils.helpers import inject_auth_session
+from tests.performance.user_pool import pool
+from tests.performance.latency_histograms import LatencyHistogram
+from tests.performance.locustfile import (  # noqa: F401 (carga de fondo contra la API)
+    ExpenseTrackingUser, FastExpenseTrackingUser, LifecycleUser, FastLifecycleUser)
+
+# Prefijo de los gastos creados por los navegadores (se borran en on_stop)
+TITLE_PREFIX = 'Gasto UI'
+
+REPORT_FILE = os.path.join(config.REPORTS_DIR, 'ui_flows.json')
+
+
+class FlowRecorder:
+    """Duración de cada flujo de la interfaz: histograma, fallos y último error"""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.flows = {}
+
+    def _flow(self, name):
+        return self.flows.setdefault(name, {'histogram': LatencyHistogram(), 'failures': 0, 'last_error': None})
+
+    def record(self, name, response_time, exception=None):
+        """
+        Registrar un flujo
+
+        Args:
+            name: Nombre del flujo ('gastos: crear'...)
+            response_time: Duración en ms
+            exception: Error del flujo (None si terminó bien)
+        """
+        flow = self._flow(name)
+        if exception is None:
+            flow['histogram'].record(response_time * 1000)
+        else:
+            flow['failures'] += 1
+            flow['last_error'] = f"{type(exception).__name__}: {exception}"[:200]
+
+    def take(self):
+        """Datos acumulados desde la última llamada (para el reporte al master)"""
+        data = {name: {'counts': flow['histogram'].to_dict(), 'failures': flow['failures'],
+                       'last_error': flow['last_error']}
+                for name, flow in self.flows.items()}
+        self.reset()
+        return data
+
+    def merge(self, data):
+        """Sumar los datos de un worker"""
+        for name, row in data.items():
+            flow = self._flow(name)
+            flow['histogram'].merge(LatencyHistogram.from_dict(row['counts']))
+            flow['failures'] += row['failures']
+            flow['last_error'] = row['last_error'] or flow['last_error']
+
+    def summary(self):
+        """Dict {flujo: {'flows', 'failures', 'p50', 'p95', 'max', 'last_error'}} en ms"""
+        result = {}
+        for name in sorted(self.flows):
+            flow = self.flows[name]
+            histogram = flow['histogram']
+            row = {'flows': histogram.total, 'failures': flow['failures'], 'last_error': flow['last_error']}
+            for key, value in (('p50', histogram.percentile(50)), ('p95', histogram.percentile(95)),
+                               ('max', histogram.max())):
+                row[key] = value / 1000 if value is not None else None
+            result[name] = row
+        return result
+
+
+recorder = FlowRecorder()
+
+
+class BrowserUser(User):
+    """Navegador headless que repite los flujos de la página de gastos"""
+
+    abstract = not config.LOCUST_BROWSER_USERS
+    fixed_count = config.LOCUST_BROWSER_USERS
+    wait_time = between(1, 3)
+
+    driver = None
+    token = None
+
+    def on_start(self):
+        """Abrir el navegador e iniciar sesión sin pasar por el formulario"""
+        try:
+            self.driver = DriverFactory.create_driver(headless=True)
+        except Exception as e:
+            self._record('navegador: abrir', 0, e)
+            raise StopUser()
+
+        account = pool.acquire()
+        try:
+            session = (get_auth_session(account['email'], account['password'])
+                       if account else get_auth_session())
+            inject_auth_session(self.driver, session['token'], session['user'])
+        except Exception as e:
+            self._record('navegador: iniciar sesión', 0, e)
+            self.on_stop()
+            raise StopUser()
+        self.token = session['token']
+        self.expenses = ExpensesPage(self.driver)
+
+    def on_stop(self):
+        """Borrar los gastos creados y cerrar el navegador"""
+        if self.token:
+            client = ApiClient(token=self.token)
+            try:
+                for expense in client.list_expenses():
+                    if expense['title'].startswith(TITLE_PREFIX):
+                        client.delete_expense(expense['id'])
+            except Exception:
+                # La limpieza no debe ocultar el resultado de la prueba
+                pass
+        if self.driver:
+            self.driver.quit()
+            self.driver = None
+
+    def _record(self, name, response_time, exception=None):
+        """Registrar un flujo en el histograma de flujos (no en las peticiones)"""
+        recorder.record(name, response_time, exception)
+
+    def _flow(self, name, action):
+        """
+        Ejecutar un flujo de la interfaz y medir su duración total
+
+        Args:
+            name: Nombre en las estadísticas ('gastos: crear'...)
+            action: Función sin argumentos que ejecuta el flujo
+        """
+        start = time.perf_counter()
+        try:
+            action()
+        except Exception as e:
+            self._record(name, (time.perf_counter() - start) * 1000, e)
+        else:
+            self._record(name, (time.perf_counter() - start) * 1000)
+
+        if config.BROWSER_METRICS:
+            write_visits(f"browser_load::{name}", collect_visits(self.driver))
+
+    @task(3)
+    def list_expenses(self):
+        """Abrir la lista de gastos"""
+        self._flow('gastos: listar', lambda: self.expenses.open().list_title())
+
+    @task(2)
+    def search_expenses(self):
+        """Buscar en la lista de gastos"""
+        self._flow('gastos: buscar', lambda: self.expenses.open().search('supermercado'))
+
+    @task(1)
+    def filter_expenses(self):
+        """Ver los gastos del mes anterior"""
+        previous = date.today().replace(day=1) - timedelta(days=1)
+        self._flow('gastos: filtrar por mes',
+                   lambda: self.expenses.open().filter_by_month(f"{previous.month:02d}", previous.year))
+
+    @task(1)
+    def create_expense(self):
+        """Crear un gasto desde el formulario"""
+        title = unique_title(TITLE_PREFIX)
+        self._flow('gastos: crear',
+                   lambda: self.expenses.open().create_expense(title, '25.00', category='food'))
+
+
+def _ms(value):
+    return f"{value:.0f}" if value is not None else '-'
+
+
+def print_summary(summary):
+    """Imprimir la tabla de flujos"""
+    print("\n" + "=" * 60)
+    print("FLUJOS DE LA INTERFAZ BAJO CARGA (ms)")
+    print("=" * 60)
+    print(f"{'Flujo':<28} {'n':>5} {'Fallos':>6} {'p50':>7} {'p95':>7} {'máx':>7}")
+    for name, row in summary.items():
+        print(f"{name:<28} {row['flows']:>5} {row['failures']:>6} {_ms(row['p50']):>7} "
+              f"{_ms(row['p95']):>7} {_ms(row['max']):>7}")
+        if row['last_error']:
+            print(f"    último error: {row['last_error']}")
+    print(f"Resultados en {REPORT_FILE}")
+    print("=" * 60 + "\n")
+
+
+def _write_summary(environment):
+    """Guardar e imprimir los flujos y fijar el código de salida si hay fallos o lentitud"""
+    summary = recorder.summary()
+    if not summary:
+        return
+    os.makedirs(os.path.dirname(REPORT_FILE), exist_ok=True)
+    with open(REPORT_FILE, 'w', encoding='utf-8') as f:
+        json.dump(summary, f, indent=2)
+    print_summary(summary)
+
+    budget = config.LOCUST_UI_FLOW_P95_MS
+    failed = [name for name, row in summary.items() if row['failures']]
+    slow = [name for name, row in summary.items()
+            if budget > 0 and row['p95'] is not None and row['p95'] > budget]
+    for name in failed:
+        print(f"✗ {name}: {summary[name]['failures']} flujo(s) fallidos")
+    for name in slow:
+        print(f"✗ {name}: p95 {summary[name]['p95']:.0f} ms (umbral {budget:g} ms)")
+    if failed or slow:
+        environment.process_exit_code = 1
+
+
+@events.init.add_listener
+def on_locust_init(environment, **kwargs):
+    """Combinación de los flujos de los workers en el master"""
+    if isinstance(environment.runner, MasterRunner):
+        @environment.events.worker_report.add_listener
+        def on_worker_report(client_id, data, **kw):
+            if data.get('ui_flows'):
+                recorder.merge(data['ui_flows'])
+
+    elif isinstance(environment.runner, WorkerRunner):
+        @environment.events.report_to_master.add_listener
+        def on_report_to_master(client_id, data, **kw):
+            if recorder.flows:
+                data['ui_flows'] = recorder.take()
+
+
+@events.test_start.add_listener
+def on_test_start(environment, **kwargs):
+    """Empezar el acumulado de cero"""
+    recorder.reset()
+
+
+@events.test_stop.add_listener
+def on_test_stop(environment, **kwargs):
+    """Resumen en el proceso local (el master espera a los últimos reportes)"""
+    if not isinstance(environment.runner, (MasterRunner, WorkerRunner)):
+        _write_summary(environment)
+
+
+@events.quitting.add_listener
+def on_quitting(environment, **kwargs):
+    """En el master los últimos reportes de los workers llegan después de test_stop"""
+    if isinstance(environment.runner, MasterRunner):
+        _write_summary(environment)
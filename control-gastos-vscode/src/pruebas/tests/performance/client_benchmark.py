@@ -0,0 +1,211 @@
+"""
+Comparación de RPS por núcleo: HttpUser (python-requests) vs FastHttpUser
+
+Levanta el servidor sustituto (stub_server.py) sin latencia en otro
+proceso y lanza, para cada cliente, un proceso de Locust (un núcleo) con
+usuarios sin espera contra GET /api/expenses. El RPS se lee del CSV de
+Locust y se divide por el uso de CPU del proceso generador, de modo que
+el resultado es el RPS que daría un núcleo saturado.
+
+Ejecución (desde el directorio 'pruebas'):
+    python -m tests.performance.client_benchmark --users 50 --duration 20s
+
+Si el servidor sustituto llega al 100% de CPU, el techo medido es el suyo
+y no el del cliente: el informe lo indica.
+"""
+from locust import User, HttpUser, FastHttpUser, task, constant
+import argparse
+import csv
+import json
+import os
+import resource
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from config.config import config
+from utils.data_generators import unique_email
+
+# Cliente -> clase de usuario de este módulo
+CLIENTS = {
+    'requests': 'RequestsBenchmarkUser',
+    'fast': 'FastBenchmarkUser',
+}
+
+
+class BenchmarkTasks(User):
+    """Usuario sin tiempo de espera que solo lista gastos"""
+    abstract = True
+    wait_time = constant(0)
+    headers = None
+
+    def on_start(self):
+        """Registrar una cuenta en el servidor sustituto y guardar el token"""
+        credentials = {"email": unique_email("bench"), "password": config.TEST_USER_PASSWORD}
+        self.client.post("/api/auth/register", json={**credentials, "name": "Benchmark"})
+        response = self.client.post("/api/auth/login", json=credentials)
+        self.headers = {"Authorization": f"Bearer {response.json()['token']}"}
+
+    @task
+    def get_expenses(self):
+        """Misma validación que ExpenseTrackingUser.get_expenses"""
+        with self.client.get("/api/expenses",
+                             headers=self.headers,
+                             catch_response=True) as response:
+            if response.status_code == 200:
+                response.success()
+            else:
+                response.failure(f"Error al obtener gastos: {response.status_code}")
+
+
+class RequestsBenchmarkUser(BenchmarkTasks, HttpUser):
+    """Generador con python-requests"""
+
+
+class FastBenchmarkUser(BenchmarkTasks, FastHttpUser):
+    """Generador con geventhttpclient"""
+
+
+def _process_cpu_seconds(pid):
+    """Tiempo de CPU (user + system) de un proceso en marcha, leído de /proc"""
+    try:
+        with open(f"/proc/{pid}/stat", encoding='utf-8') as f:
+            fields = f.read().rsplit(')', 1)[1].split()
+        return (int(fields[11]) + int(fields[12])) / os.sysconf('SC_CLK_TCK')
+    except (OSError, IndexError, ValueError):
+        return None
+
+
+def _children_cpu_seconds():
+    """Tiempo de CPU acumulado de los procesos hijos ya terminados"""
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return usage.ru_utime + usage.ru_stime
+
+
+def _wait_for_port(host, port, timeout=10):
+    """Esperar a que el servidor sustituto acepte conexiones"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection((host, port), timeout=0.5):
+                return
+        except OSError:
+            time.sleep(0.1)
+    raise RuntimeError(f"El servidor sustituto no respondió en {host}:{port}")
+
+
+def _read_aggregated(csv_prefix):
+    """Fila 'Aggregated' del CSV de estadísticas de Locust"""
+    with open(f"{csv_prefix}_stats.csv", encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            if row['Name'] == 'Aggregated':
+                return row
+    raise RuntimeError(f"No hay fila Aggregated en {csv_prefix}_stats.csv")
+
+
+def run_client(client, url, users, duration, workdir, stub_pid=None):
+    """
+    Ejecutar Locust con un cliente y medir su RPS y uso de CPU
+
+    Args:
+        client: 'requests' o 'fast'
+        url: URL del servidor sustituto
+        users: Usuarios concurrentes
+        duration: Duración ('20s', '1m'...)
+        workdir: Directorio para los CSV
+        stub_pid: PID del servidor sustituto, para medir su CPU
+
+    Returns:
+        Dict con rps, cpu, rps_per_core, p95, failures y stub_cpu
+    """
+    csv_prefix = os.path.join(workdir, client)
+    command = [
+        sys.executable, '-m', 'locust', '-f', os.path.abspath(__file__),
+        '--headless', '--only-summary', '--skip-log-setup',
+        '-u', str(users), '-r', str(users), '-t', duration,
+        '--host', url, '--csv', csv_prefix, CLIENTS[client],
+    ]
+    env = {**os.environ, 'LOCUST_SLA': 'false', 'LOCUST_USER_POOL': 'false'}
+
+    cpu_before = _children_cpu_seconds()
+    stub_before = _process_cpu_seconds(stub_pid) if stub_pid else None
+    started = time.monotonic()
+    subprocess.run(command, cwd=config.BASE_DIR, env=env, check=True,
+                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    wall = time.monotonic() - started
+    cpu = (_children_cpu_seconds() - cpu_before) / wall
+    stub_after = _process_cpu_seconds(stub_pid) if stub_pid else None
+
+    row = _read_aggregated(csv_prefix)
+    rps = float(row['Requests/s'])
+    return {
+        'client': client,
+        'users': users,
+        'rps': rps,
+        'cpu': cpu,
+        'rps_per_core': rps / cpu if cpu else 0.0,
+        'p95': float(row['95%']),
+        'failures': int(row['Failure Count']),
+        'stub_cpu': (stub_after - stub_before) / wall if stub_before is not None else None,
+    }
+
+
+def print_report(results):
+    """Imprimir la tabla comparativa"""
+    print("\n" + "=" * 60)
+    print("RPS POR NÚCLEO: HttpUser vs FastHttpUser")
+    print("=" * 60)
+    print(f"{'Cliente':<10} {'RPS':>9} {'CPU':>6} {'RPS/núcleo':>11} {'p95 ms':>7} {'CPU stub':>9}")
+    for r in results:
+        stub = f"{r['stub_cpu']:.0%}" if r['stub_cpu'] is not None else '-'
+        print(f"{r['client']:<10} {r['rps']:>9.1f} {r['cpu']:>6.0%} "
+              f"{r['rps_per_core']:>11.1f} {r['p95']:>7.0f} {stub:>9}")
+        if r['failures']:
+            print(f"  ✗ {r['failures']} peticiones fallidas con '{r['client']}'")
+        if r['stub_cpu'] and r['stub_cpu'] > 0.9:
+            print(f"  ✗ El servidor sustituto estaba saturado: el techo de '{r['client']}' es mayor")
+
+    if len(results) == 2 and results[0]['rps_per_core']:
+        ratio = results[1]['rps_per_core'] / results[0]['rps_per_core']
+        print(f"\n✓ {results[1]['client']} genera {ratio:.1f}x RPS por núcleo que {results[0]['client']}")
+    print("=" * 60 + "\n")
+
+
+def main():
+    """CLI del benchmark"""
+    parser = argparse.ArgumentParser(description='Comparar RPS por núcleo de HttpUser y FastHttpUser')
+    parser.add_argument('--users', type=int, default=config.LOCUST_USERS, help='Usuarios concurrentes')
+    parser.add_argument('--duration', default='20s', help='Duración de cada ejecución')
+    parser.add_argument('--port', type=int, default=3999, help='Puerto del servidor sustituto')
+    parser.add_argument('--clients', nargs='+', choices=list(CLIENTS), default=list(CLIENTS),
+                        help='Clientes a comparar')
+    parser.add_argument('--output', default=os.path.join(config.REPORTS_DIR, 'client_benchmark.json'),
+                        help='Archivo JSON de resultados')
+    args = parser.parse_args()
+
+    stub = subprocess.Popen(
+        [sys.executable, '-m', 'tests.performance.stub_server', '--port', str(args.port),
+         '--latency-ms', '0'],
+        cwd=config.BASE_DIR, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        _wait_for_port('127.0.0.1', args.port)
+        url = f"http://127.0.0.1:{args.port}"
+        results = []
+        with tempfile.TemporaryDirectory() as workdir:
+            for client in args.clients:
+                print(f"Midiendo '{client}' ({args.users} usuarios, {args.duration})...")
+                results.append(run_client(client, url, args.users, args.duration, workdir, stub.pid))
+    finally:
+        stub.terminate()
+        stub.wait()
+
+    print_report(results)
+    os.makedirs(os.path.dirname(args.output), exist_ok=True)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2)
+    print(f"✓ Resultados guardados en {args.output}")
+
+
+if __name__ == '__main__':
+    main()
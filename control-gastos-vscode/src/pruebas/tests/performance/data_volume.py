@@ -0,0 +1,402 @@
+"""
+Escenario de volumen de datos para GET /api/expenses
+
+El listado de gastos no tiene paginación (findAll ordenado por fecha) y los
+usuarios de locustfile.py solo tienen unos pocos gastos y nunca usan el
+filtro ?month=. Este escenario pre-carga una cuenta por volumen
+(LOCUST_DATA_VOLUMES, p. ej. 100 / 10k / 100k gastos) repartidos en
+LOCUST_DATA_MONTHS meses y mide, por volumen:
+
+- el listado filtrado por un mes (?month=YYYY-MM), que devuelve filas/meses
+- el listado sin filtro, que devuelve todas las filas
+
+Al terminar imprime latencia y tamaño de respuesta en función de las filas
+y lo guarda en reports/data_volume.json.
+
+Ejecución (desde el directorio 'pruebas'):
+    # Una vez: crear las cuentas (100k gastos vía API tarda varios minutos)
+    python -m tests.performance.data_volume seed --host http://localhost:3000
+
+    locust -f tests/performance/data_volume.py --headless -u 30 -r 10 -t 3m \\
+        --host http://localhost:3000
+
+Si el archivo de cuentas no existe o no coincide con los volúmenes
+configurados, el master crea las que falten en events.test_start y las envía
+a los workers (mensaje 'data_volume'), igual que user_pool.py.
+"""
+from locust import User, HttpUser, FastHttpUser, task, between, events
+from locust.runners import MasterRunner, WorkerRunner
+import argparse
+import itertools
+import json
+import os
+import random
+import requests
+from datetime import date
+from config.config import config
+from utils.api_client import ApiClient
+from utils.data_generators import generator, unique_email, unique_title
+from utils.data_seeding import DataSeeder, build_expense
+from tests.performance import baseline  # noqa: F401 (escribe LOCUST_STATS_JSON)
+from tests.performance import latency_histograms  # noqa: F401 (histogramas por endpoint)
+
+FAST_HTTP = config.LOCUST_HTTP_CLIENT == 'fast'
+
+CATEGORIES = ['food', 'transport', 'health', 'entertainment', 'other']
+
+# Gastos creados por lote al pre-cargar (para mostrar el progreso)
+SEED_BATCH = 1000
+
+# Objetivo del proyecto: respuesta < 2 segundos
+TARGET_MS = 2000
+
+REPORT_FILE = os.path.join(config.REPORTS_DIR, 'data_volume.json')
+
+
+def parse_volumes(value):
+    """
+    Leer los volúmenes configurados
+
+    Args:
+        value: Texto '100,10000,100000'
+
+    Returns:
+        Lista ordenada de enteros sin repetir
+    """
+    return sorted({int(v) for v in value.split(',') if v.strip()})
+
+
+def month_list(months, today=None):
+    """
+    Meses (YYYY-MM) hacia atrás desde el actual
+
+    Args:
+        months: Número de meses
+        today: Fecha de referencia (default: hoy)
+
+    Returns:
+        Lista ['2026-10', '2026-09', ...]
+    """
+    today = today or date.today()
+    index = today.year * 12 + today.month - 1
+    return [f"{(index - i) // 12}-{(index - i) % 12 + 1:02d}" for i in range(months)]
+
+
+def build_expenses(rows, months):
+    """
+    Gastos repartidos por igual entre los meses (y entre los días 1-28)
+
+    Args:
+        rows: Número de gastos
+        months: Lista de meses YYYY-MM
+
+    Returns:
+        Generador de payloads para POST /api/expenses
+    """
+    for i in range(rows):
+        month = months[i % len(months)]
+        day = (i // len(months)) % 28 + 1
+        yield build_expense(
+            unique_title('Volumen'),
+            amount=generator.amount(),
+            category=CATEGORIES[i % len(CATEGORIES)],
+            expense_date=f"{month}-{day:02d}",
+        )
+
+
+def seed_account(rows, months, host=None):
+    """
+    Registrar una cuenta y cargarle 'rows' gastos
+
+    Args:
+        rows: Número de gastos
+        months: Número de meses en que se reparten
+        host: URL del backend (default: config.API_URL)
+
+    Returns:
+        Dict con rows, months, seeded_months (meses YYYY-MM con gastos),
+        email, password, token y user_id
+    """
+    email = unique_email('volume')
+    password = config.TEST_USER_PASSWORD
+    client = ApiClient(base_url=host)
+    client.register(email, password)
+    data = client.login(email, password)
+
+    seeder = DataSeeder(data['token'], base_url=host)
+    seeded_months = month_list(months)
+    expenses = build_expenses(rows, seeded_months)
+    created = 0
+    while created < rows:
+        batch = list(itertools.islice(expenses, SEED_BATCH))
+        seeder.seed_expenses(batch)
+        created += len(batch)
+        print(f"  {created}/{rows} gastos")
+
+    return {
+        'rows': rows,
+        'months': months,
+        'seeded_months': seeded_months,
+        'email': email,
+        'password': password,
+        'token': data['token'],
+        'user_id': data['user']['id'],
+    }
+
+
+def load_accounts(path=None):
+    """
+    Leer las cuentas pre-cargadas
+
+    Returns:
+        Lista de cuentas (vacía si el archivo no existe)
+    """
+    path = path or config.LOCUST_DATA_VOLUME_FILE
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return []
+
+
+def save_accounts(accounts, path=None):
+    """Guardar las cuentas pre-cargadas"""
+    path = path or config.LOCUST_DATA_VOLUME_FILE
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(accounts, f, indent=2)
+
+
+def refresh_account(account, host=None):
+    """
+    Comprobar que la cuenta sigue existiendo y renovar su token si caducó
+
+    El JWT dura 7 días; si ya no se acepta se inicia sesión otra vez con el
+    email y la contraseña guardados (los gastos siguen ahí).
+
+    Returns:
+        True si la cuenta se puede usar (con el token actualizado en 'account')
+    """
+    try:
+        ApiClient(base_url=host, token=account['token']).me()
+        return True
+    except requests.RequestException:
+        pass
+    try:
+        account['token'] = ApiClient(base_url=host).login(account['email'], account['password'])['token']
+        return True
+    except requests.RequestException:
+        return False
+
+
+def ensure_accounts(volumes, months, host=None, path=None):
+    """
+    Reutilizar las cuentas del archivo y crear las que falten
+
+    Una cuenta se reutiliza si tiene el mismo volumen y número de meses, se
+    guardaron sus meses con gastos y se puede iniciar sesión con ella.
+
+    Returns:
+        Lista de cuentas, una por volumen, ordenada por filas
+    """
+    stored = load_accounts(path)
+    tokens = [account['token'] for account in stored]
+    existing = {
+        account['rows']: account for account in stored
+        if account['months'] == months and account.get('seeded_months')
+        and refresh_account(account, host)
+    }
+    # Guardar los tokens renovados
+    if tokens != [account['token'] for account in stored]:
+        save_accounts(sorted(existing.values(), key=lambda a: a['rows']), path)
+    for rows in volumes:
+        if rows not in existing:
+            print(f"Pre-cargando una cuenta con {rows} gastos en {months} meses...")
+            existing[rows] = seed_account(rows, months, host)
+            save_accounts(sorted(existing.values(), key=lambda a: a['rows']), path)
+    return [existing[rows] for rows in volumes]
+
+
+# Cuentas del proceso, asignadas en round-robin a los usuarios simulados
+accounts = []
+_cycle = None
+
+
+def set_accounts(new_accounts):
+    """Reemplazar las cuentas disponibles para los usuarios simulados"""
+    global accounts, _cycle
+    accounts = list(new_accounts)
+    _cycle = itertools.cycle(accounts) if accounts else None
+
+
+def list_name(rows, filtered):
+    """Nombre de la estadística de Locust para un volumen y tipo de listado"""
+    path = '/api/expenses?month' if filtered else '/api/expenses'
+    return f"{path} [{rows} filas]"
+
+
+class DataVolumeTasks(User):
+    """Usuario que lista los gastos de una cuenta con muchas filas"""
+    abstract = True
+    wait_time = between(0.5, 1.5)
+    account = None
+    headers = None
+
+    def on_start(self):
+        """Tomar la siguiente cuenta pre-cargada (reparte los usuarios entre volúmenes)"""
+        if _cycle is None:
+            raise RuntimeError("No hay cuentas pre-cargadas para el escenario de volumen")
+        self.account = next(_cycle)
+        self.headers = {"Authorization": f"Bearer {self.account['token']}"}
+
+    def _list(self, filtered):
+        params = {"month": random.choice(self.account['seeded_months'])} if filtered else None
+        with self.client.get("/api/expenses",
+                             params=params,
+                             headers=self.headers,
+                             name=list_name(self.account['rows'], filtered),
+                             catch_response=True) as response:
+            if response.status_code == 200:
+                response.success()
+            else:
+                response.failure(f"Error al obtener gastos: {response.status_code}")
+
+    @task(3)
+    def list_month(self):
+        """Listado de un mes: lo que pide la pantalla de gastos"""
+        self._list(filtered=True)
+
+    @task(1)
+    def list_all(self):
+        """Listado completo sin filtro"""
+        self._list(filtered=False)
+
+
+class DataVolumeUser(DataVolumeTasks, HttpUser):
+    """Escenario de volumen sobre python-requests"""
+    abstract = FAST_HTTP
+
+
+class FastDataVolumeUser(DataVolumeTasks, FastHttpUser):
+    """Escenario de volumen sobre FastHttpUser (LOCUST_HTTP_CLIENT=fast)"""
+    abstract = not FAST_HTTP
+
+
+def volume_report(stats, volume_accounts):
+    """
+    Latencia y tamaño de respuesta por volumen
+
+    Args:
+        stats: environment.stats
+        volume_accounts: Cuentas del escenario
+
+    Returns:
+        Lista de dicts con rows, filtered, returned_rows, requests, failures,
+        p50, p95, p99, avg_bytes y bytes_per_row
+    """
+    report = []
+    for account in volume_accounts:
+        for filtered in (True, False):
+            entry = stats.entries.get((list_name(account['rows'], filtered), 'GET'))
+            if entry is None or not entry.num_requests:
+                continue
+            returned = account['rows'] / len(account['seeded_months']) if filtered else account['rows']
+            report.append({
+                'rows': account['rows'],
+                'filtered': filtered,
+                'returned_rows': round(returned),
+                'requests': entry.num_requests,
+                'failures': entry.num_failures,
+                'p50': entry.get_response_time_percentile(0.50),
+                'p95': entry.get_response_time_percentile(0.95),
+                'p99': entry.get_response_time_percentile(0.99),
+                'avg_bytes': entry.avg_content_length,
+                'bytes_per_row': entry.avg_content_length / returned if returned else 0.0,
+            })
+    return report
+
+
+def print_report(report):
+    """Imprimir la tabla de latencia y tamaño por volumen"""
+    print("\n" + "=" * 60)
+    print("VOLUMEN DE DATOS: GET /api/expenses")
+    print("=" * 60)
+    print(f"{'Filas':>7} {'Listado':<8} {'Devueltas':>9} {'p50':>6} {'p95':>6} {'p99':>6} "
+          f"{'KB':>9} {'B/fila':>7}")
+    for r in report:
+        mark = "✗" if r['p95'] > TARGET_MS else " "
+        print(f"{r['rows']:>7} {'mes' if r['filtered'] else 'todo':<8} {r['returned_rows']:>9} "
+              f"{r['p50']:>6.0f} {r['p95']:>6.0f} {r['p99']:>6.0f} {r['avg_bytes'] / 1024:>9.1f} "
+              f"{r['bytes_per_row']:>7.0f} {mark}")
+    if any(r['p95'] > TARGET_MS for r in report):
+        print(f"✗ p95 por encima de {TARGET_MS} ms en los volúmenes marcados")
+    print(f"Resultados en {REPORT_FILE}")
+    print("=" * 60 + "\n")
+
+
+def on_accounts_message(environment, msg, **kwargs):
+    """Recibir en el worker las cuentas que envía el master"""
+    set_accounts(msg.data)
+
+
+@events.init.add_listener
+def on_locust_init(environment, **kwargs):
+    """Registrar en los workers el mensaje con las cuentas"""
+    if isinstance(environment.runner, WorkerRunner):
+        environment.runner.register_message('data_volume', on_accounts_message)
+
+
+@events.test_start.add_listener
+def on_test_start(environment, **kwargs):
+    """Pre-cargar (o reutilizar) las cuentas antes de lanzar usuarios"""
+    if isinstance(environment.runner, WorkerRunner):
+        if not accounts:
+            set_accounts(load_accounts())
+        return
+
+    set_accounts(ensure_accounts(parse_volumes(config.LOCUST_DATA_VOLUMES),
+                                 config.LOCUST_DATA_MONTHS, environment.host))
+    if isinstance(environment.runner, MasterRunner):
+        environment.runner.send_message('data_volume', accounts)
+
+
+@events.test_stop.add_listener
+def on_test_stop(environment, **kwargs):
+    """Imprimir y guardar la tabla por volumen"""
+    if isinstance(environment.runner, WorkerRunner):
+        return
+    report = volume_report(environment.stats, accounts)
+    if not report:
+        return
+    with open(REPORT_FILE, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print_report(report)
+
+
+def main():
+    """CLI para pre-cargar o limpiar las cuentas del escenario"""
+    parser = argparse.ArgumentParser(description='Cuentas con muchos gastos para el escenario de volumen')
+    parser.add_argument('action', choices=['seed', 'clean'],
+                        help='seed: crear las cuentas que falten; clean: borrar sus gastos')
+    parser.add_argument('--volumes', default=config.LOCUST_DATA_VOLUMES,
+                        help='Gastos por cuenta, separados por comas')
+    parser.add_argument('--months', type=int, default=config.LOCUST_DATA_MONTHS,
+                        help='Meses en que se reparten los gastos')
+    parser.add_argument('--host', default=config.API_URL, help='URL del backend')
+    parser.add_argument('--output', default=config.LOCUST_DATA_VOLUME_FILE,
+                        help='Archivo JSON de cuentas')
+    args = parser.parse_args()
+
+    if args.action == 'seed':
+        seeded = ensure_accounts(parse_volumes(args.volumes), args.months, args.host, args.output)
+        print(f"✓ {len(seeded)} cuentas guardadas en {args.output}")
+        return
+
+    for account in load_accounts(args.output):
+        DataSeeder(account['token'], base_url=args.host).delete_all()
+        print(f"✓ Gastos de la cuenta de {account['rows']} filas eliminados")
+    save_accounts([], args.output)
+
+
+if __name__ == '__main__':
+    main()
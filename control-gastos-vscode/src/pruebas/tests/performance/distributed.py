@@ -0,0 +1,207 @@
+"""
+Lanzador distribuido de Locust: un master y un worker por núcleo
+
+Un solo proceso de Locust usa un único núcleo, así que el generador de
+carga se satura antes que el backend. Este lanzador arranca un master
+headless y N workers locales, espera a que termine la prueba, imprime el
+resumen agregado por el master y devuelve su código de salida (1 si se
+incumple algún SLA).
+
+Ejecución (desde el directorio 'pruebas'):
+    python -m tests.performance.distributed --workers 4 --run-time 2m \\
+        --html reports/performance_report.html
+
+Los argumentos que no reconoce se pasan al master (p. ej. nombres de
+clases de usuario o --only-summary). El pool de usuarios lo crea el master
+y lo envía a los workers (ver user_pool.py). Con Ctrl-C el master se
+detiene de forma ordenada (genera sus reportes) y después se cierran los
+workers.
+"""
+import argparse
+import csv
+import os
+import signal
+import subprocess
+import sys
+from datetime import datetime
+from config.config import config
+
+# Segundos para que el master/workers terminen antes de forzar su cierre
+SHUTDOWN_TIMEOUT = 30
+
+
+def worker_count(requested=None):
+    """
+    Número de workers a lanzar
+
+    Args:
+        requested: Workers pedidos; 0 o None = uno por núcleo (config.LOCUST_WORKERS)
+
+    Returns:
+        Entero >= 1
+    """
+    requested = config.LOCUST_WORKERS if requested is None else requested
+    return requested if requested > 0 else (os.cpu_count() or 1)
+
+
+def master_command(args, extra):
+    """Línea de comandos del master"""
+    command = [
+        sys.executable, '-m', 'locust', '-f', args.locustfile,
+        '--master', '--headless',
+        '--master-bind-port', str(args.master_port),
+        '--expect-workers', str(args.workers),
+        '--expect-workers-max-wait', str(SHUTDOWN_TIMEOUT * 2),
+        '--host', args.host,
+        '--users', str(args.users),
+        '--spawn-rate', str(args.spawn_rate),
+        '--run-time', args.run_time,
+        '--csv', args.csv,
+    ]
+    if args.html:
+        command += ['--html', args.html]
+    return command + extra
+
+
+def worker_command(args, index):
+    """Línea de comandos de un worker (su log va a reports/locust_workers/)"""
+    logfile = os.path.join(config.REPORTS_DIR, 'locust_workers', f"worker_{index}.log")
+    os.makedirs(os.path.dirname(logfile), exist_ok=True)
+    return [
+        sys.executable, '-m', 'locust', '-f', args.locustfile,
+        '--worker',
+        '--master-host', '127.0.0.1',
+        '--master-port', str(args.master_port),
+        '--logfile', logfile,
+    ]
+
+
+def worker_env():
+    """
+    Entorno de los workers
+
+    Locust también lee LOCUST_RUN_TIME del entorno y un worker se niega a
+    arrancar con --run-time; la duración solo la controla el master. Se
+    deja vacía en vez de quitarla: si no existe, load_dotenv la vuelve a
+    cargar desde config/.env al importar config (no pisa las que existen).
+    """
+    env = dict(os.environ)
+    env['LOCUST_RUN_TIME'] = ''
+    return env
+
+
+def _raise_interrupt(signum, frame):
+    """Tratar SIGTERM (p. ej. cancelación en CI) igual que Ctrl-C"""
+    raise KeyboardInterrupt
+
+
+def _stop(process, sig=signal.SIGTERM):
+    """Enviar una señal y esperar; si no termina a tiempo, matar el proceso"""
+    if process.poll() is not None:
+        return process.returncode
+    process.send_signal(sig)
+    try:
+        return process.wait(timeout=SHUTDOWN_TIMEOUT)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        return process.wait()
+
+
+def print_summary(csv_prefix, workers):
+    """Imprimir las estadísticas agregadas por el master (CSV de Locust)"""
+    try:
+        with open(f"{csv_prefix}_stats.csv", encoding='utf-8') as f:
+            rows = list(csv.DictReader(f))
+    except OSError:
+        print(f"✗ No se encontraron estadísticas en {csv_prefix}_stats.csv")
+        return
+
+    print("\n" + "=" * 60)
+    print(f"RESUMEN DISTRIBUIDO ({workers} workers)")
+    print("=" * 60)
+    print(f"{'Endpoint':<35} {'Peticiones':>10} {'Fallos':>7} {'RPS':>8} {'p95 ms':>7}")
+    for row in rows:
+        name = f"{row['Type']} {row['Name']}".strip()
+        print(f"{name:<35} {row['Request Count']:>10} {row['Failure Count']:>7} "
+              f"{float(row['Requests/s']):>8.1f} {row['95%']:>7}")
+    print(f"CSV en {csv_prefix}_stats.csv")
+    print("=" * 60 + "\n")
+
+
+def run(args, extra):
+    """
+    Lanzar master y workers y esperar a que termine la prueba
+
+    Returns:
+        Código de salida del master
+    """
+    # Sesiones propias: el Ctrl-C de la terminal solo llega a este proceso,
+    # que detiene primero al master y después a los workers
+    master = subprocess.Popen(master_command(args, extra), cwd=config.BASE_DIR,
+                              start_new_session=True)
+    workers = [
+        subprocess.Popen(worker_command(args, i), cwd=config.BASE_DIR, env=worker_env(),
+                         stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                         start_new_session=True)
+        for i in range(args.workers)
+    ]
+    print(f"✓ Master y {len(workers)} workers iniciados (logs en reports/locust_workers/)")
+
+    try:
+        exit_code = master.wait()
+    except KeyboardInterrupt:
+        print("\nDeteniendo la prueba (Ctrl-C de nuevo para forzar)...")
+        try:
+            exit_code = _stop(master)
+        except KeyboardInterrupt:
+            master.kill()
+            exit_code = master.wait()
+    finally:
+        # El master ordena a los workers salir; los que sigan vivos se cierran aquí
+        for worker in workers:
+            try:
+                _stop(worker)
+            except KeyboardInterrupt:
+                worker.kill()
+
+    return exit_code
+
+
+def main():
+    """CLI del lanzador distribuido"""
+    parser = argparse.ArgumentParser(
+        description='Ejecutar Locust con un master y varios workers',
+        epilog='Los argumentos no reconocidos se pasan al master de Locust.')
+    parser.add_argument('-f', '--locustfile', default='tests/performance/locustfile.py',
+                        help='Archivo de Locust')
+    parser.add_argument('--workers', type=int, default=config.LOCUST_WORKERS,
+                        help='Número de workers (0 = uno por núcleo)')
+    parser.add_argument('--host', default=config.API_URL, help='URL del backend')
+    parser.add_argument('-u', '--users', type=int, default=config.LOCUST_USERS, help='Usuarios totales')
+    parser.add_argument('-r', '--spawn-rate', type=float, default=config.LOCUST_SPAWN_RATE,
+                        help='Usuarios por segundo')
+    parser.add_argument('-t', '--run-time', default=config.LOCUST_RUN_TIME, help='Duración (2m, 1h...)')
+    parser.add_argument('--html', help='Reporte HTML del master')
+    parser.add_argument('--csv', help='Prefijo de los CSV (default: reports/distributed_<fecha>)')
+    parser.add_argument('--master-port', type=int, default=config.LOCUST_MASTER_PORT,
+                        help='Puerto del master')
+    args, extra = parser.parse_known_args()
+
+    args.workers = worker_count(args.workers)
+    if not args.csv:
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        args.csv = os.path.join(config.REPORTS_DIR, f"distributed_{timestamp}")
+    # El master corre en el directorio 'pruebas': rutas absolutas
+    args.csv = os.path.abspath(args.csv)
+    args.html = args.html and os.path.abspath(args.html)
+    os.makedirs(os.path.dirname(args.csv), exist_ok=True)
+
+    signal.signal(signal.SIGTERM, _raise_interrupt)
+    exit_code = run(args, extra)
+
+    print_summary(args.csv, args.workers)
+    sys.exit(exit_code)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,333 @@
+"""
+Histogramas de latencia por endpoint (estilo HDR) exportados por intervalos
+
+Locust agrupa los tiempos en buckets gruesos (10 ms por encima de 100 ms,
+100 ms por encima de 1 s) y los CSV solo guardan resúmenes, así que los
+cambios en la cola (p99.9) no se ven. Aquí cada petición de events.request
+se registra en un histograma log-lineal por endpoint:
+
+- Memoria acotada: como mucho unos pocos miles de buckets por endpoint,
+  sin importar cuánto dure la prueba.
+- Precisión: 2 cifras significativas (error relativo < 1%) desde 1 µs
+  hasta horas.
+- Se pueden sumar: los workers envían su intervalo al master en cada
+  reporte (events.report_to_master) y el master los combina.
+
+Cada LOCUST_HDR_INTERVAL segundos el master (o el proceso local) añade una
+línea JSON por endpoint a LOCUST_HDR_FILE con el histograma del intervalo.
+Al terminar imprime p50/p99/p99.9/máx y guarda el acumulado en
+'<LOCUST_HDR_FILE>.summary.json'.
+
+Combinar archivos de varias ejecuciones (desde el directorio 'pruebas'):
+    python -m tests.performance.latency_histograms reports/latency_hdr.jsonl otro.jsonl
+
+No se usa la librería hdrhistogram para no añadir una dependencia: el
+esquema de buckets es el mismo (sub-buckets lineales dentro de potencias de 2).
+"""
+from locust import events
+from locust.runners import MasterRunner, WorkerRunner
+import argparse
+import json
+import os
+import time
+import gevent
+from config.config import config
+
+# Percentiles que se muestran en el resumen
+SUMMARY_PERCENTILES = (50, 90, 99, 99.9)
+
+
+class LatencyHistogram:
+    """
+    Histograma log-lineal de latencias en microsegundos
+
+    Los valores menores que SUB_BUCKETS se guardan exactos; por encima, cada
+    potencia de 2 se divide en SUB_BUCKETS / 2 buckets lineales, lo que da
+    2 cifras significativas (256 sub-buckets > 2 * 10^2).
+    """
+    SUB_BUCKET_BITS = 8
+    SUB_BUCKETS = 1 << SUB_BUCKET_BITS
+    HALF = SUB_BUCKETS // 2
+
+    def __init__(self, counts=None):
+        """
+        Args:
+            counts: Dict {índice de bucket: peticiones} (p. ej. de from_dict)
+        """
+        self.counts = dict(counts or {})
+        self.total = sum(self.counts.values())
+
+    @classmethod
+    def bucket_index(cls, value):
+        """Índice del bucket de un valor entero (µs)"""
+        if value < cls.SUB_BUCKETS:
+            return value
+        shift = value.bit_length() - cls.SUB_BUCKET_BITS
+        return shift * cls.HALF + (value >> shift)
+
+    @classmethod
+    def bucket_value(cls, index):
+        """Valor representativo (punto medio) de un bucket"""
+        if index < cls.SUB_BUCKETS:
+            return index
+        shift = index // cls.HALF - 1
+        sub_bucket = index - shift * cls.HALF
+        return (sub_bucket << shift) + (1 << shift) // 2
+
+    def record(self, value_us, count=1):
+        """Registrar una latencia en microsegundos"""
+        index = self.bucket_index(max(int(value_us), 0))
+        self.counts[index] = self.counts.get(index, 0) + count
+        self.total += count
+
+    def merge(self, other):
+        """Sumar otro histograma a este"""
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        self.total += other.total
+        return self
+
+    def percentile(self, percent):
+        """
+        Latencia (µs) por debajo de la cual está 'percent'% de las peticiones
+
+        Returns:
+            Valor en µs, o None si el histograma está vacío
+        """
+        if not self.total:
+            return None
+        target = max(1, round(self.total * percent / 100))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= target:
+                return self.bucket_value(index)
+        return self.max()
+
+    def max(self):
+        """Mayor latencia registrada (µs, precisión del bucket)"""
+        return self.bucket_value(max(self.counts)) if self.counts else None
+
+    def to_dict(self):
+        """Representación compacta para JSON: [[índice, peticiones], ...]"""
+        return sorted(self.counts.items())
+
+    @classmethod
+    def from_dict(cls, data):
+        """Reconstruir un histograma desde to_dict()"""
+        return cls({int(index): count for index, count in data})
+
+    def __len__(self):
+        return self.total
+
+
+class LatencyRecorder:
+    """Histogramas por endpoint: intervalo en curso y acumulado de la prueba"""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """Vaciar todos los histogramas (al empezar una prueba)"""
+        self.interval = {}
+        self.cumulative = {}
+        self.interval_started = time.time()
+
+    def record(self, key, response_time_ms):
+        """Registrar una petición ('MÉTODO nombre', tiempo en ms)"""
+        histogram = self.interval.get(key)
+        if histogram is None:
+            histogram = self.interval[key] = LatencyHistogram()
+        histogram.record(response_time_ms * 1000)
+
+    def take_interval(self):
+        """Sacar el intervalo en curso serializado (para enviarlo al master)"""
+        interval, self.interval = self.interval, {}
+        return {key: histogram.to_dict() for key, histogram in interval.items()}
+
+    def merge_interval(self, data):
+        """Sumar al intervalo en curso el de un worker"""
+        for key, counts in data.items():
+            histogram = self.interval.setdefault(key, LatencyHistogram())
+            histogram.merge(LatencyHistogram.from_dict(counts))
+
+    def flush(self, path):
+        """
+        Escribir el intervalo en curso (una línea por endpoint) y acumularlo
+
+        Args:
+            path: Archivo JSON lines
+        """
+        interval, self.interval = self.interval, {}
+        started, self.interval_started = self.interval_started, time.time()
+        if not interval:
+            return
+
+        with open(path, 'a', encoding='utf-8') as f:
+            for key, histogram in interval.items():
+                self.cumulative.setdefault(key, LatencyHistogram()).merge(histogram)
+                f.write(json.dumps({
+                    'start': started,
+                    'end': self.interval_started,
+                    'endpoint': key,
+                    'count': histogram.total,
+                    'counts': histogram.to_dict(),
+                }) + '\n')
+
+    def summary(self):
+        """Percentiles del acumulado por endpoint (en ms)"""
+        return summarize(self.cumulative)
+
+
+def summarize(histograms):
+    """
+    Percentiles por endpoint
+
+    Args:
+        histograms: Dict {endpoint: LatencyHistogram}
+
+    Returns:
+        Dict {endpoint: {'count', 'p50', 'p90', 'p99', 'p99.9', 'max'}} en ms
+    """
+    result = {}
+    for key in sorted(histograms):
+        histogram = histograms[key]
+        row = {'count': histogram.total}
+        for percent in SUMMARY_PERCENTILES:
+            row[f"p{percent:g}"] = histogram.percentile(percent) / 1000
+        row['max'] = histogram.max() / 1000
+        result[key] = row
+    return result
+
+
+def print_summary(summary):
+    """Imprimir la tabla de percentiles"""
+    print("\n" + "=" * 60)
+    print("LATENCIAS (HISTOGRAMAS HDR, ms)")
+    print("=" * 60)
+    print(f"{'Endpoint':<30} {'n':>8} {'p50':>7} {'p99':>7} {'p99.9':>7} {'máx':>7}")
+    for key, row in summary.items():
+        print(f"{key:<30} {row['count']:>8} {row['p50']:>7.1f} {row['p99']:>7.1f} "
+              f"{row['p99.9']:>7.1f} {row['max']:>7.1f}")
+    print("=" * 60 + "\n")
+
+
+def load_histograms(paths):
+    """
+    Combinar los intervalos de uno o varios archivos JSON lines
+
+    Returns:
+        Dict {endpoint: LatencyHistogram} con la suma de todos los intervalos
+    """
+    merged = {}
+    for path in paths:
+        with open(path, encoding='utf-8') as f:
+            for line in f:
+                data = json.loads(line)
+                histogram = LatencyHistogram.from_dict(data['counts'])
+                merged.setdefault(data['endpoint'], LatencyHistogram()).merge(histogram)
+    return merged
+
+
+# Histogramas del proceso (en los workers solo el intervalo hasta el siguiente reporte)
+recorder = LatencyRecorder()
+_flusher = None
+
+
+def _summary_path():
+    return f"{os.path.splitext(config.LOCUST_HDR_FILE)[0]}.summary.json"
+
+
+def _flush_loop():
+    """Volcar un intervalo cada LOCUST_HDR_INTERVAL segundos"""
+    while True:
+        gevent.sleep(config.LOCUST_HDR_INTERVAL)
+        recorder.flush(config.LOCUST_HDR_FILE)
+
+
+def _write_summary():
+    """Volcar lo pendiente, guardar el resumen e imprimirlo"""
+    recorder.flush(config.LOCUST_HDR_FILE)
+    summary = recorder.summary()
+    if not summary:
+        return
+    data = {key: {**row, 'counts': recorder.cumulative[key].to_dict()} for key, row in summary.items()}
+    with open(_summary_path(), 'w', encoding='utf-8') as f:
+        json.dump(data, f)
+    print_summary(summary)
+
+
+@events.request.add_listener
+def on_request(request_type, name, response_time, exception=None, **kwargs):
+    """Registrar cada petición en el histograma de su endpoint"""
+    if config.LOCUST_HDR and response_time is not None:
+        recorder.record(f"{request_type} {name}", response_time)
+
+
+@events.init.add_listener
+def on_locust_init(environment, **kwargs):
+    """En modo distribuido, combinar en el master los intervalos de los workers"""
+    if not config.LOCUST_HDR:
+        return
+    if isinstance(environment.runner, MasterRunner):
+        @environment.events.worker_report.add_listener
+        def on_worker_report(client_id, data, **kw):
+            if 'hdr' in data:
+                recorder.merge_interval(data['hdr'])
+
+    elif isinstance(environment.runner, WorkerRunner):
+        @environment.events.report_to_master.add_listener
+        def on_report_to_master(client_id, data, **kw):
+            data['hdr'] = recorder.take_interval()
+
+
+@events.test_start.add_listener
+def on_test_start(environment, **kwargs):
+    """Empezar un archivo nuevo y el volcado periódico (master o proceso local)"""
+    global _flusher
+    recorder.reset()
+    if not config.LOCUST_HDR or isinstance(environment.runner, WorkerRunner):
+        return
+
+    os.makedirs(os.path.dirname(os.path.abspath(config.LOCUST_HDR_FILE)), exist_ok=True)
+    open(config.LOCUST_HDR_FILE, 'w').close()
+    if _flusher is None or _flusher.dead:
+        _flusher = gevent.spawn(_flush_loop)
+
+
+@events.test_stop.add_listener
+def on_test_stop(environment, **kwargs):
+    """Último volcado y resumen (en el master, al salir)"""
+    global _flusher
+    if not config.LOCUST_HDR or isinstance(environment.runner, WorkerRunner):
+        return
+    if _flusher is not None:
+        _flusher.kill(block=False)
+        _flusher = None
+    if not isinstance(environment.runner, MasterRunner):
+        _write_summary()
+
+
+@events.quitting.add_listener
+def on_quitting(environment, **kwargs):
+    """En el master los últimos reportes de los workers llegan después de test_stop"""
+    if config.LOCUST_HDR and isinstance(environment.runner, MasterRunner):
+        _write_summary()
+
+
+def main():
+    """CLI para combinar archivos de intervalos y mostrar los percentiles"""
+    parser = argparse.ArgumentParser(description='Combinar histogramas de latencia (JSON lines)')
+    parser.add_argument('paths', nargs='+', help='Archivos escritos en LOCUST_HDR_FILE')
+    parser.add_argument('--json', action='store_true', help='Imprimir el resumen en JSON')
+    args = parser.parse_args()
+
+    summary = summarize(load_histograms(args.paths))
+    if args.json:
+        print(json.dumps(summary, indent=2))
+    else:
+        print_summary(summary)
+
+
+if __name__ == '__main__':
+    main()
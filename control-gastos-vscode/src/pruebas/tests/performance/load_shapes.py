@@ -0,0 +1,236 @@
+"""
+Formas de carga (LoadTestShape) seleccionables por nombre
+
+LOCUST_SHAPE elige una de estas formas; el resto quedan abstractas y
+Locust no las ve. Todas terminan la prueba tras LOCUST_RUN_TIME y escalan
+sobre LOCUST_USERS / LOCUST_SPAWN_RATE:
+
+    step      LOCUST_USERS en LOCUST_STEP_COUNT escalones de LOCUST_STEP_TIME
+              segundos, para encontrar el punto donde la latencia se dispara
+    spike     LOCUST_USERS, y a los LOCUST_SPIKE_AT segundos x LOCUST_SPIKE_FACTOR
+              durante LOCUST_SPIKE_DURATION segundos; después mide la recuperación
+    soak      LOCUST_USERS constantes durante horas, con un snapshot de
+              estadísticas cada LOCUST_SNAPSHOT_INTERVAL segundos
+    diurnal   Curva de un día (valle -> pico -> valle) comprimida en
+              LOCUST_DIURNAL_PERIOD
+
+Ejemplo (desde el directorio 'pruebas'):
+    LOCUST_SHAPE=soak LOCUST_RUN_TIME=4h LOCUST_BACKEND_PID=$(pgrep -of "node server") \\
+        locust -f tests/performance/locustfile.py --headless --host http://localhost:3000
+
+En modo 'open' (arrival_rate.py) las formas solo lanzan las clases de
+llegada constante; cada usuario aporta LOCUST_TARGET_RPS / LOCUST_USERS, así
+que la forma escala el RPS en lugar de la concurrencia.
+"""
+from locust import LoadTestShape, events
+from locust.runners import WorkerRunner
+from locust.stats import calculate_response_time_percentile, diff_response_time_dicts
+from locust.util.timespan import parse_timespan
+from abc import abstractmethod
+import json
+import math
+import os
+import time
+from config.config import config
+from tests.performance.arrival_rate import OPEN_LOOP_CLASSES, is_open_mode
+
+
+class ConfigShape(LoadTestShape):
+    """Base de las formas: duración, clases de usuario y selección por nombre"""
+    abstract = True
+    name = None
+
+    def run_time_limit(self):
+        """Duración total de la prueba en segundos (LOCUST_RUN_TIME)"""
+        return parse_timespan(config.LOCUST_RUN_TIME)
+
+    @abstractmethod
+    def users_at(self, run_time):
+        """
+        Usuarios objetivo en un instante
+
+        Args:
+            run_time: Segundos desde el inicio de la prueba
+
+        Returns:
+            Tupla (usuarios, spawn_rate)
+        """
+
+    def tick(self):
+        run_time = self.get_run_time()
+        if run_time > self.run_time_limit():
+            return None
+
+        users, spawn_rate = self.users_at(run_time)
+        if is_open_mode():
+            return users, spawn_rate, OPEN_LOOP_CLASSES
+        return users, spawn_rate
+
+
+class StepLoadShape(ConfigShape):
+    """Escalones iguales hasta LOCUST_USERS; luego se mantiene el máximo"""
+    name = 'step'
+    abstract = config.LOCUST_SHAPE != name
+
+    def users_at(self, run_time):
+        steps = max(config.LOCUST_STEP_COUNT, 1)
+        step = min(int(run_time // config.LOCUST_STEP_TIME) + 1, steps)
+        users = math.ceil(config.LOCUST_USERS * step / steps)
+        return users, config.LOCUST_SPAWN_RATE
+
+
+class SpikeLoadShape(ConfigShape):
+    """Carga base con un pico de LOCUST_SPIKE_FACTOR veces los usuarios"""
+    name = 'spike'
+    abstract = config.LOCUST_SHAPE != name
+
+    def users_at(self, run_time):
+        base = config.LOCUST_USERS
+        start = config.LOCUST_SPIKE_AT
+        if start <= run_time < start + config.LOCUST_SPIKE_DURATION:
+            peak = base * config.LOCUST_SPIKE_FACTOR
+            # Todos los usuarios del pico en un segundo: debe ser un golpe, no una rampa
+            return peak, peak
+        return base, max(config.LOCUST_SPAWN_RATE, base)
+
+
+class SoakLoadShape(ConfigShape):
+    """
+    Carga constante de larga duración con snapshots periódicos
+
+    Cada snapshot (una línea JSON en LOCUST_SNAPSHOT_FILE) guarda los
+    percentiles del intervalo (no los acumulados, que esconden la deriva),
+    el RPS y los fallos por endpoint, y la memoria RSS del backend si se
+    configuró LOCUST_BACKEND_PID.
+    """
+    name = 'soak'
+    abstract = config.LOCUST_SHAPE != name
+
+    def __init__(self):
+        super().__init__()
+        self.snapshots = []
+        self._last_snapshot = 0.0
+        self._previous = {}
+
+    def reset_time(self):
+        super().reset_time()
+        self.snapshots = []
+        self._last_snapshot = 0.0
+        self._previous = {}
+
+    def users_at(self, run_time):
+        if run_time - self._last_snapshot >= config.LOCUST_SNAPSHOT_INTERVAL:
+            self._last_snapshot = run_time
+            self.take_snapshot(run_time)
+        return config.LOCUST_USERS, config.LOCUST_SPAWN_RATE
+
+    def take_snapshot(self, run_time):
+        """Guardar las estadísticas del último intervalo"""
+        stats = self.runner.stats
+        endpoints = {}
+
+        for (name, method), entry in [(('Aggregated', ''), stats.total), *stats.entries.items()]:
+            key = f"{method} {name}".strip()
+            prev_times, prev_requests, prev_failures = self._previous.get(
+                key, ({}, 0, 0))
+            response_times = diff_response_time_dicts(entry.response_times, prev_times)
+            requests = entry.num_requests - prev_requests
+            failures = entry.num_failures - prev_failures
+            self._previous[key] = (dict(entry.response_times), entry.num_requests, entry.num_failures)
+
+            if requests <= 0:
+                continue
+            endpoints[key] = {
+                'requests': requests,
+                'failures': failures,
+                'rps': requests / config.LOCUST_SNAPSHOT_INTERVAL,
+                'p50': calculate_response_time_percentile(response_times, requests, 0.50),
+                'p95': calculate_response_time_percentile(response_times, requests, 0.95),
+                'p99': calculate_response_time_percentile(response_times, requests, 0.99),
+            }
+
+        snapshot = {
+            'timestamp': time.time(),
+            'run_time': round(run_time),
+            'users': self.runner.user_count,
+            'backend_rss_kb': backend_rss_kb(),
+            'endpoints': endpoints,
+        }
+        self.snapshots.append(snapshot)
+
+        os.makedirs(os.path.dirname(config.LOCUST_SNAPSHOT_FILE), exist_ok=True)
+        with open(config.LOCUST_SNAPSHOT_FILE, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(snapshot) + '\n')
+
+    def print_drift(self):
+        """Comparar el primer y el último snapshot (latencia y memoria del backend)"""
+        # El primero incluye el calentamiento: se compara desde el segundo si lo hay
+        snapshots = self.snapshots[1:] if len(self.snapshots) > 2 else self.snapshots
+        if len(snapshots) < 2:
+            return
+
+        first, last = snapshots[0], snapshots[-1]
+        print("\n" + "=" * 60)
+        print(f"DERIVA DE LA PRUEBA SOAK ({first['run_time']}s -> {last['run_time']}s)")
+        print("=" * 60)
+        for key, after in last['endpoints'].items():
+            before = first['endpoints'].get(key)
+            if before:
+                print(f"{key:<35} p95 {before['p95']:>6} -> {after['p95']:>6} ms   "
+                      f"rps {before['rps']:>7.2f} -> {after['rps']:>7.2f}")
+        if first['backend_rss_kb'] and last['backend_rss_kb']:
+            print(f"Memoria del backend: {first['backend_rss_kb']} -> {last['backend_rss_kb']} KB")
+        print(f"Snapshots en {config.LOCUST_SNAPSHOT_FILE}")
+        print("=" * 60 + "\n")
+
+
+class DiurnalLoadShape(ConfigShape):
+    """Curva coseno entre LOCUST_DIURNAL_MIN_USERS y LOCUST_USERS"""
+    name = 'diurnal'
+    abstract = config.LOCUST_SHAPE != name
+
+    def users_at(self, run_time):
+        period = parse_timespan(config.LOCUST_DIURNAL_PERIOD or config.LOCUST_RUN_TIME)
+        low, high = config.LOCUST_DIURNAL_MIN_USERS, config.LOCUST_USERS
+        # Empieza en el valle (madrugada), pico a mitad del periodo
+        level = (1 - math.cos(2 * math.pi * run_time / period)) / 2
+        return round(low + (high - low) * level), config.LOCUST_SPAWN_RATE
+
+
+SHAPES = {cls.name: cls for cls in (StepLoadShape, SpikeLoadShape, SoakLoadShape, DiurnalLoadShape)}
+
+if config.LOCUST_SHAPE and config.LOCUST_SHAPE not in SHAPES:
+    raise ValueError(f"LOCUST_SHAPE desconocida: '{config.LOCUST_SHAPE}' "
+                     f"(disponibles: {', '.join(SHAPES)})")
+
+
+def backend_rss_kb(pid=None):
+    """
+    Memoria residente del proceso del backend (solo Linux, mismo host)
+
+    Args:
+        pid: PID del backend (default: config.LOCUST_BACKEND_PID)
+
+    Returns:
+        KB de VmRSS, o None si no se configuró o no se puede leer
+    """
+    pid = pid or config.LOCUST_BACKEND_PID
+    if not pid:
+        return None
+    try:
+        with open(f"/proc/{pid}/status", encoding='utf-8') as f:
+            for line in f:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+
+@events.test_stop.add_listener
+def on_test_stop(environment, **kwargs):
+    """Resumen de deriva al terminar una prueba soak"""
+    if isinstance(environment.runner, WorkerRunner):
+        return
+    if isinstance(environment.shape_class, SoakLoadShape):
+        environment.shape_class.print_drift()
@@ -2,44 +2,71 @@
 Pruebas de rendimiento con Locust
 Basadas en los ejemplos del PDF de Locust + Python
 
-Ejecución:
-    locust -f locustfile.py --host http://localhost:3000
+Ejecución (desde el directorio 'pruebas'):
+    locust -f tests/performance/locustfile.py --host http://localhost:3000
     Luego abrir http://localhost:8089
+
+Con LOCUST_LOAD_MODE=open se ejecuta OpenLoopExpenseTrackingUser: las mismas
+tareas a tasa de llegada constante (ver arrival_rate.py).
+
+Con LOCUST_HTTP_CLIENT=fast se ejecutan FastExpenseTrackingUser y
+FastQuickTestUser: mismas tareas y validaciones sobre FastHttpUser
+(geventhttpclient), que genera varias veces más RPS por núcleo.
 """
-from locust import HttpUser, task, between
+from locust import User, HttpUser, FastHttpUser, task, between
 import random
 import json
+from datetime import date
+from config.config import config
+from utils.data_generators import unique_email, unique_title
+from tests.performance.user_pool import pool
+from tests.performance import sla
+from tests.performance import baseline  # noqa: F401 (escribe LOCUST_STATS_JSON)
+from tests.performance import latency_histograms  # noqa: F401 (histogramas por endpoint)
+from tests.performance import static_assets
+from tests.performance.arrival_rate import open_loop, ArrivalRateShape  # noqa: F401
+from tests.performance.load_shapes import (  # noqa: F401 (LOCUST_SHAPE elige una)
+    StepLoadShape, SpikeLoadShape, SoakLoadShape, DiurnalLoadShape)
 
 
-class ExpenseTrackingUser(HttpUser):
-    """
-    Simula un usuario del sistema de control de gastos
+FAST_HTTP = config.LOCUST_HTTP_CLIENT == 'fast'
 
-    Basado en el ejemplo del PDF:
-    class UsuarioFormulario(HttpUser):
-        wait_time = between(1, 3)
-        @task
-        def cargar_formulario(self):
-            self.client.get("/selenium/web/web-form.html")
+
+class AuthenticatedTasks(User):
+    """
+    Base de los usuarios autenticados: cuenta del pool (o registro + login)
+    y headers con el token. No declara tareas.
     """
 
-    # Tiempo de espera entre tareas (simula tiempo de usuario real)
-    wait_time = between(1, 3)
+    abstract = True
 
     # Token de autenticación (se obtiene en on_start)
     token = None
     user_id = None
+    password = None
 
     def on_start(self):
         """
         Se ejecuta cuando el usuario simulado inicia
-        Hace login y obtiene token
+        Toma una cuenta del pool pre-registrado; si no hay pool, hace login
         """
+        account = pool.acquire()
+        if account:
+            self.token = account["token"]
+            self.user_id = account["user_id"]
+            self.password = account["password"]
+            return
+
+        self.register_and_login()
+
+    def register_and_login(self):
+        """Registrar un usuario nuevo y obtener su token"""
         # Datos de login
         login_data = {
-            "email": f"test_{random.randint(1000, 9999)}@example.com",
+            "email": unique_email("test"),
             "password": "Test123456"
         }
+        self.password = login_data["password"]
 
         # Intentar registrar usuario (puede fallar si ya existe, está ok)
         register_data = {
@@ -53,6 +80,9 @@ class ExpenseTrackingUser(HttpUser):
                               catch_response=True) as response:
             if response.status_code == 201 or response.status_code == 200:
                 response.success()
+            elif response.status_code == 400 and config.DATA_SEED:
+                # Con semilla los emails se repiten entre ejecuciones: se reutiliza la cuenta
+                response.success()
             else:
                 # Si falla el registro, probablemente el usuario ya existe
                 response.failure("Usuario ya existe o error en registro")
@@ -78,6 +108,27 @@ class ExpenseTrackingUser(HttpUser):
             }
         return {"Content-Type": "application/json"}
 
+
+class ExpenseTrackingTasks(AuthenticatedTasks):
+    """
+    Simula un usuario del sistema de control de gastos
+
+    Las tareas no dependen del cliente HTTP: ExpenseTrackingUser y
+    FastExpenseTrackingUser las combinan con HttpUser o FastHttpUser.
+
+    Basado en el ejemplo del PDF:
+    class UsuarioFormulario(HttpUser):
+        wait_time = between(1, 3)
+        @task
+        def cargar_formulario(self):
+            self.client.get("/selenium/web/web-form.html")
+    """
+
+    abstract = True
+
+    # Tiempo de espera entre tareas (simula tiempo de usuario real)
+    wait_time = between(1, 3)
+
     @task(3)
     def get_expenses(self):
         """
@@ -100,7 +151,7 @@ class ExpenseTrackingUser(HttpUser):
         """
         categories = ["Alimentación", "Transporte", "Salud", "Entretenimiento", "Otros"]
         expense_data = {
-            "title": f"Gasto Test {random.randint(1, 1000)}",
+            "title": unique_title("Gasto Test"),
             "amount": round(random.uniform(10, 500), 2),
             "currency": "USD",
             "category": random.choice(categories),
@@ -152,17 +203,247 @@ class ExpenseTrackingUser(HttpUser):
                 response.failure(f"Error al actualizar configuración: {response.status_code}")
 
 
-class QuickTestUser(HttpUser):
+class ExpenseTrackingUser(ExpenseTrackingTasks, HttpUser):
+    """Usuario del sistema de control de gastos sobre python-requests"""
+    abstract = FAST_HTTP
+
+
+class FastExpenseTrackingUser(ExpenseTrackingTasks, FastHttpUser):
+    """Usuario del sistema de control de gastos sobre FastHttpUser (LOCUST_HTTP_CLIENT=fast)"""
+    abstract = not FAST_HTTP
+
+
+# Variante de tasa de llegada constante (solo se lanza con LOCUST_LOAD_MODE=open)
+OpenLoopExpenseTrackingUser = open_loop(FastExpenseTrackingUser if FAST_HTTP else ExpenseTrackingUser)
+
+
+# Umbrales de los endpoints que solo ejecuta LifecycleUser
+sla.register_targets({
+    'GET /api/expenses?month': {'p50': 500, 'p95': 1500, 'p99': 2000, 'error_rate': 0.01},
+    'DELETE /api/expenses/[id]': {'p50': 500, 'p95': 1500, 'p99': 2000, 'error_rate': 0.01},
+    'GET /api/savings-goals': {'p50': 500, 'p95': 1500, 'p99': 2000, 'error_rate': 0.01},
+    'POST /api/savings-goals': {'p50': 500, 'p95': 1500, 'p99': 2000, 'error_rate': 0.01},
+    'PUT /api/savings-goals/[id]': {'p50': 500, 'p95': 1500, 'p99': 2000, 'error_rate': 0.01},
+    'DELETE /api/savings-goals/[id]': {'p50': 500, 'p95': 1500, 'p99': 2000, 'error_rate': 0.01},
+    'PUT /api/auth/profile': {'p50': 500, 'p95': 1500, 'p99': 2000, 'error_rate': 0.01},
+    # Verifica la contraseña actual y hashea la nueva: dos operaciones bcrypt
+    'PUT /api/auth/password': {'p95': 3000, 'p99': 4000, 'error_rate': 0.01},
+})
+
+
+class LifecycleTasks(AuthenticatedTasks):
+    """
+    Ciclo de vida completo de gastos y metas de ahorro
+
+    Crea, lista, actualiza el monto ahorrado y elimina, y además cambia el
+    perfil y la contraseña. Cada usuario guarda los ids que creó y no
+    mantiene más de LOCUST_LIFECYCLE_MAX_ITEMS de cada tipo (borra el más
+    antiguo antes de crear otro); en on_stop elimina los que queden, así la
+    base de datos no crece durante una prueba soak.
+    """
+
+    abstract = True
+    wait_time = between(1, 3)
+
+    def on_start(self):
+        super().on_start()
+        self.expense_ids = []
+        # id de meta -> monto ahorrado actual
+        self.goals = {}
+
+    def on_stop(self):
+        """Eliminar lo que este usuario creó"""
+        while self.expense_ids:
+            self.delete_expense()
+        while self.goals:
+            self.delete_savings_goal()
+
+    def _check(self, response, action):
+        """Marcar la respuesta como fallo si no es 200/201"""
+        if response.status_code in (200, 201):
+            response.success()
+            return True
+        response.failure(f"Error al {action}: {response.status_code}")
+        return False
+
+    @task(2)
+    def create_expense(self):
+        """Crear un gasto del mes actual (borrando el más antiguo si se llegó al límite)"""
+        if len(self.expense_ids) >= config.LOCUST_LIFECYCLE_MAX_ITEMS:
+            self.delete_expense()
+
+        expense_data = {
+            "title": unique_title("Gasto Ciclo"),
+            "amount": round(random.uniform(10, 500), 2),
+            "currency": "USD",
+            "category": random.choice(["food", "transport", "health", "entertainment", "other"]),
+            "date": date.today().isoformat(),
+            "note": "Gasto generado por prueba de rendimiento"
+        }
+        with self.client.post("/api/expenses",
+                              json=expense_data,
+                              headers=self.get_headers(),
+                              catch_response=True) as response:
+            if self._check(response, "crear gasto"):
+                self.expense_ids.append(response.json()["id"])
+
+    @task(3)
+    def list_month_expenses(self):
+        """Listar los gastos del mes actual, como la pantalla de gastos"""
+        with self.client.get("/api/expenses",
+                             params={"month": date.today().strftime("%Y-%m")},
+                             headers=self.get_headers(),
+                             name="/api/expenses?month",
+                             catch_response=True) as response:
+            self._check(response, "obtener gastos del mes")
+
+    @task(1)
+    def delete_expense(self):
+        """Eliminar el gasto más antiguo creado por este usuario"""
+        if not self.expense_ids:
+            return
+        expense_id = self.expense_ids.pop(0)
+        with self.client.delete(f"/api/expenses/{expense_id}",
+                                headers=self.get_headers(),
+                                name="/api/expenses/[id]",
+                                catch_response=True) as response:
+            self._check(response, "eliminar gasto")
+
+    @task(3)
+    def list_savings_goals(self):
+        """Listar metas de ahorro"""
+        with self.client.get("/api/savings-goals",
+                             headers=self.get_headers(),
+                             catch_response=True) as response:
+            self._check(response, "obtener metas")
+
+    @task(1)
+    def create_savings_goal(self):
+        """Crear una meta (borrando la más antigua si se llegó al límite)"""
+        if len(self.goals) >= config.LOCUST_LIFECYCLE_MAX_ITEMS:
+            self.delete_savings_goal()
+
+        goal_data = {
+            "name": unique_title("Meta Ciclo"),
+            "target_amount": round(random.uniform(1000, 10000), 2),
+            "current_amount": 0,
+            "color": random.choice(["blue", "green", "purple"])
+        }
+        with self.client.post("/api/savings-goals",
+                              json=goal_data,
+                              headers=self.get_headers(),
+                              catch_response=True) as response:
+            if self._check(response, "crear meta"):
+                self.goals[response.json()["id"]] = 0.0
+
+    @task(2)
+    def add_to_savings_goal(self):
+        """Sumar un aporte al monto ahorrado de una meta propia"""
+        if not self.goals:
+            return
+        goal_id = random.choice(list(self.goals))
+        current_amount = round(self.goals[goal_id] + random.uniform(10, 200), 2)
+        with self.client.put(f"/api/savings-goals/{goal_id}",
+                             json={"current_amount": current_amount},
+                             headers=self.get_headers(),
+                             name="/api/savings-goals/[id]",
+                             catch_response=True) as response:
+            if self._check(response, "actualizar meta"):
+                self.goals[goal_id] = current_amount
+
+    @task(1)
+    def delete_savings_goal(self):
+        """Eliminar la meta más antigua creada por este usuario"""
+        if not self.goals:
+            return
+        goal_id = next(iter(self.goals))
+        del self.goals[goal_id]
+        with self.client.delete(f"/api/savings-goals/{goal_id}",
+                                headers=self.get_headers(),
+                                name="/api/savings-goals/[id]",
+                                catch_response=True) as response:
+            self._check(response, "eliminar meta")
+
+    @task(1)
+    def update_profile(self):
+        """Cambiar el nombre (el email no: la cuenta puede ser del pool compartido)"""
+        with self.client.put("/api/auth/profile",
+                             json={"name": f"Usuario Test {random.randint(1, 9999)}"},
+                             headers=self.get_headers(),
+                             catch_response=True) as response:
+            self._check(response, "actualizar perfil")
+
+    @task(1)
+    def change_password(self):
+        """
+        Cambiar la contraseña por la misma
+
+        Recorre todo el camino (verificar la actual y hashear la nueva) sin
+        invalidar la cuenta para otros usuarios simulados que la compartan.
+        """
+        with self.client.put("/api/auth/password",
+                             json={"currentPassword": self.password, "newPassword": self.password},
+                             headers=self.get_headers(),
+                             catch_response=True) as response:
+            self._check(response, "cambiar contraseña")
+
+
+class LifecycleUser(LifecycleTasks, HttpUser):
+    """Ciclo de vida completo sobre python-requests"""
+    abstract = FAST_HTTP or not config.LOCUST_LIFECYCLE_WEIGHT
+    weight = config.LOCUST_LIFECYCLE_WEIGHT
+
+
+class FastLifecycleUser(LifecycleTasks, FastHttpUser):
+    """Ciclo de vida completo sobre FastHttpUser (LOCUST_HTTP_CLIENT=fast)"""
+    abstract = not FAST_HTTP or not config.LOCUST_LIFECYCLE_WEIGHT
+    weight = config.LOCUST_LIFECYCLE_WEIGHT
+
+
+class AuthCostUser(HttpUser):
+    """
+    Usuario que solo mide el coste de registro + login (bcrypt)
+    Se habilita con LOCUST_MEASURE_AUTH=true
+    """
+    abstract = not config.LOCUST_MEASURE_AUTH
+    wait_time = between(1, 3)
+
+    @task
+    def register_and_login(self):
+        """Registrar un usuario nuevo y hacer login"""
+        credentials = {"email": unique_email("auth"), "password": config.TEST_USER_PASSWORD}
+
+        self.client.post("/api/auth/register",
+                         json={**credentials, "name": "Usuario Test", "currency": "USD"},
+                         name="/api/auth/register [auth cost]")
+        self.client.post("/api/auth/login",
+                         json=credentials,
+                         name="/api/auth/login [auth cost]")
+
+
+class QuickTestTasks(User):
     """
     Usuario para pruebas rápidas de carga
     Solo hace peticiones GET (menos carga en la BD)
     """
+    abstract = True
     wait_time = between(0.5, 2)
 
+    # Validadores (ETag/Last-Modified) de la última visita, como la caché del navegador
+    asset_cache = None
+
     @task
     def load_homepage(self):
-        """Cargar página principal"""
-        self.client.get("/")
+        """Primera visita: página y todos sus bundles con la caché vacía"""
+        self.asset_cache = {}
+        static_assets.load_page(self, random.choice(static_assets.static_pages()), self.asset_cache)
+
+    @task
+    def revisit_homepage(self):
+        """Revisita: peticiones condicionales, los recursos sin cambios dan 304"""
+        if self.asset_cache is None:
+            self.asset_cache = {}
+        static_assets.load_page(self, random.choice(static_assets.static_pages()), self.asset_cache)
 
     @task
     def load_api_health(self):
@@ -176,6 +457,16 @@ class QuickTestUser(HttpUser):
                 response.failure(f"Error: {response.status_code}")
 
 
+class QuickTestUser(QuickTestTasks, HttpUser):
+    """Pruebas rápidas sobre python-requests"""
+    abstract = FAST_HTTP
+
+
+class FastQuickTestUser(QuickTestTasks, FastHttpUser):
+    """Pruebas rápidas sobre FastHttpUser (LOCUST_HTTP_CLIENT=fast)"""
+    abstract = not FAST_HTTP
+
+
 # Configuración para ejecución por línea de comandos
 # Ejecutar con:
-# locust -f locustfile.py --headless --users 50 --spawn-rate 5 --host http://localhost:3000 --run-time 2m
+# locust -f tests/performance/locustfile.py --headless --users 50 --spawn-rate 5 --host http://localhost:3000 --run-time 2m
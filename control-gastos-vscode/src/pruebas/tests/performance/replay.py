@@ -0,0 +1,371 @@
+"""
+Reproducción de tráfico real desde un log de accesos
+
+Los pesos @task de ExpenseTrackingUser son una suposición; este modo
+reproduce un log grabado en producción con su mezcla y ritmo reales. El
+log es JSON lines, una petición por línea:
+
+    {"timestamp": "2026-10-01T09:00:00.120Z", "method": "GET",
+     "path": "/api/expenses?month=2026-10", "user": "u-1842", "body": null}
+
+(timestamp también puede ser epoch en segundos; el archivo puede ir en .gz)
+
+- El archivo se lee en streaming línea a línea: los logs de varios GB no
+  se cargan en memoria.
+- Cada usuario del log se asigna siempre a la misma cuenta del pool
+  (user_pool.py) por hash de su clave.
+- Los tiempos se comprimen por LOCUST_REPLAY_SPEED (10 = 10 veces más
+  rápido; 0 = sin esperas). Las peticiones se lanzan sin esperar a las
+  anteriores, hasta LOCUST_MAX_IN_FLIGHT en curso.
+- Los ids de producción no existen en el entorno de prueba: PUT/DELETE
+  sobre /recurso/<id> usan el último id creado por esa cuenta con un POST
+  del propio replay, y se omiten si no hay ninguno.
+- Login, registro, cambio de contraseña y perfil se reescriben con las
+  credenciales de la cuenta asignada.
+
+Ejecución (desde el directorio 'pruebas'; un usuario por proceso):
+    LOCUST_REPLAY_FILE=logs/access.jsonl.gz LOCUST_REPLAY_SPEED=10 \\
+        locust -f tests/performance/replay.py --headless -u 1 -r 1 -t 30m \\
+        --host http://localhost:3000
+
+En modo distribuido se usa --users igual al número de workers: cada worker
+lee el archivo completo y reproduce solo los usuarios que le tocan por hash.
+La prueba termina cuando todos acaban el archivo (o al llegar a --run-time).
+"""
+from locust import User, HttpUser, FastHttpUser, task, constant, events
+from locust.exception import StopUser
+from locust.runners import MasterRunner, WorkerRunner
+import gzip
+import json
+import logging
+import re
+import time
+import traceback
+import zlib
+from collections import deque
+from datetime import datetime
+from urllib.parse import parse_qsl, urlsplit
+import gevent
+from gevent.pool import Pool
+from urllib3 import PoolManager
+from config.config import config
+from utils.data_generators import unique_email
+from tests.performance.user_pool import pool
+from tests.performance import sla  # noqa: F401 (registra la verificación de SLA)
+from tests.performance import baseline  # noqa: F401 (escribe LOCUST_STATS_JSON)
+from tests.performance import latency_histograms  # noqa: F401 (histogramas por endpoint)
+
+logger = logging.getLogger(__name__)
+
+FAST_HTTP = config.LOCUST_HTTP_CLIENT == 'fast'
+
+# Segmentos de ruta que son ids de registros
+ID_SEGMENT = re.compile(r'^\d+$')
+
+
+def parse_timestamp(value):
+    """
+    Instante de una línea del log en segundos
+
+    Args:
+        value: Epoch (número) o ISO 8601 ('2026-10-01T09:00:00.120Z')
+
+    Returns:
+        Segundos desde epoch (float)
+    """
+    if isinstance(value, (int, float)):
+        return float(value)
+    return datetime.fromisoformat(value.replace('Z', '+00:00')).timestamp()
+
+
+def iter_log(path):
+    """
+    Leer el log en streaming
+
+    Args:
+        path: Archivo JSON lines (o .gz)
+
+    Returns:
+        Generador de dicts con timestamp (float), method, path, user y body;
+        las líneas vacías o inválidas se saltan
+    """
+    opener = gzip.open if path.endswith('.gz') else open
+    with opener(path, 'rt', encoding='utf-8') as f:
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+                yield {
+                    'timestamp': parse_timestamp(record['timestamp']),
+                    'method': record['method'].upper(),
+                    'path': record['path'],
+                    'user': str(record.get('user') or ''),
+                    'body': record.get('body'),
+                }
+            except (ValueError, KeyError, TypeError, AttributeError) as e:
+                logger.warning("Línea %d del log ignorada: %s", line_number, e)
+
+
+def user_hash(user_key):
+    """Hash estable (igual en todos los procesos) de la clave de usuario del log"""
+    return zlib.crc32(user_key.encode('utf-8'))
+
+
+def split_path(path):
+    """
+    Separar una ruta del log en nombre de estadística, colección e id
+
+    Args:
+        path: Ruta con query, p. ej. '/api/savings-goals/12?x=1'
+
+    Returns:
+        Tupla (nombre, colección, tiene_id), p. ej.
+        ('/api/savings-goals/[id]?x', '/api/savings-goals', True)
+    """
+    parts = urlsplit(path)
+    segments = parts.path.rstrip('/').split('/')
+    id_index = next((i for i, s in enumerate(segments) if ID_SEGMENT.match(s)), None)
+
+    named = ['[id]' if ID_SEGMENT.match(s) else s for s in segments]
+    name = '/'.join(named) or '/'
+    query = parse_qsl(parts.query, keep_blank_values=True)
+    if query:
+        name += '?' + '&'.join(sorted({key for key, _ in query}))
+
+    collection = '/'.join(segments[:id_index]) if id_index is not None else '/'.join(segments)
+    return name, collection, id_index is not None
+
+
+class Replayer:
+    """Reproduce las líneas del log que corresponden a este proceso"""
+
+    def __init__(self, user, worker_index=0, worker_count=1):
+        """
+        Args:
+            user: Usuario de Locust cuyo cliente HTTP se usa
+            worker_index: Índice de este proceso entre los workers
+            worker_count: Número total de workers (1 sin modo distribuido)
+        """
+        self.user = user
+        self.worker_index = worker_index
+        self.worker_count = max(worker_count, 1)
+        # (email de la cuenta, colección) -> últimos ids creados por el replay;
+        # acotado como en LifecycleUser para que un log de varios GB no agote la memoria
+        self.created = {}
+        self.sent = 0
+        self.skipped = 0
+        self.max_lag = 0.0
+
+    def account_for(self, user_key):
+        """Cuenta del pool asignada a un usuario del log (siempre la misma)"""
+        return pool.accounts[user_hash(user_key) % len(pool.accounts)]
+
+    def is_mine(self, record):
+        """True si la línea le toca a este proceso"""
+        return user_hash(record['user']) % self.worker_count == self.worker_index
+
+    def rewrite_body(self, record, account):
+        """Reemplazar credenciales del log por las de la cuenta asignada"""
+        path, body = urlsplit(record['path']).path.rstrip('/'), record['body']
+        if path == '/api/auth/login':
+            return {'email': account['email'], 'password': account['password']}
+        if path == '/api/auth/register':
+            return {**(body or {}), 'email': unique_email('replay'), 'password': account['password']}
+        if path == '/api/auth/password':
+            # La misma contraseña: la cuenta puede estar asignada a otros usuarios del log
+            return {'currentPassword': account['password'], 'newPassword': account['password']}
+        if path == '/api/auth/profile' and isinstance(body, dict):
+            return {key: value for key, value in body.items() if key != 'email'}
+        return body
+
+    def resolve_path(self, record, account):
+        """
+        Ruta a pedir: los ids del log se cambian por ids creados en esta prueba
+
+        Returns:
+            Tupla (ruta o None si no hay id que usar, nombre, colección)
+        """
+        name, collection, has_id = split_path(record['path'])
+        if not has_id:
+            return record['path'], name, collection
+
+        ids = self.created.get((account['email'], collection))
+        if not ids:
+            return None, name, collection
+        item_id = ids.pop() if record['method'] == 'DELETE' else ids[-1]
+        parts = urlsplit(record['path'])
+        segments = [str(item_id) if ID_SEGMENT.match(s) else s for s in parts.path.split('/')]
+        path = '/'.join(segments) + (f"?{parts.query}" if parts.query else '')
+        return path, name, collection
+
+    def send(self, record):
+        """Lanzar una petición del log con la cuenta asignada"""
+        account = self.account_for(record['user'])
+        path, name, collection = self.resolve_path(record, account)
+        if path is None:
+            self.skipped += 1
+            return
+
+        self.sent += 1
+        kwargs = {
+            'headers': {"Authorization": f"Bearer {account['token']}"},
+            'name': name,
+            'catch_response': True,
+        }
+        body = self.rewrite_body(record, account)
+        if body is not None:
+            kwargs['json'] = body
+
+        with self.user.client.request(record['method'], path, **kwargs) as response:
+            if not 200 <= response.status_code < 300:
+                response.failure(f"{record['method']} {name}: {response.status_code}")
+                return
+            response.success()
+            if record['method'] == 'POST':
+                created = response.json()
+                if isinstance(created, dict) and 'id' in created:
+                    ids = self.created.setdefault((account['email'], collection),
+                                                  deque(maxlen=config.LOCUST_LIFECYCLE_MAX_ITEMS))
+                    ids.append(created['id'])
+
+    def _send_safely(self, record):
+        """Ejecutar send() en su greenlet registrando los errores como una tarea"""
+        try:
+            self.send(record)
+        except gevent.GreenletExit:
+            pass
+        except Exception as e:
+            self.user.environment.events.user_error.fire(
+                user_instance=self.user, exception=e, tb=e.__traceback__)
+            logger.error("%s\n%s", e, traceback.format_exc())
+
+    def run(self, path, speed):
+        """
+        Reproducir el archivo respetando los tiempos (divididos por 'speed')
+
+        Args:
+            path: Log JSON lines
+            speed: Factor de compresión del tiempo (0 = sin esperas)
+        """
+        in_flight = Pool(config.LOCUST_MAX_IN_FLIGHT)
+        first = None
+        started = time.monotonic()
+        try:
+            for record in iter_log(path):
+                if first is None:
+                    first = record['timestamp']
+                if not self.is_mine(record):
+                    continue
+
+                if speed > 0:
+                    due = started + (record['timestamp'] - first) / speed
+                    delay = due - time.monotonic()
+                    if delay > 0:
+                        gevent.sleep(delay)
+                    else:
+                        self.max_lag = max(self.max_lag, -delay)
+                # Con el límite de peticiones en curso, spawn espera (y crece el retraso)
+                in_flight.spawn(self._send_safely, record)
+            in_flight.join()
+        finally:
+            in_flight.kill(block=False)
+
+    def print_summary(self):
+        """Resumen del proceso al terminar el archivo"""
+        print("\n" + "=" * 60)
+        print(f"REPLAY TERMINADO (worker {self.worker_index + 1}/{self.worker_count})")
+        print("=" * 60)
+        print(f"✓ {self.sent} peticiones reproducidas")
+        if self.skipped:
+            print(f"✗ {self.skipped} omitidas: PUT/DELETE sin registro creado por el replay")
+        print(f"Retraso máximo respecto al log: {self.max_lag:.2f} s")
+        print("=" * 60 + "\n")
+
+
+# Estado del replay en este proceso
+_state = {'running': False, 'worker_count': 1, 'finished_workers': 0}
+
+
+class ReplayTasks(User):
+    """
+    Usuario que reproduce el log
+
+    Solo el primer usuario de cada proceso reproduce; si se lanzan más, el
+    resto se detiene para no duplicar el tráfico.
+    """
+    abstract = True
+    wait_time = constant(0)
+
+    @task
+    def replay(self):
+        if _state['running']:
+            raise StopUser()
+        if not config.LOCUST_REPLAY_FILE:
+            raise RuntimeError("Configura LOCUST_REPLAY_FILE con el log a reproducir")
+        if not len(pool):
+            raise RuntimeError("El replay necesita el pool de usuarios (LOCUST_USER_POOL=true)")
+        _state['running'] = True
+
+        runner = self.environment.runner
+        is_worker = isinstance(runner, WorkerRunner)
+        replayer = Replayer(self,
+                            worker_index=runner.worker_index if is_worker else 0,
+                            worker_count=_state['worker_count'] if is_worker else 1)
+        replayer.run(config.LOCUST_REPLAY_FILE, config.LOCUST_REPLAY_SPEED)
+        replayer.print_summary()
+
+        if is_worker:
+            runner.send_message('replay_done')
+        else:
+            gevent.spawn(runner.quit)
+        raise StopUser()
+
+
+class ReplayUser(ReplayTasks, HttpUser):
+    """Replay sobre python-requests"""
+    abstract = FAST_HTTP
+
+    def __init__(self, *args, **kwargs):
+        # Conexiones suficientes para las peticiones simultáneas; un PoolManager
+        # por usuario (HttpUser.__init__ lo pasa a la sesión, así que va antes)
+        self.pool_manager = PoolManager(maxsize=config.LOCUST_MAX_IN_FLIGHT)
+        super().__init__(*args, **kwargs)
+
+
+class FastReplayUser(ReplayTasks, FastHttpUser):
+    """Replay sobre FastHttpUser (LOCUST_HTTP_CLIENT=fast)"""
+    abstract = not FAST_HTTP
+    concurrency = config.LOCUST_MAX_IN_FLIGHT
+
+
+def on_workers_message(environment, msg, **kwargs):
+    """Worker: número total de workers para repartir los usuarios del log"""
+    _state['worker_count'] = msg.data
+
+
+def on_done_message(environment, msg, **kwargs):
+    """Master: terminar la prueba cuando todos los workers acabaron el archivo"""
+    _state['finished_workers'] += 1
+    if _state['finished_workers'] >= _state['worker_count']:
+        print("✓ Todos los workers terminaron el log")
+        gevent.spawn(environment.runner.quit)
+
+
+@events.init.add_listener
+def on_locust_init(environment, **kwargs):
+    """Registrar los mensajes entre master y workers"""
+    if isinstance(environment.runner, WorkerRunner):
+        environment.runner.register_message('replay_workers', on_workers_message)
+    elif isinstance(environment.runner, MasterRunner):
+        environment.runner.register_message('replay_done', on_done_message)
+
+
+@events.test_start.add_listener
+def on_test_start(environment, **kwargs):
+    """Reiniciar el estado y enviar a los workers cuántos son"""
+    _state['running'] = False
+    _state['finished_workers'] = 0
+    if isinstance(environment.runner, MasterRunner):
+        _state['worker_count'] = environment.runner.worker_count
+        environment.runner.send_message('replay_workers', _state['worker_count'])
@@ -0,0 +1,156 @@
+"""
+Verificación de SLA a partir de las estadísticas de Locust
+
+Los umbrales se declaran por endpoint ("MÉTODO nombre") y se evalúan al
+terminar la prueba sobre los tiempos que mide el propio Locust (en
+events.test_stop, o en events.quitting en el master, cuando ya llegaron
+los últimos reportes de los workers). Si alguno
+se incumple, el proceso termina con código de salida 1 para que los
+scripts (generar_reportes.sh) puedan cortar el pipeline.
+
+Métricas soportadas por endpoint:
+    p50, p95, p99   Percentiles de tiempo de respuesta (ms, máximo)
+    error_rate      Proporción de fallos (0.01 = 1%, máximo)
+    min_rps         Peticiones por segundo (mínimo)
+
+La clave '*' aplica a las estadísticas agregadas de toda la prueba. Los
+umbrales por defecto se pueden sobrescribir con un archivo JSON con la
+misma estructura (LOCUST_SLA_FILE).
+"""
+from locust import events
+from locust.runners import MasterRunner, WorkerRunner
+import json
+from config.config import config
+
+AGGREGATED = '*'
+
+# Objetivo del proyecto: respuesta < 2 segundos y tasa de error < 1%
+SLA_TARGETS = {
+    AGGREGATED: {'p95': 2000, 'error_rate': 0.01},
+    'GET /api/expenses': {'p50': 500, 'p95': 1500, 'p99': 2000, 'error_rate': 0.01},
+    'POST /api/expenses': {'p50': 500, 'p95': 1500, 'p99': 2000, 'error_rate': 0.01},
+    'GET /api/auth/me': {'p50': 300, 'p95': 1000, 'p99': 2000, 'error_rate': 0.01},
+    'PUT /api/auth/settings': {'p50': 500, 'p95': 1500, 'p99': 2000, 'error_rate': 0.01},
+    # Login usa bcrypt: es el endpoint más costoso por diseño
+    'POST /api/auth/login': {'p95': 2000, 'p99': 3000, 'error_rate': 0.01},
+}
+
+
+def register_targets(targets):
+    """
+    Añadir o reemplazar umbrales (p. ej. desde un escenario concreto)
+
+    Args:
+        targets: Dict {"MÉTODO nombre": {métrica: umbral}}
+    """
+    for key, thresholds in targets.items():
+        SLA_TARGETS[key] = {**SLA_TARGETS.get(key, {}), **thresholds}
+
+
+def load_targets(path):
+    """Cargar umbrales desde un archivo JSON y registrarlos"""
+    with open(path, encoding='utf-8') as f:
+        register_targets(json.load(f))
+
+
+def _metric_values(entry):
+    """Valores medidos de un StatsEntry de Locust"""
+    return {
+        'p50': entry.get_response_time_percentile(0.50),
+        'p95': entry.get_response_time_percentile(0.95),
+        'p99': entry.get_response_time_percentile(0.99),
+        'error_rate': entry.fail_ratio,
+        'min_rps': entry.total_rps,
+    }
+
+
+def evaluate(stats, targets=None):
+    """
+    Comparar las estadísticas de Locust con los umbrales
+
+    Args:
+        stats: environment.stats (RequestStats)
+        targets: Umbrales a usar (default: SLA_TARGETS)
+
+    Returns:
+        Tupla (resultados, violaciones); cada resultado es un dict con
+        endpoint, metric, threshold, value y passed
+    """
+    targets = targets if targets is not None else SLA_TARGETS
+    results = []
+
+    for key, thresholds in targets.items():
+        if key == AGGREGATED:
+            entry = stats.total
+        else:
+            method, name = key.split(' ', 1)
+            entry = stats.entries.get((name, method))
+
+        # Endpoints que este escenario no ejecutó no se evalúan
+        if entry is None or entry.num_requests == 0:
+            continue
+
+        values = _metric_values(entry)
+        for metric, threshold in thresholds.items():
+            value = values[metric]
+            passed = value >= threshold if metric == 'min_rps' else value <= threshold
+            results.append({
+                'endpoint': 'Aggregated' if key == AGGREGATED else key,
+                'metric': metric,
+                'threshold': threshold,
+                'value': value,
+                'passed': passed,
+            })
+
+    violations = [r for r in results if not r['passed']]
+    return results, violations
+
+
+def print_report(results):
+    """Imprimir la tabla de verificación de SLA"""
+    print("\n" + "=" * 60)
+    print("VERIFICACIÓN DE SLA")
+    print("=" * 60)
+    for r in results:
+        mark = "✓" if r['passed'] else "✗"
+        print(f"{mark} {r['endpoint']:<35} {r['metric']:<10} "
+              f"{r['value']:>10.2f} (umbral {r['threshold']})")
+    print("=" * 60 + "\n")
+
+
+@events.init.add_listener
+def on_locust_init(environment, **kwargs):
+    """Cargar umbrales personalizados si se configuró un archivo"""
+    if config.LOCUST_SLA_FILE:
+        load_targets(config.LOCUST_SLA_FILE)
+
+
+def check_sla(environment):
+    """Evaluar los SLA con las estadísticas finales y fijar el código de salida"""
+    if not config.LOCUST_SLA:
+        return
+
+    results, violations = evaluate(environment.stats)
+    print_report(results)
+
+    # Solo se fuerza el fallo: si los SLA se cumplen, Locust decide el código
+    # (--exit-code-on-error, excepciones no capturadas...)
+    if violations:
+        print(f"✗ {len(violations)} umbral(es) de SLA incumplidos")
+        environment.process_exit_code = 1
+    else:
+        print("✓ Todos los SLA se cumplen")
+
+
+@events.test_stop.add_listener
+def on_test_stop(environment, **kwargs):
+    """Verificación en el proceso local (el master espera a los últimos reportes)"""
+    if not isinstance(environment.runner, (MasterRunner, WorkerRunner)):
+        check_sla(environment)
+
+
+@events.quitting.add_listener
+def on_quitting(environment, **kwargs):
+    """En el master los últimos reportes de los workers llegan después de test_stop"""
+    if isinstance(environment.runner, MasterRunner):
+        check_sla(environment)
@@ -0,0 +1,382 @@
+"""
+Carga de recursos estáticos del frontend (bundles de Vite) como un navegador
+
+En producción el backend sirve el build de React (backend/dist): un
+index.html y los bundles JS/CSS con hash en /assets/. Pedir solo '/' no
+dice nada del coste real de abrir la app, así que aquí cada visita:
+
+1. Pide la página (index.html) y extrae scripts, hojas de estilo,
+   modulepreload e iconos.
+2. Pide todos los recursos del mismo origen con LOCUST_STATIC_CONNECTIONS
+   conexiones en paralelo, como hace el navegador.
+3. Anota en el acumulado de la página (StaticAssetRecorder) el tiempo de
+   la página completa (hasta el último recurso) y los bytes transferidos.
+   Las peticiones de cada recurso van a las estadísticas de Locust como
+   siempre; la página completa no, para no contar dos veces el tráfico ni
+   los fallos en el total, las RPS, los SLA y la línea base.
+
+La primera visita va con la caché vacía. La revisita manda If-None-Match /
+If-Modified-Since con lo guardado en la visita anterior: express.static
+responde 304 sin cuerpo si el recurso no cambió.
+
+Al terminar se imprime por página los KB transferidos, los KB sin
+comprimir, la compresión y el tiempo medio, y por recurso su tamaño
+servido y el que tendría con gzip; todo se guarda en
+LOCUST_STATIC_ASSETS_FILE. Con LOCUST_BUNDLE_BUDGET_KB > 0 se comprueba
+además el tamaño medio de la primera visita de cada página: un bundle que
+crece por encima del presupuesto termina la prueba con código de salida 1.
+"""
+from locust import events
+from locust.runners import MasterRunner, WorkerRunner
+from gevent.pool import Pool
+from html.parser import HTMLParser
+from urllib.parse import urljoin, urlsplit
+import gzip
+import json
+import os
+import re
+import time
+from config.config import config
+
+FIRST_VISIT = 'primera visita'
+REVISIT = 'revisita'
+
+# Hash de contenido que Vite añade a los nombres (index-BxQ3a1_c.js)
+HASH_PATTERN = re.compile(r'-[A-Za-z0-9_-]{8}(?=\.\w+$)')
+
+
+def static_pages():
+    """Páginas configuradas en LOCUST_STATIC_PAGES"""
+    return [p.strip() for p in config.LOCUST_STATIC_PAGES.split(',') if p.strip()]
+
+
+class AssetParser(HTMLParser):
+    """Recoger las URLs de scripts, hojas de estilo, precargas e iconos de un HTML"""
+
+    LINK_RELS = {'stylesheet', 'modulepreload', 'preload', 'icon'}
+
+    def __init__(self):
+        super().__init__()
+        self.urls = []
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        url = None
+        if tag == 'script':
+            url = attrs.get('src')
+        elif tag == 'link' and self.LINK_RELS & set((attrs.get('rel') or '').lower().split()):
+            url = attrs.get('href')
+        if url and url not in self.urls:
+            self.urls.append(url)
+
+
+def parse_assets(html, page):
+    """
+    Recursos del mismo origen referenciados por un index.html
+
+    Args:
+        html: Contenido de la página
+        page: Ruta de la página (para resolver URLs relativas)
+
+    Returns:
+        Lista de rutas ('/assets/index-xxxx.js', ...) sin repetir
+    """
+    parser = AssetParser()
+    parser.feed(html)
+    paths = []
+    for url in parser.urls:
+        parts = urlsplit(urljoin(page, url))
+        # Fuentes o CDNs externos no los sirve el backend
+        if parts.netloc:
+            continue
+        path = parts.path + (f"?{parts.query}" if parts.query else '')
+        if path not in paths:
+            paths.append(path)
+    return paths
+
+
+def asset_name(path):
+    """Nombre estable de un recurso para las estadísticas (sin el hash del build)"""
+    return HASH_PATTERN.sub('-[hash]', path.split('?', 1)[0])
+
+
+def asset_type(path):
+    """'js', 'css', 'html' u otro según la extensión"""
+    extension = os.path.splitext(path.split('?', 1)[0])[1].lstrip('.').lower()
+    return {'mjs': 'js', 'htm': 'html', '': 'html'}.get(extension, extension)
+
+
+# Tamaño con gzip por (ruta, versión): se calcula una vez por proceso
+_gzip_sizes = {}
+
+
+def gzip_size(path, version, body):
+    """Bytes que ocuparía el cuerpo con gzip (nivel 6, el de compression/nginx)"""
+    key = (path, version)
+    if key not in _gzip_sizes:
+        _gzip_sizes[key] = len(gzip.compress(body, compresslevel=6))
+    return _gzip_sizes[key]
+
+
+def transfer_size(response, body):
+    """
+    Bytes del cuerpo tal como viajaron por la red
+
+    Content-Length es el tamaño codificado. Sin él (respuestas chunked) y sin
+    Content-Encoding se usa el cuerpo; si venía comprimido se estima con gzip.
+    """
+    length = response.headers.get('Content-Length')
+    if length is not None:
+        return int(length)
+    if response.headers.get('Content-Encoding'):
+        return len(gzip.compress(body, compresslevel=6))
+    return len(body)
+
+
+class StaticAssetRecorder:
+    """Acumulado por página/visita y último tamaño visto de cada recurso"""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.pages = {}
+        self.assets = {}
+
+    def record_visit(self, page, visit, elapsed_ms, fetched):
+        """
+        Sumar una visita completa
+
+        Args:
+            page: Ruta de la página
+            visit: FIRST_VISIT o REVISIT
+            elapsed_ms: Tiempo hasta el último recurso
+            fetched: Resultados de fetch() (index.html incluido)
+        """
+        row = self._row(page, visit)
+        row['visits'] += 1
+        row['requests'] += len(fetched)
+        row['not_modified'] += sum(1 for f in fetched if f['not_modified'])
+        row['transfer'] += sum(f['transfer'] for f in fetched)
+        row['decoded'] += sum(f['decoded'] for f in fetched)
+        row['time_ms'] += elapsed_ms
+        row['max_ms'] = max(row['max_ms'], elapsed_ms)
+
+        for f in fetched:
+            if not f['not_modified']:
+                self.assets[f['name']] = {
+                    'type': f['type'], 'transfer': f['transfer'],
+                    'decoded': f['decoded'], 'gzip': f['gzip'],
+                }
+
+    def record_failure(self, page, visit):
+        """Contar una visita con algún recurso fallido (sin tiempo ni tamaño)"""
+        self._row(page, visit)['failed'] += 1
+
+    def _row(self, page, visit):
+        return self.pages.setdefault(f"{page}|{visit}", {
+            'visits': 0, 'failed': 0, 'requests': 0, 'not_modified': 0,
+            'transfer': 0, 'decoded': 0, 'time_ms': 0.0, 'max_ms': 0.0,
+        })
+
+    def take(self):
+        """Datos acumulados desde la última llamada (para el reporte al master)"""
+        data = {'pages': self.pages, 'assets': self.assets}
+        self.reset()
+        return data
+
+    def merge(self, data):
+        """Sumar los datos de un worker"""
+        for key, row in data['pages'].items():
+            total = self.pages.setdefault(key, dict.fromkeys(row, 0))
+            for field, value in row.items():
+                if field == 'max_ms':
+                    total[field] = max(total[field], value)
+                else:
+                    total[field] += value
+        self.assets.update(data['assets'])
+
+
+recorder = StaticAssetRecorder()
+
+
+def fetch(client, path, name, cache):
+    """
+    Pedir un recurso con revalidación si está en la caché
+
+    Args:
+        client: Cliente HTTP del usuario de Locust
+        path: Ruta del recurso
+        name: Nombre en las estadísticas de Locust
+        cache: Dict {ruta: validadores y tamaños} de la visita anterior; se actualiza
+
+    Returns:
+        Dict con name, type, transfer, decoded, gzip, not_modified y body
+        (None si 304), o None si la petición falló
+    """
+    headers = {'Accept-Encoding': 'gzip, deflate'}
+    cached = cache.get(path)
+    if cached:
+        if cached['etag']:
+            headers['If-None-Match'] = cached['etag']
+        if cached['last_modified']:
+            headers['If-Modified-Since'] = cached['last_modified']
+
+    with client.get(path, headers=headers, name=name, catch_response=True) as response:
+        if response.status_code == 304 and cached:
+            response.success()
+            return {'name': name, 'type': cached['type'], 'transfer': 0,
+                    'decoded': 0, 'gzip': cached['gzip'], 'not_modified': True, 'body': None}
+        if response.status_code != 200:
+            response.failure(f"Error: {response.status_code}")
+            return None
+
+        body = response.content or b''
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        entry = {
+            'etag': etag,
+            'last_modified': last_modified,
+            'type': asset_type(path),
+            'gzip': gzip_size(path, etag or last_modified or len(body), body),
+        }
+        cache[path] = entry
+        return {'name': name, 'type': entry['type'], 'transfer': transfer_size(response, body),
+                'decoded': len(body), 'gzip': entry['gzip'], 'not_modified': False, 'body': body}
+
+
+def load_page(user, page, cache):
+    """
+    Cargar una página completa: index.html y todos sus recursos
+
+    Args:
+        user: Usuario de Locust (HttpUser o FastHttpUser)
+        page: Ruta de la página ('/', '/dashboard'...)
+        cache: Caché de la visita anterior ({} = primera visita); se actualiza
+    """
+    visit = REVISIT if cache else FIRST_VISIT
+    start = time.perf_counter()
+
+    index = fetch(user.client, page, f"{page} (index.html)", cache)
+    fetched = [index] if index else []
+    if index:
+        if index['body'] is not None:
+            cache[page]['assets'] = parse_assets(index['body'].decode('utf-8', 'replace'), page)
+        assets = cache[page].get('assets', [])
+        pool = Pool(max(config.LOCUST_STATIC_CONNECTIONS, 1))
+        fetched += pool.map(lambda path: fetch(user.client, path, asset_name(path), cache), assets)
+        failed = sum(1 for f in fetched if f is None)
+        fetched = [f for f in fetched if f is not None]
+    else:
+        failed = 1
+
+    # Los fallos ya están en las estadísticas de cada recurso
+    if failed:
+        recorder.record_failure(page, visit)
+    else:
+        recorder.record_visit(page, visit, (time.perf_counter() - start) * 1000, fetched)
+
+
+def _ratio(decoded, transfer):
+    return decoded / transfer if transfer else 0.0
+
+
+def print_summary(data):
+    """Imprimir las tablas por página y por recurso"""
+    print("\n" + "=" * 60)
+    print("RECURSOS ESTÁTICOS POR PÁGINA")
+    print("=" * 60)
+    print(f"{'Página':<28} {'Visitas':>7} {'Fallos':>6} {'KB red':>8} {'KB real':>8} {'Ratio':>6} "
+          f"{'304':>5} {'ms':>7} {'máx ms':>7}")
+    for key, row in sorted(data['pages'].items()):
+        page, visit = key.split('|')
+        visits = row['visits'] or 1
+        print(f"{f'{page} [{visit}]':<28} {row['visits']:>7} {row['failed']:>6} "
+              f"{row['transfer'] / visits / 1024:>8.1f} {row['decoded'] / visits / 1024:>8.1f} "
+              f"{_ratio(row['decoded'], row['transfer']):>6.1f} {row['not_modified'] / visits:>5.1f} "
+              f"{row['time_ms'] / visits:>7.0f} {row['max_ms']:>7.0f}")
+
+    print(f"\n{'Recurso':<36} {'KB red':>8} {'KB real':>8} {'KB gzip':>8}")
+    for name, asset in sorted(data['assets'].items(), key=lambda item: -item[1]['decoded']):
+        print(f"{name:<36} {asset['transfer'] / 1024:>8.1f} {asset['decoded'] / 1024:>8.1f} "
+              f"{asset['gzip'] / 1024:>8.1f}")
+    for kind in ('js', 'css'):
+        total = sum(a['decoded'] for a in data['assets'].values() if a['type'] == kind)
+        gzipped = sum(a['gzip'] for a in data['assets'].values() if a['type'] == kind)
+        if total:
+            print(f"Total {kind}: {total / 1024:.1f} KB ({gzipped / 1024:.1f} KB con gzip)")
+    print(f"Detalle en {config.LOCUST_STATIC_ASSETS_FILE}")
+    print("=" * 60 + "\n")
+
+
+def budget_violations(data, budget_kb):
+    """
+    Páginas cuya primera visita transfiere de media más de budget_kb
+
+    Returns:
+        Lista de tuplas (página, KB medios)
+    """
+    violations = []
+    for key, row in sorted(data['pages'].items()):
+        page, visit = key.split('|')
+        if visit == FIRST_VISIT and row['visits']:
+            kb = row['transfer'] / row['visits'] / 1024
+            if kb > budget_kb:
+                violations.append((page, kb))
+    return violations
+
+
+def _write_summary(environment):
+    """Guardar e imprimir lo acumulado y comprobar el presupuesto de tamaño"""
+    data = {'pages': recorder.pages, 'assets': recorder.assets}
+    if not data['pages']:
+        return
+    os.makedirs(os.path.dirname(os.path.abspath(config.LOCUST_STATIC_ASSETS_FILE)), exist_ok=True)
+    with open(config.LOCUST_STATIC_ASSETS_FILE, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2)
+    print_summary(data)
+
+    if config.LOCUST_BUNDLE_BUDGET_KB > 0:
+        violations = budget_violations(data, config.LOCUST_BUNDLE_BUDGET_KB)
+        for page, kb in violations:
+            print(f"✗ {page} [{FIRST_VISIT}]: {kb:.1f} KB (presupuesto {config.LOCUST_BUNDLE_BUDGET_KB} KB)")
+        if violations:
+            environment.process_exit_code = 1
+        else:
+            print(f"✓ Todas las páginas dentro del presupuesto de {config.LOCUST_BUNDLE_BUDGET_KB} KB")
+
+
+@events.init.add_listener
+def on_locust_init(environment, **kwargs):
+    """Combinación de los datos de los workers en el master"""
+    if isinstance(environment.runner, MasterRunner):
+        @environment.events.worker_report.add_listener
+        def on_worker_report(client_id, data, **kw):
+            if data.get('static_assets'):
+                recorder.merge(data['static_assets'])
+
+    elif isinstance(environment.runner, WorkerRunner):
+        @environment.events.report_to_master.add_listener
+        def on_report_to_master(client_id, data, **kw):
+            if recorder.pages:
+                data['static_assets'] = recorder.take()
+
+
+@events.test_start.add_listener
+def on_test_start(environment, **kwargs):
+    """Empezar el acumulado de cero"""
+    recorder.reset()
+
+
+@events.test_stop.add_listener
+def on_test_stop(environment, **kwargs):
+    """Resumen en el proceso local (el master espera a los últimos reportes)"""
+    if environment.runner is None or not isinstance(environment.runner, (MasterRunner, WorkerRunner)):
+        _write_summary(environment)
+
+
+@events.quitting.add_listener
+def on_quitting(environment, **kwargs):
+    """En el master los últimos reportes de los workers llegan después de test_stop"""
+    if isinstance(environment.runner, MasterRunner):
+        _write_summary(environment)
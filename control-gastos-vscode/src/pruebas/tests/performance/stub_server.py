@@ -0,0 +1,454 @@
+"""
+Servidor sustituto (asyncio) de la API de control de gastos
+
+Implementa en memoria los endpoints que usan las pruebas de rendimiento,
+con las mismas rutas, códigos de estado y formas de respuesta que el
+backend Express, para poder ejecutar los escenarios de Locust sin Node
+ni base de datos: medir el propio generador de carga, validar la lógica
+de SLA o correr las pruebas en CI.
+
+Rutas:
+    POST /api/auth/register | /api/auth/login
+    GET  /api/auth/me
+    PUT  /api/auth/settings | /api/auth/profile | /api/auth/password
+    GET|POST /api/expenses (filtro ?month=YYYY-MM), DELETE /api/expenses/:id
+    GET|POST /api/savings-goals, PUT|DELETE /api/savings-goals/:id
+
+Ejecución (desde el directorio 'pruebas'):
+    python -m tests.performance.stub_server --port 3000 --latency-ms 20 --error-rate 0.01
+"""
+import argparse
+import asyncio
+import calendar
+import itertools
+import json
+import random
+import re
+import secrets
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from urllib.parse import urlsplit, parse_qs
+
+STATUS_TEXT = {
+    200: 'OK',
+    400: 'Bad Request',
+    401: 'Unauthorized',
+    404: 'Not Found',
+    500: 'Internal Server Error',
+}
+
+
+def _now():
+    """Marca de tiempo ISO como la serializa Sequelize"""
+    return datetime.now(timezone.utc).isoformat(timespec='milliseconds').replace('+00:00', 'Z')
+
+
+def _decimal(value):
+    """Los DECIMAL de MySQL llegan al cliente como string con 2 decimales"""
+    return f"{float(value or 0):.2f}"
+
+
+class StubApi:
+    """Estado en memoria y lógica de los endpoints"""
+
+    def __init__(self):
+        self.users = {}          # id -> user
+        self.users_by_email = {}  # email -> id
+        self.tokens = {}         # token -> user id
+        self.expenses = {}       # user id -> {expense id -> expense}
+        self.goals = {}          # user id -> {goal id -> goal}
+        self._ids = itertools.count(1)
+
+        self.routes = [
+            ('POST', r'/api/auth/register', self.register, False),
+            ('POST', r'/api/auth/login', self.login, False),
+            ('GET', r'/api/auth/me', self.me, True),
+            ('PUT', r'/api/auth/settings', self.update_settings, True),
+            ('PUT', r'/api/auth/profile', self.update_profile, True),
+            ('PUT', r'/api/auth/password', self.change_password, True),
+            ('GET', r'/api/expenses', self.list_expenses, True),
+            ('POST', r'/api/expenses', self.create_expense, True),
+            ('DELETE', r'/api/expenses/(?P<item_id>\d+)', self.delete_expense, True),
+            ('GET', r'/api/savings-goals', self.list_goals, True),
+            ('POST', r'/api/savings-goals', self.create_goal, True),
+            ('PUT', r'/api/savings-goals/(?P<item_id>\d+)', self.update_goal, True),
+            ('DELETE', r'/api/savings-goals/(?P<item_id>\d+)', self.delete_goal, True),
+        ]
+        self.routes = [(m, re.compile(f"^{p}/?$"), h, a) for m, p, h, a in self.routes]
+
+    def dispatch(self, method, path, query, headers, body):
+        """
+        Resolver una petición
+
+        Returns:
+            Tupla (status, payload)
+        """
+        for route_method, pattern, handler, needs_auth in self.routes:
+            match = pattern.match(path)
+            if not match or route_method != method:
+                continue
+
+            kwargs = dict(match.groupdict(), body=body, query=query)
+            if needs_auth:
+                auth = headers.get('authorization')
+                if not auth:
+                    return 401, {'message': 'No token'}
+                user_id = self.tokens.get(auth.split(' ')[-1])
+                if user_id is None:
+                    return 401, {'message': 'Token inválido'}
+                kwargs['user_id'] = user_id
+            return handler(**kwargs)
+
+        # Igual que app.js: cualquier otro GET responde con el mensaje del backend
+        if method == 'GET':
+            return 200, {'message': 'Backend API running (stub)'}
+        return 404, {'message': 'Not found'}
+
+    def _public_user(self, user):
+        return {k: user[k] for k in ('id', 'email', 'name', 'currency', 'monthly_salary')}
+
+    # Auth
+
+    def register(self, body, **kwargs):
+        email, password = body.get('email'), body.get('password')
+        if not email or not password:
+            return 400, {'message': 'Email y password requeridos'}
+        if email in self.users_by_email:
+            return 400, {'message': 'Usuario ya existe'}
+
+        user = {
+            'id': next(self._ids),
+            'email': email,
+            'password': password,
+            'name': body.get('name'),
+            'currency': body.get('currency') or 'USD',
+            'monthly_salary': None,
+        }
+        self.users[user['id']] = user
+        self.users_by_email[email] = user['id']
+        return 200, {k: user[k] for k in ('id', 'email', 'name', 'currency')}
+
+    def login(self, body, **kwargs):
+        email, password = body.get('email'), body.get('password')
+        if not email or not password:
+            return 400, {'message': 'Email y password requeridos'}
+        user_id = self.users_by_email.get(email)
+        if user_id is None:
+            return 400, {'message': 'Usuario no encontrado'}
+        user = self.users[user_id]
+        if user['password'] != password:
+            return 400, {'message': 'Credenciales inválidas'}
+
+        token = secrets.token_urlsafe(24)
+        self.tokens[token] = user_id
+        return 200, {'token': token, 'user': self._public_user(user)}
+
+    def me(self, user_id, **kwargs):
+        return 200, {'user': self._public_user(self.users[user_id])}
+
+    def update_settings(self, user_id, body, **kwargs):
+        user = self.users[user_id]
+        if body.get('monthly_salary') is not None:
+            user['monthly_salary'] = body['monthly_salary']
+        if body.get('currency'):
+            user['currency'] = body['currency']
+        return 200, {'user': self._public_user(user)}
+
+    def update_profile(self, user_id, body, **kwargs):
+        user = self.users[user_id]
+        email = body.get('email')
+        if email and email != user['email']:
+            if email in self.users_by_email:
+                return 400, {'message': 'El email ya está en uso'}
+            del self.users_by_email[user['email']]
+            self.users_by_email[email] = user_id
+            user['email'] = email
+        if body.get('name'):
+            user['name'] = body['name']
+        return 200, {'user': self._public_user(user)}
+
+    def change_password(self, user_id, body, **kwargs):
+        user = self.users[user_id]
+        current, new = body.get('currentPassword'), body.get('newPassword')
+        if not current or not new:
+            return 400, {'message': 'Contraseña actual y nueva requeridas'}
+        if user['password'] != current:
+            return 400, {'message': 'Contraseña actual incorrecta'}
+        if len(new) < 6:
+            return 400, {'message': 'La nueva contraseña debe tener al menos 6 caracteres'}
+        user['password'] = new
+        return 200, {'message': 'Contraseña actualizada exitosamente'}
+
+    # Gastos
+
+    def list_expenses(self, user_id, query, **kwargs):
+        expenses = list(self.expenses.get(user_id, {}).values())
+
+        month = query.get('month')
+        if month:
+            year, month_num = (int(p) for p in month.split('-'))
+            last_day = calendar.monthrange(year, month_num)[1]
+            start, end = f"{month}-01", f"{month}-{last_day:02d}"
+            expenses = [e for e in expenses if start <= e['date'][:10] <= end]
+
+        expenses.sort(key=lambda e: e['date'], reverse=True)
+        return 200, expenses
+
+    def create_expense(self, user_id, body, **kwargs):
+        now = _now()
+        expense = {
+            'id': next(self._ids),
+            'user_id': user_id,
+            'title': body.get('title'),
+            'amount': _decimal(body.get('amount')),
+            'currency': body.get('currency') or 'USD',
+            'category': body.get('category'),
+            'date': body.get('date') or now[:10],
+            'note': body.get('note'),
+            'createdAt': now,
+            'updatedAt': now,
+        }
+        self.expenses.setdefault(user_id, {})[expense['id']] = expense
+        return 200, expense
+
+    def delete_expense(self, user_id, item_id, **kwargs):
+        if self.expenses.get(user_id, {}).pop(int(item_id), None) is None:
+            return 404, {'message': 'Gasto no encontrado'}
+        return 200, {'message': 'Gasto eliminado'}
+
+    # Metas de ahorro
+
+    def list_goals(self, user_id, **kwargs):
+        goals = sorted(self.goals.get(user_id, {}).values(),
+                       key=lambda g: g['createdAt'], reverse=True)
+        return 200, goals
+
+    def create_goal(self, user_id, body, **kwargs):
+        if not body.get('name') or not body.get('target_amount'):
+            return 400, {'message': 'Nombre y monto objetivo requeridos'}
+        now = _now()
+        goal = {
+            'id': next(self._ids),
+            'user_id': user_id,
+            'name': body['name'],
+            'target_amount': _decimal(body['target_amount']),
+            'current_amount': _decimal(body.get('current_amount')),
+            'deadline': body.get('deadline'),
+            'color': body.get('color') or 'blue',
+            'createdAt': now,
+            'updatedAt': now,
+        }
+        self.goals.setdefault(user_id, {})[goal['id']] = goal
+        return 200, goal
+
+    def update_goal(self, user_id, item_id, body, **kwargs):
+        goal = self.goals.get(user_id, {}).get(int(item_id))
+        if goal is None:
+            return 404, {'message': 'Meta no encontrada'}
+        for field in ('name', 'deadline', 'color'):
+            if field in body:
+                goal[field] = body[field]
+        for field in ('target_amount', 'current_amount'):
+            if field in body:
+                goal[field] = _decimal(body[field])
+        goal['updatedAt'] = _now()
+        return 200, goal
+
+    def delete_goal(self, user_id, item_id, **kwargs):
+        if self.goals.get(user_id, {}).pop(int(item_id), None) is None:
+            return 404, {'message': 'Meta no encontrada'}
+        return 200, {'message': 'Meta eliminada'}
+
+
+class StubServer:
+    """Servidor HTTP/1.1 (keep-alive) sobre asyncio con latencia y errores inyectados"""
+
+    def __init__(self, host='127.0.0.1', port=3000, latency_ms=0, jitter_ms=0,
+                 error_rate=0.0, route_latency_ms=None, seed=None):
+        """
+        Args:
+            host: Interfaz de escucha
+            port: Puerto (0 = puerto libre aleatorio)
+            latency_ms: Latencia media añadida a cada respuesta
+            jitter_ms: Desviación estándar de la latencia
+            error_rate: Proporción de respuestas 500 inyectadas (0.01 = 1%)
+            route_latency_ms: Dict {"MÉTODO /ruta": ms} para latencias por endpoint
+            seed: Semilla para latencias y errores reproducibles
+        """
+        self.host = host
+        self.port = port
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.route_latency_ms = route_latency_ms or {}
+        self.random = random.Random(seed)
+        self.api = StubApi()
+        self._server = None
+        self._connections = set()
+
+    @property
+    def url(self):
+        """URL base del servidor"""
+        return f"http://{self.host}:{self.port}"
+
+    async def start(self):
+        """Empezar a aceptar conexiones"""
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        """Cerrar el servidor y las conexiones keep-alive abiertas"""
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+
+        for task in list(self._connections):
+            task.cancel()
+        await asyncio.gather(*self._connections, return_exceptions=True)
+
+    async def serve_forever(self):
+        """Arrancar y atender peticiones hasta que se cancele"""
+        await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    @contextmanager
+    def run_in_thread(self):
+        """
+        Ejecutar el servidor en un hilo propio durante el bloque 'with'
+
+        Yields:
+            URL base del servidor
+        """
+        loop = asyncio.new_event_loop()
+        started = threading.Event()
+
+        def _run():
+            asyncio.set_event_loop(loop)
+            loop.run_until_complete(self.start())
+            started.set()
+            loop.run_forever()
+
+        thread = threading.Thread(target=_run, daemon=True)
+        thread.start()
+        started.wait()
+        try:
+            yield self.url
+        finally:
+            asyncio.run_coroutine_threadsafe(self.stop(), loop).result()
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+            loop.close()
+
+    def _delay(self, method, path):
+        """Latencia a inyectar en segundos"""
+        base = self.latency_ms
+        for route, ms in self.route_latency_ms.items():
+            route_method, route_path = route.split(' ', 1)
+            if route_method == method and path.startswith(route_path):
+                base = ms
+                break
+        if self.jitter_ms:
+            base = self.random.gauss(base, self.jitter_ms)
+        return max(0.0, base) / 1000
+
+    async def _handle_connection(self, reader, writer):
+        """Atender peticiones de una conexión hasta que se cierre"""
+        task = asyncio.current_task()
+        self._connections.add(task)
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, target, version = request_line.decode('latin-1').split()
+
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+
+                length = int(headers.get('content-length', 0))
+                raw_body = await reader.readexactly(length) if length else b''
+
+                status, payload = await self._respond(method, target, headers, raw_body)
+                data = json.dumps(payload).encode('utf-8')
+
+                keep_alive = (version == 'HTTP/1.1'
+                              and headers.get('connection', '').lower() != 'close')
+                writer.write(
+                    f"HTTP/1.1 {status} {STATUS_TEXT.get(status, '')}\r\n"
+                    f"Content-Type: application/json; charset=utf-8\r\n"
+                    f"Content-Length: {len(data)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+                    f"\r\n".encode('latin-1') + data
+                )
+                await writer.drain()
+
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError, asyncio.CancelledError):
+            # CancelledError: el servidor se está deteniendo
+            pass
+        finally:
+            self._connections.discard(task)
+            writer.close()
+
+    async def _respond(self, method, target, headers, raw_body):
+        """Aplicar latencia/errores inyectados y despachar la petición"""
+        url = urlsplit(target)
+        query = {k: v[0] for k, v in parse_qs(url.query).items()}
+
+        delay = self._delay(method, url.path)
+        if delay:
+            await asyncio.sleep(delay)
+
+        if self.error_rate and self.random.random() < self.error_rate:
+            return 500, {'message': 'error'}
+
+        try:
+            body = json.loads(raw_body) if raw_body else {}
+        except ValueError:
+            return 400, {'message': 'JSON inválido'}
+
+        try:
+            return self.api.dispatch(method, url.path, query, headers, body)
+        except Exception:
+            return 500, {'message': 'error'}
+
+
+def main():
+    """CLI para levantar el servidor sustituto"""
+    parser = argparse.ArgumentParser(description='Servidor sustituto de la API de gastos')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=3000)
+    parser.add_argument('--latency-ms', type=float, default=0, help='Latencia media por respuesta')
+    parser.add_argument('--jitter-ms', type=float, default=0, help='Desviación de la latencia')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Proporción de errores 500')
+    parser.add_argument('--route-latency', default=None,
+                        help='JSON {"MÉTODO /ruta": ms}, p. ej. \'{"POST /api/auth/login": 150}\'')
+    parser.add_argument('--seed', type=int, default=None)
+    args = parser.parse_args()
+
+    server = StubServer(
+        host=args.host,
+        port=args.port,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        route_latency_ms=json.loads(args.route_latency) if args.route_latency else None,
+        seed=args.seed,
+    )
+    print(f"Servidor sustituto escuchando en http://{args.host}:{args.port}")
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,200 @@
+"""
+Pool de usuarios pre-registrados para las pruebas de carga
+
+Registrar y hacer login (bcrypt) en el on_start de cada usuario simulado
+genera una ráfaga de carga al inicio que distorsiona las latencias de los
+endpoints que queremos medir. En su lugar, se crean N usuarios una sola
+vez, se guardan sus tokens en un archivo y los usuarios de Locust los toman
+de ese pool.
+
+Pre-aprovisionar desde línea de comandos (desde el directorio 'pruebas'):
+    python -m tests.performance.user_pool --users 100 --host http://localhost:3000
+
+Si el archivo no existe (o sus tokens ya no son válidos), el master lo
+genera automáticamente en events.test_start.
+
+En modo distribuido el master envía las cuentas a los workers con un
+mensaje 'user_pool', así que los workers no necesitan acceso al archivo
+(p. ej. si corren en otra máquina).
+"""
+from locust import events
+from locust.runners import MasterRunner, WorkerRunner
+import argparse
+import itertools
+import json
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+import gevent
+import requests
+from config.config import config
+from utils.api_client import ApiClient
+from utils.data_generators import unique_email
+
+logger = logging.getLogger(__name__)
+
+
+class UserPool:
+    """Cuentas pre-registradas repartidas en round-robin entre los usuarios simulados"""
+
+    def __init__(self, accounts=None):
+        self.reset(accounts or [])
+
+    def reset(self, accounts):
+        """Reemplazar las cuentas del pool"""
+        self.accounts = list(accounts)
+        self._cycle = itertools.cycle(self.accounts) if self.accounts else None
+
+    def acquire(self):
+        """
+        Obtener la siguiente cuenta del pool
+
+        Returns:
+            Dict con email, password, token y user_id, o None si el pool está vacío
+        """
+        if self._cycle is None:
+            return None
+        return next(self._cycle)
+
+    def __len__(self):
+        return len(self.accounts)
+
+
+# Pool compartido por todos los usuarios simulados del proceso
+pool = UserPool()
+
+
+def provision_users(count, host=None, max_workers=None):
+    """
+    Registrar y autenticar 'count' usuarios en paralelo
+
+    Args:
+        count: Número de cuentas a crear
+        host: URL del backend (default: config.API_URL)
+        max_workers: Registros concurrentes (default: config.SEED_WORKERS)
+
+    Returns:
+        Lista de cuentas con email, password, token y user_id
+    """
+    password = config.TEST_USER_PASSWORD
+
+    def _create(_):
+        email = unique_email('pool')
+        client = ApiClient(base_url=host)
+        if config.DATA_SEED:
+            data = client.register_or_login(email, password)
+        else:
+            client.register(email, password)
+            data = client.login(email, password)
+        return {
+            'email': email,
+            'password': password,
+            'token': data['token'],
+            'user_id': data['user']['id'],
+        }
+
+    with ThreadPoolExecutor(max_workers=max_workers or config.SEED_WORKERS) as executor:
+        return list(executor.map(_create, range(count)))
+
+
+def save_pool(accounts, path=None):
+    """Guardar las cuentas en el archivo del pool"""
+    path = path or config.LOCUST_USER_POOL_FILE
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(accounts, f, indent=2)
+
+
+def load_pool(path=None):
+    """
+    Leer las cuentas del archivo del pool
+
+    Returns:
+        Lista de cuentas (vacía si el archivo no existe)
+    """
+    path = path or config.LOCUST_USER_POOL_FILE
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return []
+
+
+def is_pool_valid(accounts, host=None):
+    """Verificar con la primera cuenta que los tokens siguen siendo aceptados"""
+    if not accounts:
+        return False
+    try:
+        ApiClient(base_url=host, token=accounts[0]['token']).me()
+        return True
+    except requests.RequestException:
+        return False
+
+
+def on_pool_message(environment, msg, **kwargs):
+    """Recibir en el worker las cuentas que envía el master"""
+    pool.reset(msg.data)
+
+
+@events.init.add_listener
+def on_locust_init(environment, **kwargs):
+    """Registrar en los workers el mensaje con las cuentas del pool"""
+    if isinstance(environment.runner, WorkerRunner):
+        environment.runner.register_message('user_pool', on_pool_message)
+
+
+@events.test_start.add_listener
+def on_test_start(environment, **kwargs):
+    """
+    Cargar el pool antes de lanzar usuarios
+
+    Solo el master (o el proceso local) crea cuentas y las envía a los
+    workers; un worker solo lee el archivo si no ha recibido el mensaje.
+    Si no se pueden crear las cuentas la prueba se detiene con código 1:
+    con el pool vacío cada usuario se registraría en su on_start, que es
+    justo la carga que el pool evita.
+    """
+    if not config.LOCUST_USER_POOL:
+        return
+
+    if isinstance(environment.runner, WorkerRunner):
+        if not len(pool):
+            pool.reset(load_pool())
+        return
+
+    accounts = load_pool()
+    if not is_pool_valid(accounts, environment.host):
+        size = config.LOCUST_USER_POOL_SIZE
+        print(f"Pre-aprovisionando {size} usuarios para la prueba de carga...")
+        try:
+            accounts = provision_users(size, host=environment.host)
+        except Exception as e:
+            logger.error("No se pudo pre-aprovisionar el pool de usuarios: %s", e)
+            print("✗ Pool de usuarios vacío: se detiene la prueba (LOCUST_USER_POOL=false para no usarlo)")
+            environment.process_exit_code = 1
+            gevent.spawn(environment.runner.quit)
+            return
+        save_pool(accounts)
+
+    pool.reset(accounts)
+    if isinstance(environment.runner, MasterRunner):
+        environment.runner.send_message('user_pool', accounts)
+
+
+def main():
+    """CLI para generar el archivo del pool antes de la prueba"""
+    parser = argparse.ArgumentParser(description='Pre-aprovisionar usuarios para Locust')
+    parser.add_argument('--users', type=int, default=config.LOCUST_USER_POOL_SIZE,
+                        help='Número de usuarios a crear')
+    parser.add_argument('--host', default=config.API_URL, help='URL del backend')
+    parser.add_argument('--output', default=config.LOCUST_USER_POOL_FILE,
+                        help='Archivo JSON de salida')
+    args = parser.parse_args()
+
+    accounts = provision_users(args.users, host=args.host)
+    save_pool(accounts, args.output)
+    print(f"✓ {len(accounts)} usuarios guardados en {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,159 @@
+"""
+Cliente HTTP para la API del backend
+
+Permite preparar el estado de las pruebas (autenticación, datos)
+sin pasar por la interfaz gráfica.
+"""
+import requests
+from requests.adapters import HTTPAdapter
+from config.config import config
+
+
+class ApiClient:
+    """Cliente de la API REST del sistema de control de gastos"""
+
+    def __init__(self, base_url=None, token=None, pool_size=None):
+        """
+        Args:
+            base_url: URL del backend (default: config.API_URL)
+            token: JWT para las peticiones autenticadas
+            pool_size: Conexiones HTTP reutilizables (para uso desde varios hilos)
+        """
+        self.base_url = (base_url or config.API_URL).rstrip('/')
+        self.token = token
+        self.session = requests.Session()
+
+        if pool_size:
+            adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+            self.session.mount('http://', adapter)
+            self.session.mount('https://', adapter)
+
+    def _request(self, method, path, **kwargs):
+        """Ejecutar petición y lanzar excepción si la respuesta no es 2xx"""
+        headers = kwargs.pop('headers', {})
+        if self.token:
+            headers['Authorization'] = f"Bearer {self.token}"
+
+        response = self.session.request(
+            method,
+            f"{self.base_url}{path}",
+            headers=headers,
+            timeout=config.API_TIMEOUT,
+            **kwargs
+        )
+        response.raise_for_status()
+        return response.json()
+
+    def login(self, email, password):
+        """
+        Iniciar sesión y guardar el token en el cliente
+
+        Returns:
+            Dict con 'token' y 'user' (misma respuesta que usa el frontend)
+        """
+        data = self._request('POST', '/api/auth/login', json={
+            'email': email,
+            'password': password
+        })
+        self.token = data['token']
+        return data
+
+    def register(self, email, password, name=None, currency=None):
+        """
+        Registrar un usuario nuevo
+
+        Returns:
+            Dict con los datos del usuario creado
+        """
+        return self._request('POST', '/api/auth/register', json={
+            'email': email,
+            'password': password,
+            'name': name or config.TEST_USER_NAME,
+            'currency': currency or config.TEST_USER_CURRENCY
+        })
+
+    def register_or_login(self, email, password, name=None):
+        """
+        Registrar un usuario o, si ya existe, iniciar sesión con él
+
+        Con DATA_SEED los emails se repiten entre ejecuciones: la segunda vez
+        el registro responde 400 y la cuenta se reutiliza.
+
+        Returns:
+            Dict con 'token' y 'user' del login
+        """
+        try:
+            self.register(email, password, name)
+        except requests.HTTPError as e:
+            if e.response is None or e.response.status_code != 400:
+                raise
+        return self.login(email, password)
+
+    def me(self):
+        """Obtener el usuario autenticado"""
+        return self._request('GET', '/api/auth/me')['user']
+
+    def list_expenses(self, month=None):
+        """Listar gastos del usuario (month con formato YYYY-MM)"""
+        params = {'month': month} if month else None
+        return self._request('GET', '/api/expenses', params=params)
+
+    def create_expense(self, expense):
+        """
+        Crear un gasto
+
+        Args:
+            expense: Dict con title, amount, currency, category, date, note
+
+        Returns:
+            Gasto creado (incluye 'id')
+        """
+        return self._request('POST', '/api/expenses', json=expense)
+
+    def delete_expense(self, expense_id):
+        """Eliminar un gasto"""
+        return self._request('DELETE', f'/api/expenses/{expense_id}')
+
+    def list_savings_goals(self):
+        """Listar metas de ahorro del usuario"""
+        return self._request('GET', '/api/savings-goals')
+
+    def create_savings_goal(self, goal):
+        """
+        Crear una meta de ahorro
+
+        Args:
+            goal: Dict con name, target_amount, current_amount, deadline, color
+
+        Returns:
+            Meta creada (incluye 'id')
+        """
+        return self._request('POST', '/api/savings-goals', json=goal)
+
+    def delete_savings_goal(self, goal_id):
+        """Eliminar una meta de ahorro"""
+        return self._request('DELETE', f'/api/savings-goals/{goal_id}')
+
+
+# Sesiones ya obtenidas en este proceso: (email, password) -> respuesta de login
+_sessions = {}
+
+
+def get_auth_session(email=None, password=None):
+    """
+    Obtener token y usuario vía API, haciendo login una sola vez por proceso
+
+    Args:
+        email: Email del usuario (default: config.TEST_USER_EMAIL)
+        password: Contraseña (default: config.TEST_USER_PASSWORD)
+
+    Returns:
+        Dict con 'token' y 'user'
+    """
+    email = email or config.TEST_USER_EMAIL
+    password = password or config.TEST_USER_PASSWORD
+
+    key = (email, password)
+    if key not in _sessions:
+        _sessions[key] = ApiClient().login(email, password)
+    return _sessions[key]
@@ -0,0 +1,317 @@
+"""
+Métricas de rendimiento del navegador por visita de página
+
+Las pruebas funcionales solo verifican textos; este módulo mide cuánto
+tardan en pintarse las páginas de React. Por cada visita se guardan:
+
+- Navigation Timing (TTFB, DOMContentLoaded, load) en cargas completas
+- Paint Timing: First Paint, First Contentful Paint y Largest Contentful Paint
+- Long tasks (> 50 ms en el hilo principal)
+- Resource Timing de cada petición (scripts, CSS, llamadas a la API...)
+
+Una "visita" es una carga completa (driver.get) o un cambio de ruta de
+React Router (history.pushState / popstate). Cada documento guarda sus
+visitas en sessionStorage al descargarse, así que se recogen todas las de
+la prueba al final, con una sola llamada.
+
+En Chrome el script se registra con CDP antes de que corra la app; en
+otros navegadores se inyecta al recoger (las long tasks anteriores y los
+cambios de ruta de documentos previos se pierden).
+"""
+import argparse
+import html
+import json
+import os
+import statistics
+from collections import defaultdict
+from datetime import datetime
+from urllib.parse import urlsplit
+from config.config import config
+
+# Clave de sessionStorage con las visitas de documentos ya descargados
+STORAGE_KEY = '__perfVisits'
+
+# Peticiones más lentas que se muestran en el reporte HTML
+SLOWEST_RESOURCES = 3
+
+CAPTURE_JS = """
+(function () {
+    if (window.__perfCapture || !window.performance) { return; }
+    var state = window.__perfCapture = {lcp: null, longTasks: [], routes: []};
+
+    function route(type) {
+        state.routes.push({url: location.href, type: type, start: type === 'load' ? 0 : performance.now()});
+    }
+    route('load');
+
+    function observe(type, callback) {
+        try {
+            new PerformanceObserver(function (list) { list.getEntries().forEach(callback); })
+                .observe({type: type, buffered: true});
+        } catch (e) { /* tipo no soportado por el navegador */ }
+    }
+    observe('largest-contentful-paint', function (entry) { state.lcp = entry.startTime; });
+    observe('longtask', function (entry) {
+        state.longTasks.push({start: entry.startTime, duration: entry.duration});
+    });
+
+    ['pushState', 'replaceState'].forEach(function (name) {
+        var original = history[name];
+        history[name] = function () {
+            var result = original.apply(this, arguments);
+            var last = state.routes[state.routes.length - 1];
+            if (last && (name === 'replaceState' || last.url === location.href)) {
+                // Redirecciones internas: misma visita con la URL final
+                last.url = location.href;
+            } else {
+                route('route');
+            }
+            return result;
+        };
+    });
+    window.addEventListener('popstate', function () { route('route'); });
+
+    window.__perfSnapshot = function () {
+        var navigation = performance.getEntriesByType('navigation')[0];
+        var paints = {};
+        performance.getEntriesByType('paint').forEach(function (entry) {
+            paints[entry.name] = entry.startTime;
+        });
+        var resources = performance.getEntriesByType('resource');
+
+        return state.routes.map(function (visit, i) {
+            var end = i + 1 < state.routes.length ? state.routes[i + 1].start : Infinity;
+            function inside(start) { return start >= visit.start && start < end; }
+            var result = {
+                url: visit.url,
+                type: visit.type,
+                start: visit.start,
+                longTasks: state.longTasks.filter(function (t) { return inside(t.start); }),
+                resources: resources.filter(function (r) { return inside(r.startTime); }).map(function (r) {
+                    return {
+                        name: r.name,
+                        initiator: r.initiatorType,
+                        start: r.startTime - visit.start,
+                        duration: r.duration,
+                        transferSize: r.transferSize || 0,
+                        encodedBodySize: r.encodedBodySize || 0
+                    };
+                })
+            };
+            if (visit.type === 'load') {
+                result.navigation = navigation ? navigation.toJSON() : null;
+                result.firstPaint = paints['first-paint'] || null;
+                result.firstContentfulPaint = paints['first-contentful-paint'] || null;
+                result.largestContentfulPaint = state.lcp;
+            }
+            return result;
+        });
+    };
+
+    window.addEventListener('pagehide', function () {
+        try {
+            var saved = JSON.parse(sessionStorage.getItem('%(key)s') || '[]');
+            sessionStorage.setItem('%(key)s', JSON.stringify(saved.concat(window.__perfSnapshot())));
+            // Si la página vuelve desde la caché (bfcache) no se guarda dos veces
+            state.routes = [];
+            state.longTasks = [];
+        } catch (e) { /* sessionStorage no disponible (about:blank, data:) */ }
+    });
+})();
+""" % {'key': STORAGE_KEY}
+
+COLLECT_JS = """
+var saved = [];
+try {
+    saved = JSON.parse(sessionStorage.getItem(arguments[0]) || '[]');
+    sessionStorage.removeItem(arguments[0]);
+} catch (e) { /* sin sessionStorage */ }
+var current = window.__perfSnapshot ? window.__perfSnapshot() : [];
+if (window.__perfCapture) {
+    // Lo recogido no se repite si el navegador se reutiliza (DRIVER_POOL)
+    window.__perfCapture.routes = [];
+    window.__perfCapture.longTasks = [];
+}
+return saved.concat(current);
+"""
+
+
+def install_capture(driver):
+    """
+    Registrar la captura para que se ejecute en cada documento nuevo (Chrome)
+
+    Args:
+        driver: WebDriver instance
+    """
+    if hasattr(driver, 'execute_cdp_cmd'):
+        driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {'source': CAPTURE_JS})
+
+
+def summarize_visit(visit):
+    """
+    Métricas principales de una visita (ms, redondeadas)
+
+    Args:
+        visit: Visita tal como la devuelve collect_visits()
+
+    Returns:
+        Dict con url, type, ttfb, dom_content_loaded, load, fcp, lcp,
+        long_tasks, long_tasks_ms, requests, transfer_kb y slowest
+    """
+    navigation = visit.get('navigation') or {}
+
+    def _ms(value):
+        return round(value) if value else None
+
+    resources = visit.get('resources', [])
+    slowest = sorted(resources, key=lambda r: r['duration'], reverse=True)[:SLOWEST_RESOURCES]
+    return {
+        'url': visit['url'],
+        'type': visit['type'],
+        'ttfb': _ms(navigation.get('responseStart', 0) - navigation.get('requestStart', 0)),
+        'dom_content_loaded': _ms(navigation.get('domContentLoadedEventEnd')),
+        'load': _ms(navigation.get('loadEventEnd')),
+        'fcp': _ms(visit.get('firstContentfulPaint')),
+        'lcp': _ms(visit.get('largestContentfulPaint')),
+        'long_tasks': len(visit.get('longTasks', [])),
+        'long_tasks_ms': round(sum(t['duration'] for t in visit.get('longTasks', []))),
+        'requests': len(resources),
+        'transfer_kb': round(sum(r['transferSize'] for r in resources) / 1024, 1),
+        'slowest': [{'name': r['name'], 'duration': round(r['duration'])} for r in slowest],
+    }
+
+
+def collect_visits(driver):
+    """
+    Recoger las visitas de la prueba y vaciar las guardadas
+
+    Args:
+        driver: WebDriver instance
+
+    Returns:
+        Lista de visitas (vacía si el navegador no responde)
+    """
+    try:
+        driver.execute_script(CAPTURE_JS)
+        return driver.execute_script(COLLECT_JS, STORAGE_KEY) or []
+    except Exception:
+        # Sin navegador no hay métricas; el resultado de la prueba no debe cambiar
+        return []
+
+
+def write_visits(nodeid, visits, path=None):
+    """
+    Añadir las visitas de una prueba al archivo JSON lines
+
+    Cada línea es una visita completa (con todas sus peticiones) más el
+    test, la fecha y el perfil de dispositivo, para seguir tendencias
+    entre ejecuciones y comparar perfiles.
+
+    Args:
+        nodeid: Id de pytest de la prueba
+        visits: Lista de visitas de collect_visits()
+        path: Archivo de salida (default: config.BROWSER_METRICS_FILE)
+    """
+    if not visits:
+        return
+    path = path or config.BROWSER_METRICS_FILE
+    timestamp = datetime.now().isoformat(timespec='seconds')
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    lines = ''.join(
+        json.dumps({'test': nodeid, 'timestamp': timestamp,
+                    'profile': config.BROWSER_PROFILE or 'none',
+                    'summary': summarize_visit(visit), **visit}) + '\n'
+        for visit in visits
+    )
+    # Una sola escritura: con xdist varios procesos añaden al mismo archivo
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write(lines)
+
+
+def html_cell(summaries):
+    """
+    Celda del reporte pytest-html con una línea por visita
+
+    Args:
+        summaries: Lista de resultados de summarize_visit()
+
+    Returns:
+        String HTML '<td>...</td>'
+    """
+    lines = []
+    for s in summaries:
+        parts = [f"<b>{html.escape(urlsplit(s['url']).path or '/')}</b>"]
+        if s['type'] == 'load':
+            parts.append(f"FCP {s['fcp']} ms · LCP {s['lcp']} ms · load {s['load']} ms")
+        parts.append(f"{s['requests']} req · {s['transfer_kb']} KB")
+        if s['long_tasks']:
+            parts.append(f"{s['long_tasks']} long tasks ({s['long_tasks_ms']} ms)")
+        lines.append(' · '.join(parts))
+    return f"<td>{'<br>'.join(lines)}</td>"
+
+
+def summarize_profiles(path=None):
+    """
+    Medianas de las cargas completas por perfil y página
+
+    Args:
+        path: Archivo JSON lines (default: config.BROWSER_METRICS_FILE)
+
+    Returns:
+        Dict {(perfil, ruta): {'visits', 'fcp', 'lcp', 'load', 'transfer_kb'}}
+    """
+    path = path or config.BROWSER_METRICS_FILE
+    groups = defaultdict(list)
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            summary = record['summary']
+            if summary['type'] != 'load':
+                continue
+            page = urlsplit(summary['url']).path or '/'
+            groups[(record.get('profile', 'none'), page)].append(summary)
+
+    def _median(summaries, key):
+        values = [s[key] for s in summaries if s[key] is not None]
+        return round(statistics.median(values)) if values else None
+
+    return {
+        key: {
+            'visits': len(summaries),
+            'fcp': _median(summaries, 'fcp'),
+            'lcp': _median(summaries, 'lcp'),
+            'load': _median(summaries, 'load'),
+            'transfer_kb': _median(summaries, 'transfer_kb'),
+        }
+        for key, summaries in sorted(groups.items())
+    }
+
+
+def main():
+    """CLI: python -m utils.browser_metrics [archivo]"""
+    parser = argparse.ArgumentParser(
+        description='Resumir las métricas del navegador por perfil de dispositivo y página')
+    parser.add_argument('path', nargs='?', default=config.BROWSER_METRICS_FILE,
+                        help='Archivo JSON lines de las pruebas funcionales')
+    args = parser.parse_args()
+
+    try:
+        results = summarize_profiles(args.path)
+    except OSError:
+        print(f"✗ No se encontraron métricas en {args.path}")
+        raise SystemExit(1)
+
+    print("\n" + "=" * 60)
+    print("CARGA DE PÁGINAS POR PERFIL (medianas, ms)")
+    print("=" * 60)
+    print(f"{'Perfil':<15} {'Página':<20} {'Visitas':>7} {'FCP':>6} {'LCP':>6} {'load':>6} {'KB':>7}")
+    for (profile, page), r in results.items():
+        print(f"{profile:<15} {page:<20} {r['visits']:>7} {str(r['fcp']):>6} "
+              f"{str(r['lcp']):>6} {str(r['load']):>6} {str(r['transfer_kb']):>7}")
+    print("=" * 60 + "\n")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,117 @@
+"""
+Generación de datos únicos para pruebas concurrentes
+
+Los identificadores combinan worker + proceso + contador monotónico, por
+lo que no colisionan aunque se generen muchos en el mismo segundo desde
+varios workers de xdist o usuarios de Locust.
+
+Con DATA_SEED (o seed=...) la secuencia es reproducible: no se usan pid
+ni marca de tiempo, solo la semilla, el worker y el contador. Los workers
+de Locust no tienen PYTEST_XDIST_WORKER, así que al arrancar cambian su id
+por su índice de worker con set_worker_id() (listener de events.init al
+final de este módulo).
+
+Como la secuencia se repite, en una segunda ejecución contra la misma base
+de datos las cuentas ya existen: quien las registra usa
+ApiClient.register_or_login() para reutilizarlas.
+"""
+import itertools
+import os
+import random
+import sys
+import threading
+import uuid
+from config.config import config
+
+
+def current_worker_id():
+    """
+    Id del worker actual
+
+    Returns:
+        'gw0', 'gw1'... con pytest-xdist, o 'main' en un proceso único
+    """
+    return os.getenv('PYTEST_XDIST_WORKER', 'main')
+
+
+class UniqueDataGenerator:
+    """Generador de emails, títulos y montos únicos"""
+
+    def __init__(self, seed=None, worker_id=None):
+        """
+        Args:
+            seed: Semilla para generar datos reproducibles (default: sin semilla)
+            worker_id: Id del worker (default: detectado del entorno)
+        """
+        self.seed = seed
+        self.random = random.Random(seed)
+        self._counter = itertools.count(1)
+        self._lock = threading.Lock()
+        self.set_worker_id(worker_id or current_worker_id())
+
+    def set_worker_id(self, worker_id):
+        """
+        Cambiar el id del worker que forma parte de los identificadores
+
+        Args:
+            worker_id: Id único entre los procesos de la misma ejecución
+        """
+        self.worker_id = worker_id
+        if self.seed is None:
+            # pid + token aleatorio: único entre procesos, máquinas y ejecuciones
+            self.prefix = f"{self.worker_id}_{os.getpid()}_{uuid.uuid4().hex[:6]}"
+        else:
+            self.prefix = f"{self.worker_id}_s{self.seed}"
+
+    def next_id(self):
+        """Siguiente identificador único del generador"""
+        with self._lock:
+            n = next(self._counter)
+        return f"{self.prefix}_{n}"
+
+    def email(self, prefix='test', domain='example.com'):
+        """Email único, p. ej. test_gw0_1234_a1b2c3_1@example.com"""
+        return f"{prefix}_{self.next_id()}@{domain}"
+
+    def title(self, prefix='Gasto Test'):
+        """Título único para gastos o metas"""
+        return f"{prefix} {self.next_id()}"
+
+    def amount(self, low=10, high=500):
+        """Monto aleatorio con dos decimales"""
+        with self._lock:
+            return round(self.random.uniform(low, high), 2)
+
+    def choice(self, options):
+        """Elemento aleatorio de 'options'"""
+        with self._lock:
+            return self.random.choice(options)
+
+
+# Generador compartido por todo el proceso
+generator = UniqueDataGenerator(seed=config.DATA_SEED)
+
+
+def unique_email(prefix='test'):
+    """Email único usando el generador compartido"""
+    return generator.email(prefix)
+
+
+def unique_title(prefix='Gasto Test'):
+    """Título único usando el generador compartido"""
+    return generator.title(prefix)
+
+
+def on_locust_init(environment, **kwargs):
+    """Id propio para cada worker de Locust (todos serían 'main')"""
+    from locust.runners import WorkerRunner
+    runner = environment.runner
+    if isinstance(runner, WorkerRunner) and generator.worker_id == 'main':
+        index = runner.worker_index
+        generator.set_worker_id(f"lw{index}" if index >= 0 else f"lw{os.getpid()}")
+
+
+# Solo dentro de Locust: importar locust fuera de él parchea gevent (Selenium)
+if 'locust' in sys.modules:
+    from locust import events
+    events.init.add_listener(on_locust_init)
@@ -0,0 +1,146 @@
+"""
+Creación y limpieza de datos de prueba vía API REST
+
+Los datos se crean en paralelo con un pool de conexiones compartido y
+cada id creado se registra para poder borrarlo al terminar la prueba.
+"""
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+import requests
+from config.config import config
+from utils.api_client import ApiClient
+
+logger = logging.getLogger(__name__)
+
+
+class DataSeeder:
+    """Crea gastos y metas de ahorro y los elimina en el teardown"""
+
+    def __init__(self, token, max_workers=None, base_url=None):
+        """
+        Args:
+            token: JWT del usuario dueño de los datos
+            max_workers: Peticiones concurrentes (default: config.SEED_WORKERS)
+            base_url: URL del backend (default: config.API_URL)
+        """
+        self.max_workers = max_workers or config.SEED_WORKERS
+        self.client = ApiClient(base_url=base_url, token=token, pool_size=self.max_workers)
+        self.expense_ids = []
+        self.goal_ids = []
+
+    def seed_expenses(self, expenses):
+        """
+        Crear gastos en paralelo
+
+        Args:
+            expenses: Lista de dicts con los datos de cada gasto
+
+        Returns:
+            Lista de gastos creados
+        """
+        created = self._run(self.client.create_expense, expenses)
+        self.expense_ids.extend(e['id'] for e in created)
+        return created
+
+    def seed_savings_goals(self, goals):
+        """
+        Crear metas de ahorro en paralelo
+
+        Args:
+            goals: Lista de dicts con los datos de cada meta
+
+        Returns:
+            Lista de metas creadas
+        """
+        created = self._run(self.client.create_savings_goal, goals)
+        self.goal_ids.extend(g['id'] for g in created)
+        return created
+
+    def cleanup(self):
+        """
+        Eliminar en paralelo todo lo creado por este seeder
+
+        Si falla el borrado de gastos se borran igualmente las metas y el
+        error se relanza al final.
+        """
+        try:
+            self._run(self._delete_expense, self.expense_ids)
+        finally:
+            try:
+                self._run(self._delete_goal, self.goal_ids)
+            finally:
+                self.expense_ids = []
+                self.goal_ids = []
+
+    def delete_all(self):
+        """Eliminar todos los gastos y metas del usuario, no solo los creados aquí"""
+        self.expense_ids = [e['id'] for e in self.client.list_expenses()]
+        self.goal_ids = [g['id'] for g in self.client.list_savings_goals()]
+        self.cleanup()
+
+    def _delete_expense(self, expense_id):
+        """Eliminar un gasto ignorando los que ya no existen"""
+        return self._ignore_missing(self.client.delete_expense, expense_id)
+
+    def _delete_goal(self, goal_id):
+        """Eliminar una meta ignorando las que ya no existen"""
+        return self._ignore_missing(self.client.delete_savings_goal, goal_id)
+
+    @staticmethod
+    def _ignore_missing(func, item_id):
+        """La prueba pudo haber borrado el registro desde la interfaz"""
+        try:
+            return func(item_id)
+        except requests.HTTPError as e:
+            if e.response is not None and e.response.status_code == 404:
+                return None
+            raise
+
+    def _run(self, func, items):
+        """Aplicar func a cada elemento usando el pool de hilos"""
+        if not items:
+            return []
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return list(executor.map(func, items))
+
+
+def build_expense(title, amount=100.0, category='other', expense_date=None, note=''):
+    """
+    Construir el payload de un gasto
+
+    Args:
+        title: Título del gasto
+        amount: Monto
+        category: Valor de categoría del frontend ('food', 'transport'...)
+        expense_date: date o string YYYY-MM-DD (default: hoy)
+        note: Nota opcional
+
+    Returns:
+        Dict listo para POST /api/expenses
+    """
+    expense_date = expense_date or date.today()
+    return {
+        'title': title,
+        'amount': round(amount, 2),
+        'currency': config.TEST_USER_CURRENCY,
+        'category': category,
+        'date': str(expense_date),
+        'note': note,
+    }
+
+
+def build_savings_goal(name, target_amount=1000.0, current_amount=0.0, deadline=None, color='blue'):
+    """
+    Construir el payload de una meta de ahorro
+
+    Returns:
+        Dict listo para POST /api/savings-goals
+    """
+    return {
+        'name': name,
+        'target_amount': round(target_amount, 2),
+        'current_amount': round(current_amount, 2),
+        'deadline': str(deadline) if deadline else None,
+        'color': color,
+    }
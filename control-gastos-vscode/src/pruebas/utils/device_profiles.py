@@ -0,0 +1,91 @@
+"""
+Perfiles de dispositivo y red para las pruebas con Chrome
+
+Cada perfil combina limitación de red, limitación de CPU y tamaño de
+pantalla, y se aplica con Chrome DevTools Protocol al crear el driver
+(BROWSER_PROFILE). Así la suite mide las páginas en las condiciones de
+los usuarios de móvil y no solo en la máquina de desarrollo.
+
+Los valores de red siguen los presets de DevTools/Lighthouse; la latencia
+es el RTT añadido a cada petición (ms) y el ancho de banda está en kbit/s.
+"""
+from config.config import config
+
+PROFILES = {
+    'fiber-desktop': {
+        'description': 'Escritorio con fibra',
+        'latency_ms': 5, 'download_kbps': 100000, 'upload_kbps': 50000,
+        'cpu_slowdown': 1, 'width': 1920, 'height': 1080, 'mobile': False,
+    },
+    '4g-mobile': {
+        'description': 'Móvil gama media con 4G lento (perfil móvil de Lighthouse)',
+        'latency_ms': 150, 'download_kbps': 1600, 'upload_kbps': 750,
+        'cpu_slowdown': 4, 'width': 412, 'height': 823, 'mobile': True,
+    },
+    '3g-mobile': {
+        'description': 'Móvil con 3G (Fast 3G de DevTools)',
+        'latency_ms': 563, 'download_kbps': 1440, 'upload_kbps': 675,
+        'cpu_slowdown': 4, 'width': 412, 'height': 823, 'mobile': True,
+    },
+    'slow-cpu-4x': {
+        'description': 'Solo CPU 4 veces más lenta, sin limitar la red',
+        'latency_ms': 0, 'download_kbps': 0, 'upload_kbps': 0,
+        'cpu_slowdown': 4, 'width': 1920, 'height': 1080, 'mobile': False,
+    },
+}
+
+
+def get_profile(name):
+    """
+    Buscar un perfil por nombre
+
+    Args:
+        name: Clave de PROFILES
+
+    Returns:
+        Dict del perfil
+    """
+    try:
+        return PROFILES[name]
+    except KeyError:
+        raise ValueError(f"Perfil de dispositivo desconocido: '{name}' "
+                         f"(disponibles: {', '.join(PROFILES)})")
+
+
+def _bytes_per_second(kbps):
+    """kbit/s a bytes/s; 0 o menos = sin límite (-1 en CDP)"""
+    return kbps * 1000 / 8 if kbps > 0 else -1
+
+
+def apply_profile(driver, name=None):
+    """
+    Aplicar un perfil a un driver de Chrome
+
+    Args:
+        driver: WebDriver de Chrome
+        name: Nombre del perfil (default: config.BROWSER_PROFILE; vacío = ninguno)
+    """
+    name = name if name is not None else config.BROWSER_PROFILE
+    if not name:
+        return
+
+    profile = get_profile(name)
+    if not hasattr(driver, 'execute_cdp_cmd'):
+        raise ValueError(f"El perfil '{name}' requiere Chrome (usa CDP)")
+
+    driver.execute_cdp_cmd('Network.enable', {})
+    driver.execute_cdp_cmd('Network.emulateNetworkConditions', {
+        'offline': False,
+        'latency': profile['latency_ms'],
+        'downloadThroughput': _bytes_per_second(profile['download_kbps']),
+        'uploadThroughput': _bytes_per_second(profile['upload_kbps']),
+    })
+    driver.execute_cdp_cmd('Emulation.setCPUThrottlingRate', {'rate': profile['cpu_slowdown']})
+    driver.execute_cdp_cmd('Emulation.setDeviceMetricsOverride', {
+        'width': profile['width'],
+        'height': profile['height'],
+        'deviceScaleFactor': 0,
+        'mobile': profile['mobile'],
+    })
+    if profile['mobile']:
+        driver.execute_cdp_cmd('Emulation.setTouchEmulationEnabled', {'enabled': True})
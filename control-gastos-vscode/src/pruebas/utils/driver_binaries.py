@@ -0,0 +1,149 @@
+"""
+Resolución de binarios de driver (chromedriver / geckodriver)
+
+Orden de resolución:
+1. Ruta explícita en config (CHROMEDRIVER_PATH / GECKODRIVER_PATH)
+2. Caché en memoria del proceso (se resuelve una vez por sesión)
+3. Archivo de caché local indexado por navegador + versión instalada
+4. webdriver-manager (requiere red solo la primera vez por versión)
+5. Driver disponible en el PATH
+
+Si nada funciona se devuelve None y Selenium Manager intenta resolverlo.
+"""
+import json
+import logging
+import os
+import shutil
+import tempfile
+from webdriver_manager.core.os_manager import OperationSystemManager, ChromeType
+from config.config import config
+
+logger = logging.getLogger(__name__)
+
+# Nombre del ejecutable de cada driver
+DRIVER_EXECUTABLES = {
+    'chrome': 'chromedriver',
+    'firefox': 'geckodriver',
+}
+
+# Caché en memoria: browser -> ruta resuelta
+_resolved = {}
+
+
+def resolve_driver_path(browser):
+    """
+    Obtener la ruta del driver para un navegador
+
+    Args:
+        browser: 'chrome' o 'firefox'
+
+    Returns:
+        Ruta al ejecutable del driver o None para delegar en Selenium Manager
+    """
+    browser = browser.lower()
+    if browser not in DRIVER_EXECUTABLES:
+        raise ValueError(f"Browser no soportado: {browser}")
+
+    if browser in _resolved:
+        return _resolved[browser]
+
+    path = _resolve(browser)
+    _resolved[browser] = path
+    return path
+
+
+def _resolve(browser):
+    """Resolver la ruta del driver sin usar la caché en memoria"""
+    explicit = _explicit_path(browser)
+    if explicit:
+        if os.path.isfile(explicit):
+            return explicit
+        logger.warning(f"La ruta configurada para {browser} no existe: {explicit}")
+
+    version = get_browser_version(browser)
+    cache = _load_cache()
+    key = f"{browser}:{version or 'unknown'}"
+
+    cached = cache.get(key)
+    if cached and os.path.isfile(cached):
+        return cached
+
+    if not config.DRIVER_OFFLINE:
+        try:
+            path = _install(browser)
+            cache[key] = path
+            _save_cache(cache)
+            return path
+        except Exception as e:
+            logger.warning(f"webdriver-manager no pudo descargar el driver de {browser}: {e}")
+
+    on_path = shutil.which(DRIVER_EXECUTABLES[browser])
+    if on_path:
+        return on_path
+
+    # Sin red ni versión conocida: usar cualquier driver cacheado del mismo navegador
+    for cached_key, cached_path in cache.items():
+        if cached_key.startswith(f"{browser}:") and os.path.isfile(cached_path):
+            logger.warning(f"Usando driver cacheado de otra versión: {cached_path}")
+            return cached_path
+
+    return None
+
+
+def get_browser_version(browser):
+    """
+    Detectar la versión instalada del navegador sin acceso a red
+
+    Returns:
+        Versión como string o None si no se puede detectar
+    """
+    browser_type = ChromeType.GOOGLE if browser == 'chrome' else 'firefox'
+    try:
+        version = OperationSystemManager().get_browser_version_from_os(browser_type)
+        if not version and browser == 'chrome':
+            version = OperationSystemManager().get_browser_version_from_os(ChromeType.CHROMIUM)
+        return version
+    except Exception:
+        return None
+
+
+def _explicit_path(browser):
+    """Ruta configurada explícitamente para el driver"""
+    if browser == 'chrome':
+        return config.CHROMEDRIVER_PATH
+    return config.GECKODRIVER_PATH
+
+
+def _install(browser):
+    """Descargar el driver con webdriver-manager"""
+    if browser == 'chrome':
+        from webdriver_manager.chrome import ChromeDriverManager
+        return ChromeDriverManager().install()
+
+    from webdriver_manager.firefox import GeckoDriverManager
+    return GeckoDriverManager().install()
+
+
+def _load_cache():
+    """Leer el archivo de caché (dict vacío si no existe o está corrupto)"""
+    try:
+        with open(config.DRIVER_CACHE_FILE, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_cache(cache):
+    """Escribir el archivo de caché de forma atómica (varios workers de xdist)"""
+    directory = os.path.dirname(config.DRIVER_CACHE_FILE)
+    os.makedirs(directory, exist_ok=True)
+
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(cache, f, indent=2)
+        os.replace(tmp_path, config.DRIVER_CACHE_FILE)
+    except OSError as e:
+        logger.warning(f"No se pudo guardar la caché de drivers: {e}")
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
@@ -6,8 +6,10 @@ from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.chrome.options import Options as ChromeOptions
 from selenium.webdriver.firefox.service import Service as FirefoxService
 from selenium.webdriver.firefox.options import Options as FirefoxOptions
-from webdriver_manager.chrome import ChromeDriverManager
-from webdriver_manager.firefox import GeckoDriverManager
+from utils.driver_binaries import resolve_driver_path
+from utils.waits import install_tracker
+from utils.browser_metrics import install_capture
+from utils.device_profiles import apply_profile, get_profile
 from config.config import config
 
 
@@ -15,27 +17,46 @@ class DriverFactory:
     """Factory para crear drivers de Selenium"""
 
     @staticmethod
-    def create_driver(browser=None, headless=None):
+    def create_driver(browser=None, headless=None, explicit_waits_only=None, profile=None):
         """
         Crear instancia de WebDriver
 
         Args:
             browser: 'chrome' o 'firefox' (default: desde config)
             headless: True/False (default: desde config)
+            explicit_waits_only: True desactiva la espera implícita (default: desde config)
+            profile: Perfil de red/CPU de utils.device_profiles, solo Chrome
+                (default: config.BROWSER_PROFILE; '' = sin limitar)
 
         Returns:
             WebDriver instance
         """
         browser = browser or config.BROWSER
         headless = headless if headless is not None else config.HEADLESS
+        explicit_waits_only = (explicit_waits_only if explicit_waits_only is not None
+                               else config.EXPLICIT_WAITS_ONLY)
+        profile = profile if profile is not None else config.BROWSER_PROFILE
+        if profile:
+            get_profile(profile)
+            if browser.lower() != 'chrome':
+                raise ValueError(f"El perfil '{profile}' requiere Chrome (usa CDP)")
 
         if browser.lower() == 'chrome':
-            return DriverFactory._create_chrome_driver(headless)
+            driver = DriverFactory._create_chrome_driver(headless)
         elif browser.lower() == 'firefox':
-            return DriverFactory._create_firefox_driver(headless)
+            driver = DriverFactory._create_firefox_driver(headless)
         else:
             raise ValueError(f"Browser no soportado: {browser}")
 
+        # Con espera implícita, cada find_element negativo bloquea el timeout completo
+        driver.implicitly_wait(0 if explicit_waits_only else config.IMPLICIT_WAIT)
+        driver.set_page_load_timeout(config.PAGE_LOAD_TIMEOUT)
+
+        # Red, CPU y pantalla del perfil (3G, CPU lenta...) antes de la primera página
+        apply_profile(driver, profile)
+
+        return driver
+
     @staticmethod
     def _create_chrome_driver(headless):
         """Crear driver de Chrome"""
@@ -51,11 +72,13 @@ class DriverFactory:
         options.add_argument('--disable-blink-features=AutomationControlled')
         options.add_experimental_option('excludeSwitches', ['enable-logging'])
 
-        service = ChromeService(ChromeDriverManager().install())
+        service = ChromeService(resolve_driver_path('chrome'))
         driver = webdriver.Chrome(service=service, options=options)
 
-        driver.implicitly_wait(config.IMPLICIT_WAIT)
-        driver.set_page_load_timeout(config.PAGE_LOAD_TIMEOUT)
+        # Contar peticiones pendientes desde el primer script de cada página
+        install_tracker(driver)
+        if config.BROWSER_METRICS:
+            install_capture(driver)
 
         return driver
 
@@ -70,10 +93,7 @@ class DriverFactory:
         options.add_argument('--width=1920')
         options.add_argument('--height=1080')
 
-        service = FirefoxService(GeckoDriverManager().install())
+        service = FirefoxService(resolve_driver_path('firefox'))
         driver = webdriver.Firefox(service=service, options=options)
 
-        driver.implicitly_wait(config.IMPLICIT_WAIT)
-        driver.set_page_load_timeout(config.PAGE_LOAD_TIMEOUT)
-
         return driver
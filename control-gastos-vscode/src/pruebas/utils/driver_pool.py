@@ -0,0 +1,146 @@
+"""
+Pool de instancias de WebDriver reutilizables entre tests
+
+Cada worker de pytest-xdist es un proceso independiente, por lo que cada
+uno mantiene su propio pool. Entre tests el navegador se limpia (cookies,
+localStorage, sessionStorage) y vuelve a config.BASE_URL.
+"""
+import logging
+from selenium.common.exceptions import WebDriverException
+from utils.driver_factory import DriverFactory
+from config.config import config
+
+logger = logging.getLogger(__name__)
+
+
+class DriverPool:
+    """Pool de drivers de Selenium con reinicio de estado entre tests"""
+
+    def __init__(self, size=None, max_failures=None):
+        """
+        Args:
+            size: Máximo de navegadores inactivos a conservar (default: desde config)
+            max_failures: Navegadores bloqueados tolerados antes de volver
+                al modo de un driver por test (default: desde config)
+        """
+        self.size = size if size is not None else config.DRIVER_POOL_SIZE
+        self.max_failures = max_failures if max_failures is not None else config.DRIVER_POOL_MAX_FAILURES
+        self.enabled = True
+        self.failures = 0
+        self._idle = []
+        self._in_use = set()
+
+    def acquire(self):
+        """
+        Obtener un driver limpio y posicionado en config.BASE_URL
+
+        Returns:
+            WebDriver instance
+        """
+        while self.enabled and self._idle:
+            driver = self._idle.pop()
+            if self._reset(driver):
+                self._in_use.add(driver)
+                return driver
+            self._discard(driver)
+
+        driver = DriverFactory.create_driver()
+        driver.get(config.BASE_URL)
+        self._in_use.add(driver)
+        return driver
+
+    def release(self, driver):
+        """
+        Devolver un driver al pool (o cerrarlo si el pool está lleno,
+        deshabilitado o el navegador no responde)
+        """
+        self._in_use.discard(driver)
+
+        if not self.enabled or len(self._idle) >= self.size:
+            self._quit(driver)
+            return
+
+        if not self.is_healthy(driver):
+            self._discard(driver)
+            return
+
+        self._idle.append(driver)
+
+    def close_all(self):
+        """Cerrar todos los navegadores del pool"""
+        for driver in self._idle + list(self._in_use):
+            self._quit(driver)
+        self._idle = []
+        self._in_use = set()
+
+    @staticmethod
+    def is_healthy(driver):
+        """
+        Verificar que el navegador responde a comandos
+
+        Args:
+            driver: WebDriver instance
+
+        Returns:
+            True si el navegador sigue utilizable
+        """
+        try:
+            # Cerrar alertas pendientes que bloquearían cualquier comando
+            try:
+                driver.switch_to.alert.dismiss()
+            except WebDriverException:
+                pass
+
+            # Dejar una única ventana abierta
+            handles = driver.window_handles
+            if not handles:
+                # Sin ventanas el navegador ya no sirve (se cerró la última)
+                return False
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+
+            return driver.execute_script('return 1') == 1
+        except WebDriverException:
+            return False
+
+    def _reset(self, driver):
+        """Limpiar el estado del navegador entre tests"""
+        try:
+            # localStorage es por origen: hay que estar en la app para limpiarlo
+            if not driver.current_url.startswith(config.BASE_URL):
+                driver.get(config.BASE_URL)
+
+            driver.delete_all_cookies()
+            driver.execute_script('window.localStorage.clear(); window.sessionStorage.clear();')
+
+            # Nueva navegación para que la app se monte sin sesión
+            driver.get(config.BASE_URL)
+            return True
+        except WebDriverException as e:
+            logger.warning(f"No se pudo reiniciar el navegador del pool: {e}")
+            return False
+
+    def _discard(self, driver):
+        """Descartar un navegador bloqueado"""
+        self.failures += 1
+        self._quit(driver)
+
+        if self.failures >= self.max_failures and self.enabled:
+            logger.warning(
+                f"{self.failures} navegadores bloqueados: "
+                "se vuelve al modo de un driver por test"
+            )
+            self.enabled = False
+            for idle in self._idle:
+                self._quit(idle)
+            self._idle = []
+
+    @staticmethod
+    def _quit(driver):
+        """Cerrar un driver ignorando errores de un navegador ya caído"""
+        try:
+            driver.quit()
+        except Exception:
+            pass
@@ -2,7 +2,7 @@
 Funciones auxiliares para las pruebas
 """
 import os
-import time
+import json
 from datetime import datetime
 from config.config import config
 
@@ -30,15 +30,38 @@ def take_screenshot(driver, name):
 def wait_for_page_load(driver, timeout=10):
     """
     Esperar a que la página cargue completamente
+    (documento cargado, sin peticiones pendientes y DOM estable)
 
     Args:
         driver: WebDriver instance
         timeout: Tiempo máximo de espera en segundos
     """
-    from selenium.webdriver.support.ui import WebDriverWait
+    from utils.waits import wait_for_page_ready
 
-    WebDriverWait(driver, timeout).until(
-        lambda d: d.execute_script('return document.readyState') == 'complete'
+    wait_for_page_ready(driver, timeout)
+
+
+def inject_auth_session(driver, token, user):
+    """
+    Iniciar sesión en el navegador sin usar el formulario de login
+
+    Guarda token y usuario en localStorage, que es lo que lee
+    AuthContext al montarse la aplicación.
+
+    Args:
+        driver: WebDriver instance
+        token: JWT obtenido de /api/auth/login
+        user: Dict con los datos del usuario
+    """
+    # localStorage es por origen: hay que estar en la app para escribirlo
+    if not driver.current_url.startswith(config.BASE_URL):
+        driver.get(config.BASE_URL)
+
+    driver.execute_script(
+        "window.localStorage.setItem('token', arguments[0]);"
+        "window.localStorage.setItem('user', arguments[1]);",
+        token,
+        json.dumps(user)
     )
 
 
@@ -48,9 +71,10 @@ def get_current_timestamp():
 
 
 def generate_unique_email():
-    """Generar email único para pruebas"""
-    timestamp = int(time.time())
-    return f"test_{timestamp}@example.com"
+    """Generar email único para pruebas (sin colisiones entre workers)"""
+    from utils.data_generators import unique_email
+
+    return unique_email('test')
 
 
 def format_currency(amount, currency='USD'):
@@ -75,13 +99,16 @@ def format_currency(amount, currency='USD'):
     return f"{symbol}{amount:.2f}"
 
 
-def clean_test_data(driver, email):
+def clean_test_data(driver, email, password=None, force=False):
     """
-    Limpiar datos de prueba (si es necesario)
+    Limpiar datos de prueba: elimina vía API los gastos y metas del usuario
 
     Args:
-        driver: WebDriver instance
+        driver: WebDriver instance (no se usa; se mantiene por compatibilidad)
         email: Email del usuario de prueba
+        password: Contraseña (default: config.TEST_USER_PASSWORD)
+        force: Vaciar también el usuario compartido de config/.env
     """
-    # Implementar lógica de limpieza si es necesario
-    pass
+    from utils.test_users import cleanup_user_data
+
+    cleanup_user_data(email, password or config.TEST_USER_PASSWORD, force=force)
@@ -0,0 +1,84 @@
+"""
+Usuarios de prueba aislados por worker de pytest-xdist
+
+Con 'pytest -n N' cada worker registra su propio usuario, de modo que
+los gastos que crea un worker no aparecen en las páginas que inspecciona otro.
+"""
+import logging
+from config.config import config
+from utils.data_generators import unique_email
+from utils.api_client import ApiClient
+from utils.data_seeding import DataSeeder
+
+logger = logging.getLogger(__name__)
+
+# Usuario compartido de config/.env, guardado antes de que el fixture
+# test_user lo sustituya por el del worker: lo usan también los desarrolladores
+SHARED_USER_EMAIL = config.TEST_USER_EMAIL
+
+
+def use_worker_users(worker_id):
+    """
+    Decidir si se debe crear un usuario por worker
+
+    Args:
+        worker_id: Id del worker de xdist ('gw0', 'gw1'...) o 'master'
+
+    Returns:
+        True si PER_WORKER_USERS=true, o si es 'auto' y hay workers de xdist
+    """
+    mode = config.PER_WORKER_USERS
+    if mode == 'auto':
+        return worker_id != 'master'
+    return mode == 'true'
+
+
+def provision_worker_user(worker_id):
+    """
+    Registrar un usuario exclusivo para el worker
+
+    Args:
+        worker_id: Id del worker de xdist
+
+    Returns:
+        Dict con 'email', 'password' y 'name'
+    """
+    email = unique_email(f"worker_{worker_id}")
+    user = {
+        'email': email,
+        'password': config.TEST_USER_PASSWORD,
+        'name': f"{config.TEST_USER_NAME} {worker_id}",
+    }
+
+    client = ApiClient()
+    if config.DATA_SEED:
+        client.register_or_login(user['email'], user['password'], user['name'])
+    else:
+        client.register(user['email'], user['password'], user['name'])
+    logger.info(f"Usuario de prueba del worker {worker_id}: {email}")
+    return user
+
+
+def cleanup_user_data(email, password, force=False):
+    """
+    Eliminar los gastos y metas de ahorro de un usuario de prueba
+
+    La API no expone un endpoint para borrar usuarios, así que la cuenta
+    queda creada pero vacía. El usuario compartido de config/.env no se
+    vacía salvo con force=True.
+
+    Args:
+        email: Email del usuario
+        password: Contraseña del usuario
+        force: Permitir vaciar también el usuario compartido
+    """
+    if email == SHARED_USER_EMAIL and not force:
+        logger.warning(f"No se limpian los datos de {email}: es el usuario compartido (usa force=True)")
+        return
+    try:
+        client = ApiClient()
+        client.login(email, password)
+
+        DataSeeder(client.token).delete_all()
+    except Exception as e:
+        logger.warning(f"No se pudieron limpiar los datos de {email}: {e}")
@@ -0,0 +1,256 @@
+"""
+Esperas basadas en eventos para las pruebas funcionales
+
+Reemplazan los time.sleep fijos: cada espera termina en cuanto la
+condición se cumple y solo agota el timeout si algo va mal.
+"""
+from contextlib import contextmanager
+from selenium.common.exceptions import WebDriverException, TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from config.config import config
+
+# Instrumentación de fetch y XMLHttpRequest (axios usa XHR) para contar
+# peticiones pendientes, y MutationObserver para registrar el último cambio del DOM
+TRACKER_JS = """
+(function () {
+    if (window.__waitsTracker) { return; }
+    window.__waitsTracker = true;
+    window.__pendingRequests = 0;
+    window.__lastNetworkActivity = Date.now();
+    window.__lastMutation = Date.now();
+
+    function start() {
+        window.__pendingRequests += 1;
+        window.__lastNetworkActivity = Date.now();
+    }
+    function done() {
+        window.__pendingRequests = Math.max(0, window.__pendingRequests - 1);
+        window.__lastNetworkActivity = Date.now();
+    }
+
+    if (window.fetch) {
+        var originalFetch = window.fetch;
+        window.fetch = function () {
+            start();
+            return originalFetch.apply(this, arguments).then(
+                function (response) { done(); return response; },
+                function (error) { done(); throw error; }
+            );
+        };
+    }
+
+    var originalSend = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function () {
+        start();
+        this.addEventListener('loadend', done);
+        return originalSend.apply(this, arguments);
+    };
+
+    function observe() {
+        new MutationObserver(function () {
+            window.__lastMutation = Date.now();
+        }).observe(document.documentElement, {
+            childList: true, subtree: true, attributes: true, characterData: true
+        });
+    }
+    if (document.documentElement) { observe(); }
+    else { document.addEventListener('DOMContentLoaded', observe); }
+})();
+"""
+
+
+def install_tracker(driver):
+    """
+    Registrar la instrumentación para que se ejecute en cada documento nuevo
+
+    En Chrome se usa CDP, con lo que también se cuentan las peticiones que
+    la app lanza al montarse. En otros navegadores se inyecta bajo demanda.
+
+    Args:
+        driver: WebDriver instance
+    """
+    if hasattr(driver, 'execute_cdp_cmd'):
+        driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {'source': TRACKER_JS})
+
+
+def _ensure_tracker(driver):
+    """Inyectar la instrumentación en el documento actual si falta"""
+    driver.execute_script(TRACKER_JS)
+
+
+def wait_for_network_idle(driver, timeout=None, idle_ms=None):
+    """
+    Esperar a que no haya peticiones fetch/XHR en curso durante idle_ms
+
+    Args:
+        driver: WebDriver instance
+        timeout: Tiempo máximo de espera en segundos (default: config.WAIT_TIMEOUT)
+        idle_ms: Milisegundos sin actividad de red (default: config.NETWORK_IDLE_MS)
+    """
+    timeout = timeout or config.WAIT_TIMEOUT
+    idle_ms = idle_ms if idle_ms is not None else config.NETWORK_IDLE_MS
+    _ensure_tracker(driver)
+
+    WebDriverWait(driver, timeout, poll_frequency=0.05).until(
+        lambda d: d.execute_script(
+            "return window.__pendingRequests === 0 && "
+            "Date.now() - window.__lastNetworkActivity >= arguments[0];",
+            idle_ms
+        )
+    )
+
+
+def wait_for_dom_settled(driver, timeout=None, quiet_ms=None):
+    """
+    Esperar a que el DOM deje de cambiar durante quiet_ms
+
+    Args:
+        driver: WebDriver instance
+        timeout: Tiempo máximo de espera en segundos (default: config.WAIT_TIMEOUT)
+        quiet_ms: Milisegundos sin mutaciones (default: config.DOM_QUIET_MS)
+    """
+    timeout = timeout or config.WAIT_TIMEOUT
+    quiet_ms = quiet_ms if quiet_ms is not None else config.DOM_QUIET_MS
+    _ensure_tracker(driver)
+
+    WebDriverWait(driver, timeout, poll_frequency=0.05).until(
+        lambda d: d.execute_script(
+            "return Date.now() - window.__lastMutation >= arguments[0];",
+            quiet_ms
+        )
+    )
+
+
+def wait_for_page_ready(driver, timeout=None):
+    """
+    Esperar a que la página cargue, termine sus peticiones y se estabilice
+
+    Args:
+        driver: WebDriver instance
+        timeout: Tiempo máximo de espera en segundos (default: config.WAIT_TIMEOUT)
+    """
+    timeout = timeout or config.WAIT_TIMEOUT
+
+    WebDriverWait(driver, timeout, poll_frequency=0.05).until(
+        lambda d: d.execute_script('return document.readyState') == 'complete'
+    )
+    wait_for_network_idle(driver, timeout)
+    wait_for_dom_settled(driver, timeout)
+
+
+def wait_for_text(driver, locator, text, timeout=None):
+    """
+    Esperar a que el texto de un elemento contenga 'text'
+
+    Args:
+        driver: WebDriver instance
+        locator: Tupla (By, selector) del elemento contenedor
+        text: Texto esperado
+        timeout: Tiempo máximo de espera en segundos (default: config.WAIT_TIMEOUT)
+    """
+    timeout = timeout or config.WAIT_TIMEOUT
+    WebDriverWait(driver, timeout, poll_frequency=0.05).until(
+        EC.text_to_be_present_in_element(locator, text)
+    )
+
+
+def wait_for_page_text(driver, text, timeout=None):
+    """Esperar a que 'text' aparezca en cualquier parte de la página"""
+    wait_for_text(driver, (By.TAG_NAME, 'body'), text, timeout)
+
+
+def wait_for_alert(driver, timeout=None):
+    """
+    Esperar a que aparezca un diálogo del navegador (confirm/alert)
+
+    Returns:
+        Alert o None si no aparece ninguno
+    """
+    timeout = timeout or config.WAIT_TIMEOUT
+    try:
+        return WebDriverWait(driver, timeout, poll_frequency=0.05).until(EC.alert_is_present())
+    except WebDriverException:
+        return None
+
+
+def wait_for_element_count_change(driver, locator, initial_count, timeout=None):
+    """
+    Esperar a que cambie el número de elementos que coinciden con el locator
+
+    Returns:
+        Nuevo número de elementos
+    """
+    timeout = timeout or config.WAIT_TIMEOUT
+    with no_implicit_wait(driver):
+        WebDriverWait(driver, timeout, poll_frequency=0.05).until(
+            lambda d: len(d.find_elements(*locator)) != initial_count
+        )
+        return len(driver.find_elements(*locator))
+
+
+@contextmanager
+def no_implicit_wait(driver):
+    """
+    Desactivar temporalmente la espera implícita del driver
+
+    Sin esto, un find_elements que no encuentra nada bloquea el
+    timeout implícito completo antes de devolver una lista vacía.
+    """
+    previous = driver.timeouts.implicit_wait
+    if previous:
+        driver.implicitly_wait(0)
+    try:
+        yield driver
+    finally:
+        if previous:
+            driver.implicitly_wait(previous)
+
+
+def assert_present(driver, locator, within_ms=None):
+    """
+    Verificar que un elemento visible aparece en como máximo within_ms
+
+    Args:
+        driver: WebDriver instance
+        locator: Tupla (By, selector)
+        within_ms: Milisegundos máximos (default: config.ASSERT_PRESENT_MS)
+
+    Returns:
+        WebElement encontrado
+    """
+    within_ms = within_ms if within_ms is not None else config.ASSERT_PRESENT_MS
+
+    with no_implicit_wait(driver):
+        try:
+            return WebDriverWait(driver, within_ms / 1000, poll_frequency=0.05).until(
+                EC.visibility_of_element_located(locator)
+            )
+        except TimeoutException:
+            raise AssertionError(f"El elemento {locator} no apareció en {within_ms} ms")
+
+
+def assert_absent(driver, locator, within_ms=None):
+    """
+    Verificar que un elemento no está visible (o desaparece en within_ms)
+
+    Args:
+        driver: WebDriver instance
+        locator: Tupla (By, selector)
+        within_ms: Milisegundos máximos (default: config.ASSERT_ABSENT_MS)
+    """
+    within_ms = within_ms if within_ms is not None else config.ASSERT_ABSENT_MS
+
+    def _absent(d):
+        try:
+            return not any(e.is_displayed() for e in d.find_elements(*locator))
+        except WebDriverException:
+            # El elemento se eliminó del DOM mientras se comprobaba
+            return False
+
+    with no_implicit_wait(driver):
+        try:
+            WebDriverWait(driver, within_ms / 1000, poll_frequency=0.05).until(_absent)
+        except TimeoutException:
+            raise AssertionError(f"El elemento {locator} sigue visible tras {within_ms} ms")